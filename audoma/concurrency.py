@@ -0,0 +1,209 @@
+"""
+This module is responsible for running independent backend calls concurrently
+inside of `async def` actions.
+
+Calls are started at once and awaited together, each of them may have its own timeout.
+Timeouts and cancellations are raised as API exceptions, so those may be
+allowed in the `errors` of the `audoma_action`.
+"""
+
+import asyncio
+import copy
+import logging
+from functools import partial
+from inspect import (
+    isawaitable,
+    isclass,
+    iscoroutinefunction,
+)
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Mapping,
+    Type,
+    Union,
+)
+
+from rest_framework import exceptions
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models import QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+FanOutCall = Union[Awaitable[Any], Callable[[], Any], QuerySet]
+FanOutError = Union[Exception, Type[Exception]]
+
+
+class FanOutTimeout(exceptions.APIException):
+    status_code = 504
+    default_detail = "Backend call has timed out."
+    default_code = "backend_timeout"
+
+
+class FanOutCancelled(exceptions.APIException):
+    status_code = 503
+    default_detail = "Backend call has been cancelled."
+    default_code = "backend_cancelled"
+
+
+def get_sync_to_async() -> Callable:
+    """
+    Returns asgiref's `sync_to_async`.
+    It's imported lazily, because Django older than 3.1 can't serve async views
+    and Django 2.2 does not depend on asgiref at all.
+    """
+    if django.VERSION < (3, 1):
+        raise ImproperlyConfigured(
+            "Async actions require Django 3.1 or newer, "
+            f"installed version is {django.get_version()}."
+        )
+    from asgiref.sync import sync_to_async
+
+    return sync_to_async
+
+
+def get_fan_out_error(error: FanOutError) -> Exception:
+    """
+    Returns exception to be raised for the given error config.
+    Exception instances are copied, so the instance listed in the action errors
+    is never raised itself and its fingerprint stays the same.
+    """
+    if isclass(error):
+        return error()
+    return copy.copy(error)
+
+
+def _run_sync_call(call: Callable[[], Any]) -> Any:
+    try:
+        return call()
+    finally:
+        # connections are opened per thread, so those have to be closed by the worker
+        connections.close_all()
+
+
+def _get_awaitable(call: FanOutCall, thread_sensitive: bool) -> Awaitable[Any]:
+    if isawaitable(call):
+        return call
+    if isinstance(call, QuerySet):
+        call = partial(list, call)
+    if iscoroutinefunction(call):
+        return call()
+    sync_to_async = get_sync_to_async()
+    if thread_sensitive:
+        return sync_to_async(call)()
+    return sync_to_async(_run_sync_call, thread_sensitive=False)(call)
+
+
+class _CallTimeoutError(Exception):
+    """
+    Carries timeout raised by the call itself through `wait_for`,
+    so it's not mistaken for the fan out timeout of the call.
+    """
+
+    def __init__(self, error: Exception):
+        super().__init__(error)
+        self.error = error
+
+
+async def _await_call(awaitable: Awaitable[Any]) -> Any:
+    try:
+        return await awaitable
+    except asyncio.TimeoutError as error:
+        raise _CallTimeoutError(error)
+
+
+async def _run_call(
+    name: str,
+    call: FanOutCall,
+    timeout: float,
+    timeout_error: FanOutError,
+    thread_sensitive: bool,
+) -> Any:
+    awaitable = _get_awaitable(call, thread_sensitive)
+    if timeout is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(_await_call(awaitable), timeout)
+    except _CallTimeoutError as wrapper:
+        raise wrapper.error
+    except asyncio.TimeoutError as error:
+        logger.warning("Fan out call %s has timed out.", name)
+        raise get_fan_out_error(timeout_error) from error
+
+
+async def fan_out(
+    calls: Mapping[str, FanOutCall],
+    timeout: float = None,
+    timeouts: Mapping[str, float] = None,
+    timeout_error: FanOutError = FanOutTimeout,
+    thread_sensitive: bool = False,
+) -> Dict[str, Any]:
+    """
+    Runs independent calls concurrently and returns their results by the call name,
+    so those may be returned straight to the result serializer.
+    If any of the calls fails, remaining calls are cancelled and its error is raised.
+
+    Args:
+        calls - mapping of the call name to the call, which may be an awaitable,
+            a coroutine function, a sync callable or a queryset.
+            Sync callables and querysets are run in a thread.
+        timeout - default timeout of a single call in seconds
+        timeouts - timeouts of the concrete calls, mapped by the call name
+        timeout_error - exception class or instance raised if a call times out,
+            it should be one of the errors allowed in the action
+        thread_sensitive - if sync calls should run in the main thread one by one,
+            by default each of them runs in its own thread with its own database connection
+
+    Returns:
+        dict of the call results mapped by the call name.
+    """
+    timeouts = timeouts or {}
+    tasks = {
+        name: asyncio.ensure_future(
+            _run_call(
+                name,
+                call,
+                timeouts.get(name, timeout),
+                timeout_error,
+                thread_sensitive,
+            )
+        )
+        for name, call in calls.items()
+    }
+    if not tasks:
+        return {}
+
+    try:
+        done, pending = await asyncio.wait(
+            tasks.values(), return_when=asyncio.FIRST_EXCEPTION
+        )
+    except asyncio.CancelledError:
+        # whole fan out has been cancelled, so are the calls
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    failed = [
+        task
+        for task in tasks.values()
+        if task in done and not task.cancelled() and task.exception() is not None
+    ]
+    if failed:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        raise failed[0].exception()
+
+    for name, task in tasks.items():
+        if task.cancelled():
+            logger.warning("Fan out call %s has been cancelled.", name)
+            raise FanOutCancelled()
+
+    return {name: task.result() for name, task in tasks.items()}
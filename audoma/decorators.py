@@ -1,17 +1,30 @@
 import logging
-from copy import deepcopy
 from dataclasses import dataclass
-from functools import wraps
-from inspect import isclass
+from functools import (
+    cached_property,
+    wraps,
+)
+from inspect import (
+    isclass,
+    iscoroutinefunction,
+)
+from types import MappingProxyType
 from typing import (
+    Any,
     Callable,
     Dict,
+    FrozenSet,
+    Hashable,
     Iterable,
     List,
+    Mapping,
+    Optional,
+    Tuple,
     Type,
     Union,
 )
 
+from rest_framework import exceptions
 from rest_framework.decorators import action
 from rest_framework.exceptions import APIException
 from rest_framework.permissions import SAFE_METHODS
@@ -21,10 +34,15 @@ from rest_framework.serializers import BaseSerializer
 from rest_framework.views import APIView
 
 from django.conf import settings as project_settings
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import (
+    ImproperlyConfigured,
+    PermissionDenied as DjangoPermissionDenied,
+)
 from django.db.models import Model
+from django.http import Http404
 
 from audoma import settings as audoma_settings
+from audoma.concurrency import get_sync_to_async
 
 
 logger = logging.getLogger(__name__)
@@ -46,6 +64,156 @@ class AudomaArgs:
     results_many: bool
     collectors_many: bool
 
+    @cached_property
+    def plan(self) -> "AudomaActionPlan":
+        """
+        Compiled, request independent representation of this config.
+        It is built on first access and reused for every following request.
+        """
+        return AudomaActionPlan.compile(self)
+
+
+@dataclass(frozen=True)
+class AudomaActionPlan:
+    """
+    Immutable dispatch plan of the audoma_action.
+    Holds everything that does not depend on the request, so the per request
+    path is reduced to a couple of dictionary lookups.
+
+    Args:
+        collectors - mapping of lowercase http method to collect serializer class
+        results - mapping of (http method, status code) to result operation,
+            status code is `None` if operation is common for all status codes
+        errors - all errors allowed to be raised in decorated method,
+            including COMMON_API_ERRORS
+        error_classes - exception classes allowed to be raised with any content
+        error_fingerprints - (exception class, fingerprint) pairs of allowed exception instances
+    """
+
+    collectors: Mapping[str, Optional[Type[BaseSerializer]]]
+    results: Mapping[Tuple[str, Optional[int]], Union[str, Type[BaseSerializer], None]]
+    errors: Tuple[Union[Exception, Type[Exception]], ...]
+    error_classes: FrozenSet[Type[Exception]]
+    error_fingerprints: FrozenSet[Tuple[Type[Exception], Hashable]]
+
+    @classmethod
+    def _freeze(cls, value: Any) -> Hashable:
+        if isinstance(value, dict):
+            return frozenset((key, cls._freeze(item)) for key, item in value.items())
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._freeze(item) for item in value)
+        if isinstance(value, str):
+            # ErrorDetail hashes as str, its code is a part of the fingerprint anyway
+            return str(value)
+        return value
+
+    @classmethod
+    def get_error_fingerprint(cls, error: Exception) -> Hashable:
+        """
+        Builds a hashable representation of the response which would be
+        produced for the given exception by the default exception handler.
+        This allows to match exceptions without building Response objects.
+
+        Args:
+            error - exception instance
+
+        Returns: (status_code, detail, code) tuple for API exceptions, exception args otherwise.
+        """
+        # Django's exceptions are handled as their rest_framework equivalents
+        if isinstance(error, Http404):
+            error = exceptions.NotFound()
+        elif isinstance(error, DjangoPermissionDenied):
+            error = exceptions.PermissionDenied()
+
+        if isinstance(error, APIException):
+            return (
+                error.status_code,
+                cls._freeze(error.detail),
+                cls._freeze(error.get_codes()),
+            )
+        return cls._freeze(error.args)
+
+    @staticmethod
+    def _compile_collectors(
+        collectors: SerializersConfig,
+    ) -> Dict[str, Optional[Type[BaseSerializer]]]:
+        if not isinstance(collectors, dict):
+            return {method: collectors for method in APIView.http_method_names}
+        return {method: collectors.get(method) for method in APIView.http_method_names}
+
+    @staticmethod
+    def _compile_results(
+        results: SerializersConfig,
+    ) -> Dict[Tuple[str, Optional[int]], Union[str, Type[BaseSerializer], None]]:
+        compiled = {}
+        if not isinstance(results, dict) or not results:
+            for method in APIView.http_method_names:
+                compiled[(method, None)] = results
+            return compiled
+
+        # the key type of the first item determines config form, same as in OperationExtractor
+        if isinstance(list(results.keys())[0], str):
+            for method in APIView.http_method_names:
+                response = results.get(method)
+                if isinstance(response, dict):
+                    for code, operation in response.items():
+                        compiled[(method, code)] = operation
+                else:
+                    compiled[(method, None)] = response
+        else:
+            for method in APIView.http_method_names:
+                for code, operation in results.items():
+                    compiled[(method, code)] = operation
+        return compiled
+
+    @classmethod
+    def compile(cls, audoma_args: AudomaArgs) -> "AudomaActionPlan":
+        errors = tuple(audoma_args.errors) + tuple(
+            audoma_settings.COMMON_API_ERRORS
+            + getattr(project_settings, "COMMON_API_ERRORS", [])
+        )
+        error_classes = frozenset(error for error in errors if isclass(error))
+        error_fingerprints = frozenset(
+            (type(error), cls.get_error_fingerprint(error))
+            for error in errors
+            if not isclass(error)
+        )
+        return cls(
+            collectors=MappingProxyType(
+                cls._compile_collectors(audoma_args.collectors)
+            ),
+            results=MappingProxyType(cls._compile_results(audoma_args.results)),
+            errors=errors,
+            error_classes=error_classes,
+            error_fingerprints=error_fingerprints,
+        )
+
+    def is_error_allowed(self, error: Exception) -> bool:
+        """
+        Checks if raised error has been defined in the allowed errors.
+        Exception classes allow any exception of exactly the same type,
+        exception instances allow exceptions of the same type and content.
+        """
+        error_class = type(error)
+        if error_class in self.error_classes:
+            return True
+        return (
+            error_class,
+            self.get_error_fingerprint(error),
+        ) in self.error_fingerprints
+
+    def get_collect_operation(self, method: str) -> Optional[Type[BaseSerializer]]:
+        return self.collectors.get(method.lower())
+
+    def get_result_operation(
+        self, method: str, code: int
+    ) -> Union[str, Type[BaseSerializer], None]:
+        method = method.lower()
+        try:
+            return self.results[(method, code)]
+        except KeyError:
+            return self.results.get((method, None))
+
 
 class AudomaActionException(Exception):
     pass
@@ -162,56 +330,12 @@ class audoma_action:
                 raise e
             logger.exception("audoma_action has been improperly configured.")
 
-    def _get_error_class(
-        self, error: Union[Exception, Type[Exception]]
-    ) -> Type[Exception]:
-        """
-        This is an internal helper method.
-        Beacuse we accept errors as instances and classes
-        it helps to determine which one is passed.
-
-        Args:
-            * error - error object or a class
-
-        Returns: class of passed exception
-        """
-        if isclass(error):
-            return error
-        else:
-            return type(error)
-
-    def _get_type_matched_exceptions(
-        self,
-        errors: List[Union[Exception, Type[Exception]]],
-        processed_error_class: Type[Exception],
-    ) -> List[Union[Exception, Type[Exception]]]:
-        """
-        This helper function extracts all errors which are
-        of the same type as the processed error.
-        It simply returns a list of those errors.
-        Args:
-            errors - list of errors, allowed to be raised in decorated view
-            processed_error_class - an exception which has been raised in decorated view
-
-        Returns a List of exceptions and exception classes, with matching exception type.
-        """
-        type_matched_exceptions = []
-        for error in errors:
-            error_class = self._get_error_class(error)
-
-            if not processed_error_class == error_class:
-                continue
-
-            type_matched_exceptions.append(error)
-
-        return type_matched_exceptions
-
     def _process_error(
         self,
-        raised_error: Union[Exception, Type[Exception]],
-        errors: List[Union[Exception, Type[Exception]]],
+        raised_error: Exception,
+        plan: AudomaActionPlan,
         view: APIView,
-    ) -> None:
+    ) -> Response:
         """
         This function processes the raised error.
         It checks if such error should be raised.
@@ -219,40 +343,20 @@ class audoma_action:
         There will be additioanla exception raised or logged, depends on the DEBUG setting.
 
         Args:
-            processed_error - the error which has been raised
-            errors - list of errors which may be raised in decorated method
+            raised_error - the error which has been raised
+            plan - compiled action plan, which holds errors allowed in decorated method
             view - APIView object
 
         Returns:
-            processed_error instance if such error has been defined.
+            response for the raised error.
         """
-        raised_error_class = self._get_error_class(raised_error)
-        error_match = False
-
-        # get all errors with same class as raised exception
         raised_error_response = view.handle_exception(raised_error)
         # In case defined exception handling is not able to handle raised exception,
         # than we simply raise this exception
         if raised_error_response is None:
             view.raise_uncaught_exception(raised_error)
 
-        type_matched_exceptions = self._get_type_matched_exceptions(
-            errors, raised_error_class
-        )
-        for error in type_matched_exceptions:
-            if isclass(error):
-                error_match = True
-                break
-
-            elif all(
-                getattr(raised_error_response, attr, None)
-                == getattr(view.handle_exception(error), attr, None)
-                for attr in ["status_code", "data", "headers"]
-            ):
-                error_match = True
-                break
-
-        if not error_match:
+        if not plan.is_error_allowed(raised_error):
             if project_settings.DEBUG:
                 raise AudomaActionException(
                     f"Raised error: {raised_error} has not been \
@@ -356,47 +460,94 @@ class audoma_action:
         # apply action decorator
         func = self.framework_decorator(func)
 
+        if iscoroutinefunction(func):
+            return self._wrap_async(func)
+
         @wraps(func)
         def wrapper(view: APIView, request: Request, *args, **kwargs) -> Response:
-            # extend errors too allow default errors occurance
-            errors = deepcopy(func._audoma.errors)
-            errors += audoma_settings.COMMON_API_ERRORS + getattr(
-                project_settings, "COMMON_API_ERRORS", []
-            )
+            # errors are already extended with default errors in the compiled plan
+            plan = func._audoma.plan
             try:
-                collect_serializer = self._get_collect_serializer_instance(
-                    request, func, view
-                )
-                if collect_serializer:
-                    collect_serializer.is_valid(raise_exception=True)
-                    kwargs["collect_serializer"] = collect_serializer
-
+                self._run_collectors(request, func, view, kwargs)
                 instance, code = func(view, request, *args, **kwargs)
                 # TODO - add verification
 
             except Exception as processed_error:
-                return self._process_error(processed_error, errors, view)
+                return self._process_error(processed_error, plan, view)
 
-            response_serializer = view.get_result_serializer(
-                instance=instance,
-                context={
-                    "request": request,
-                    "format": view.format_kwarg,
-                    "view": view,
-                },
-                many=self.results_many,
-                status_code=code,
-            )
+            return self._build_response(request, view, instance, code)
 
-            if hasattr(view, "_retrieve_response_headers"):
-                headers = view._retrieve_response_headers(code, response_serializer)
-            else:
-                headers = {}
+        return wrapper
+
+    def _wrap_async(self, func: Callable) -> Callable:
+        """
+        Wraps `async def` action.
+        Collectors validation, error processing and result serialization may query the database,
+        so those are run in a thread, while the action itself is awaited.
+
+        Args:
+            func - decorated coroutine function
+
+        Returns:
+            async wrapper callable.
+        """
+
+        sync_to_async = get_sync_to_async()
+
+        @wraps(func)
+        async def wrapper(view: APIView, request: Request, *args, **kwargs) -> Response:
+            # errors are already extended with default errors in the compiled plan
+            plan = func._audoma.plan
+            try:
+                await sync_to_async(self._run_collectors)(request, func, view, kwargs)
+                instance, code = await func(view, request, *args, **kwargs)
 
-            return Response(
-                response_serializer.data,
-                status=code,
-                headers=headers,
+            except Exception as processed_error:
+                return await sync_to_async(self._process_error)(
+                    processed_error, plan, view
+                )
+
+            return await sync_to_async(self._build_response)(
+                request, view, instance, code
             )
 
         return wrapper
+
+    def _run_collectors(
+        self, request: Request, func: Callable, view: APIView, kwargs: dict
+    ) -> None:
+        """
+        Validates collected data and passes collect serializer to the action kwargs.
+        """
+        collect_serializer = self._get_collect_serializer_instance(request, func, view)
+        if collect_serializer:
+            collect_serializer.is_valid(raise_exception=True)
+            kwargs["collect_serializer"] = collect_serializer
+
+    def _build_response(
+        self, request: Request, view: APIView, instance: Any, code: int
+    ) -> Response:
+        """
+        Serializes the action result with the result serializer.
+        """
+        response_serializer = view.get_result_serializer(
+            instance=instance,
+            context={
+                "request": request,
+                "format": view.format_kwarg,
+                "view": view,
+            },
+            many=self.results_many,
+            status_code=code,
+        )
+
+        if hasattr(view, "_retrieve_response_headers"):
+            headers = view._retrieve_response_headers(code, response_serializer)
+        else:
+            headers = {}
+
+        return Response(
+            response_serializer.data,
+            status=code,
+            headers=headers,
+        )
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from functools import wraps
 from typing import (
     Any,
@@ -8,19 +9,43 @@ from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 
+def _get_formatter(
+    parent: serializers.Serializer, key: Callable, serializer_or_field: Any
+) -> serializers.Field:
+    """
+    Returns formatter field bound to the parent serializer.
+    Formatters are created once per parent serializer instance and reused for each row.
+
+    Args:
+        * parent - serializer instance which method is decorated
+        * key - decorated function, identifies formatter in the parent
+        * serializer_or_field - field/serializer instance or class used for formatting
+
+    Returns: formatter field instance
+    """
+    formatters = parent.__dict__.setdefault("_document_and_format_fields", {})
+    formatter = formatters.get(key)
+    if formatter is None:
+        formatter = (
+            deepcopy(serializer_or_field)
+            if isinstance(serializer_or_field, serializers.Field)
+            else serializer_or_field()
+        )
+        formatter.parent = parent
+        formatters[key] = formatter
+    return formatter
+
+
 def document_and_format(serializer_or_field: Any) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         @extend_schema_field(serializer_or_field)
         def wrapper(*args, **kwargs) -> Any:
             value = func(*args, **kwargs)
-            f = (
-                serializer_or_field
-                if isinstance(serializer_or_field, serializers.Field)
-                else serializer_or_field()
-            )
-            f.parent = args[0]
-            return f.to_representation(value) if value is not None else None
+            if value is None:
+                return None
+            f = _get_formatter(args[0], func, serializer_or_field)
+            return f.to_representation(value)
 
         return wrapper
 
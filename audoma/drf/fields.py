@@ -5,10 +5,14 @@ and also has defined schema type.
 """
 
 import sys
-from typing import Any
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    List,
+)
 
 import exrex
-import phonenumbers
 from djmoney.contrib.django_rest_framework import MoneyField
 from drf_extra_fields import fields as extra_fields
 from drf_extra_fields.fields import *  # noqa: F403, F401
@@ -16,7 +20,6 @@ from drf_spectacular.drainage import set_override
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from phonenumber_field import serializerfields
-from phonenumber_field.phonenumber import to_python
 from psycopg2._range import (
     DateRange,
     DateTimeTZRange,
@@ -27,13 +30,15 @@ from rest_framework.fields import *  # noqa: F403, F401
 
 from django.core import validators
 
-from audoma.example_generators import generate_lorem_ipsum
+from audoma.examples import DEFAULT
 from audoma.mixins import (
     Base64ExampleMixin,
     DateExampleMixin,
     DateTimeExampleMixin,
     ExampleMixin,
+    LoremIpsumExampleMixin,
     NumericExampleMixin,
+    PhoneNumberExampleMixin,
     RangeExampleMixin,
     RegexExampleMixin,
     TimeExampleMixin,
@@ -128,23 +133,19 @@ class IPAddressField(ExampleMixin, fields.IPAddressField):
 
 
 @extend_schema_field(field={"format": "tel"})
-class PhoneNumberField(ExampleMixin, serializerfields.PhoneNumberField):
+class PhoneNumberField(PhoneNumberExampleMixin, serializerfields.PhoneNumberField):
     def __init__(self, *args, **kwargs) -> None:
         example = kwargs.pop("example", None)
         if example is None:
-            number = phonenumbers.example_number(None)
-            example = str(to_python(number))
+            example = DEFAULT
         super().__init__(*args, example=example, **kwargs)
 
 
-class CharField(ExampleMixin, fields.CharField):
+class CharField(LoremIpsumExampleMixin, fields.CharField):
     def __init__(self, *args, **kwargs) -> None:
         example = kwargs.pop("example", None)
-        min_length = kwargs.get("min_length", 20)
-        max_length = kwargs.get("max_length", 80)
         if not example:
-            example = generate_lorem_ipsum(min_length=min_length, max_length=max_length)
-
+            example = DEFAULT
         super().__init__(*args, example=example, **kwargs)
 
 
@@ -159,6 +160,24 @@ class ChoiceField(ExampleMixin, fields.ChoiceField):
 
 
 class SerializerMethodField(ExampleMixin, fields.Field):
+    """
+    Read only field which gets its value by calling a method on the parent serializer.
+    If `field` is passed, the value is represented with it and validation
+    methods are delegated to it, this also allows the field to be writable.
+
+    With `cache=True` method results are memoized on the root serializer,
+    keyed by method name and object identity, so fields sharing the same method
+    call it once per object during the serializer rendering.
+    Memo is kept only while audoma's root serializer is rendered,
+    under other root serializers the method is called by each field.
+    """
+
+    _field_delegated_methods = (
+        "get_validators",
+        "run_validators",
+        "validate_empty_values",
+    )
+
     def _parse_field(self, field):
         if field is not None and not isinstance(field, fields.Field):
             raise ValueError(
@@ -169,9 +188,10 @@ class SerializerMethodField(ExampleMixin, fields.Field):
         return field
 
     def __init__(
-        self, *args, method_name=None, field=None, writable=False, **kwargs
+        self, *args, method_name=None, field=None, writable=False, cache=False, **kwargs
     ) -> None:
         self.method_name = method_name
+        self.cache = cache
         self.field = self._parse_field(field)
         writable = writable
         if writable and self.field is None:
@@ -180,21 +200,20 @@ class SerializerMethodField(ExampleMixin, fields.Field):
         kwargs["source"] = "*"
         kwargs["read_only"] = not writable
         super().__init__(*args, **kwargs)
+        if self.field is not None:
+            # delegation is decided once, instance attributes shadow the methods
+            for name in self._field_delegated_methods:
+                setattr(self, name, getattr(self.field, name))
 
-    def __getattribute__(self, name: str) -> Any:
-        if (
-            name
-            not in [
-                "validators",
-                "get_validators",
-                "run_validators",
-                "validate_empty_values",
-            ]
-            or not self.field
-        ):
-            return super().__getattribute__(name)
-
-        return getattr(self.field, name)
+    @property
+    def validators(self) -> List[Callable]:
+        if self.field is None:
+            return fields.Field.validators.fget(self)
+        return self.field.validators
+
+    @validators.setter
+    def validators(self, validators: List[Callable]) -> None:
+        fields.Field.validators.fset(self, validators)
 
     def bind(self, field_name, parent):
         # The method name defaults to `get_{field_name}`.
@@ -207,9 +226,24 @@ class SerializerMethodField(ExampleMixin, fields.Field):
             self.field.parent = self.parent
             self.field.field_name = self.field_name
 
-    def to_representation(self, obj):
+    def get_method_value(self, obj: Any) -> Any:
         method = getattr(self.parent, self.method_name)
-        value = method(obj)
+        if not self.cache:
+            return method(obj)
+
+        # memo exists only during rendering of audoma's root serializer
+        memo = self.root.__dict__.get("_method_field_memo")
+        if memo is None:
+            return method(obj)
+        key = (type(self.parent), self.method_name, id(obj))
+        entry = memo.get(key)
+        # object is stored along with the value, so its id can't be reused
+        if entry is None or entry[0] is not obj:
+            entry = memo[key] = (obj, method(obj))
+        return entry[1]
+
+    def to_representation(self, obj):
+        value = self.get_method_value(obj)
         if not self.field or value is None:
             return value
         else:
@@ -225,6 +259,40 @@ class SerializerMethodField(ExampleMixin, fields.Field):
         return {self.field_name: self.field.run_validation(data)}
 
 
+class BatchSerializerMethodField(SerializerMethodField):
+    """
+    SerializerMethodField which method is called with a list of objects instead of a single one.
+    When rendered by audoma's `ListSerializer`, the method is called once for the whole list,
+    otherwise it is called with a single object list.
+
+    The method should return a mapping of object primary keys to values
+    or a sequence of values ordered as the passed objects.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._batch_values = {}
+
+    def load_batch(self, objs: List[Any]) -> None:
+        method = getattr(self.parent, self.method_name)
+        values = method(objs)
+        if isinstance(values, Mapping):
+            values = [values.get(getattr(obj, "pk", None)) for obj in objs]
+        elif len(values) != len(objs):
+            raise ValueError(
+                f"{self.method_name} returned {len(values)} values for {len(objs)} objects."
+            )
+        # objects are stored along with the values, so their ids can't be reused
+        self._batch_values = {id(obj): (obj, value) for obj, value in zip(objs, values)}
+
+    def get_method_value(self, obj: Any) -> Any:
+        entry = self._batch_values.get(id(obj))
+        if entry is None or entry[0] is not obj:
+            self.load_batch([obj])
+            entry = self._batch_values[id(obj)]
+        return entry[1]
+
+
 class Base64ImageField(Base64ExampleMixin, extra_fields.Base64ImageField):
     ...
 
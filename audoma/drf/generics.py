@@ -23,8 +23,28 @@ class GenericAPIView(generics.GenericAPIView):
     Extended GenericAPIView known from rest_framework.
     This class extends `get_serializer` and `get_serializer_class` methods.
     Also provides `get_result_serializer`, which is a shourtcut for `get_serializer` with proper param.
+
+    Resolved serializer classes are cached per view class.
+    Set `cache_serializer_class_resolution` to False for views which pick serializer classes dynamically.
     """
 
+    cache_serializer_class_resolution = True
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # serializer classes passed as initkwargs are instance specific, those can't be shared
+        if any(key.endswith("serializer_class") for key in kwargs):
+            self.cache_serializer_class_resolution = False
+
+    @classmethod
+    def _get_serializer_class_cache(cls) -> dict:
+        # cache is stored in the class __dict__, so subclasses never share it
+        cache = cls.__dict__.get("_serializer_class_cache")
+        if cache is None:
+            cache = {}
+            cls._serializer_class_cache = cache
+        return cache
+
     def get_serializer(self, *args, **kwargs) -> BaseSerializer:
         """
         Passes additional param to `get_serializer_class`.
@@ -78,34 +98,32 @@ class GenericAPIView(generics.GenericAPIView):
         """
         return self.get_serializer(*args, serializer_type="result", **kwargs)
 
-    def _check_action_function(self):
-        func = getattr(self, self.action, None)
-        if func and callable(func):
-            return hasattr(func, "_audoma")
-        return False
-
     def _extract_audoma_action_serializer(
         self, serializer_type: str, audoma_args: AudomaArgs, status_code: int = None
     ):
-
-        extractor = OperationExtractor(
-            audoma_args.collectors, audoma_args.results, audoma_args.errors
-        )
         operation_category = "response" if serializer_type == "result" else "collect"
 
         if not status_code and operation_category == "response":
             return None
 
-        return extractor.extract_operation(
-            self.request, status_code, operation_category
-        )
+        plan = audoma_args.plan
+        if operation_category == "collect":
+            return plan.get_collect_operation(self.request.method)
+
+        if status_code >= 400:
+            # error responses are built per call, those are not a part of the plan
+            extractor = OperationExtractor(
+                audoma_args.collectors, audoma_args.results, audoma_args.errors
+            )
+            return extractor.extract_operation(
+                self.request, status_code, operation_category
+            )
+
+        return plan.get_result_operation(self.request.method, status_code)
 
     def get_audoma_action_config(self):
-        audoma_args = None
-        if self._check_action_function():
-            func = getattr(self, self.action)
-            audoma_args = getattr(func, "_audoma", None)
-        return audoma_args
+        func = getattr(self, self.action, None) if self.action else None
+        return getattr(func, "_audoma", None) if callable(func) else None
 
     def get_audoma_action_serializer_class(
         self, serializer_type: str, status_code: int = None
@@ -133,6 +151,8 @@ class GenericAPIView(generics.GenericAPIView):
         """
         Extends defuault `get_serializer_class` method.
         This returns proper serializer_class for current request.
+        Resolved serializer class is cached per view class,
+        unless `cache_serializer_class_resolution` is set to False.
 
         Args:
             serializer_type - serializer_type of serializer to be returned, it may be collect or result serializer.
@@ -141,6 +161,42 @@ class GenericAPIView(generics.GenericAPIView):
             This returns serializer_class
 
         """
+        # error operations are created per call, those should not be shared
+        if not self.cache_serializer_class_resolution or (
+            status_code and status_code >= 400
+        ):
+            return self._resolve_serializer_class(
+                serializer_type, status_code, audoma_action_serializer_only
+            )
+
+        if self.action == "metadata":
+            action = self.action_map.get("post", "list")
+        else:
+            action = self.action
+        key = (
+            self.request.method,
+            self.action,
+            action,
+            serializer_type,
+            status_code,
+            audoma_action_serializer_only,
+        )
+        cache = self._get_serializer_class_cache()
+        try:
+            return cache[key]
+        except KeyError:
+            serializer_class = self._resolve_serializer_class(
+                serializer_type, status_code, audoma_action_serializer_only
+            )
+            cache[key] = serializer_class
+            return serializer_class
+
+    def _resolve_serializer_class(
+        self,
+        serializer_type: str,
+        status_code: int = None,
+        audoma_action_serializer_only: bool = False,
+    ) -> Type[BaseSerializer]:
         assert self.action not in [
             "post",
             "put",
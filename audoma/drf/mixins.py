@@ -18,10 +18,17 @@ Example:
 
 """
 
+import logging
+from contextlib import nullcontext
+from itertools import islice
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
+    Tuple,
 )
 
 from rest_framework import (
@@ -29,12 +36,28 @@ from rest_framework import (
     serializers,
     status,
 )
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.serializers import BaseSerializer
 from rest_framework.settings import api_settings
 
 from django.core.exceptions import ValidationError
+from django.db import (
+    DatabaseError,
+    router,
+    transaction,
+)
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+
+from audoma import jobs
+from audoma.drf.serializers import BulkListSerializer
+
+
+logger = logging.getLogger(__name__)
 
 
 class ActionModelMixin:
@@ -44,7 +67,7 @@ class ActionModelMixin:
         success_status: int = status.HTTP_200_OK,
         instance: Any = None,
         partial: bool = False,
-        **kwargs
+        **kwargs,
     ) -> Response:
         if instance:
             serializer = self.get_serializer(
@@ -64,7 +87,7 @@ class ActionModelMixin:
         request: Request,
         instance: Any = None,
         success_status: int = status.HTTP_200_OK,
-        **kwargs
+        **kwargs,
     ) -> Response:
         if instance is None:
             instance = self.get_object()
@@ -92,6 +115,19 @@ class CreateModelMixin(mixins.CreateModelMixin):
 
 
 class ListModelMixin(mixins.ListModelMixin):
+    """
+    Extended list mixin.
+
+    Setting ``stream_list_response`` makes not paginated JSON responses to be streamed.
+    Queryset is then iterated with ``.iterator(chunk_size=stream_chunk_size)``
+    and serialized chunk by chunk, so the whole list is never held in memory.
+    Errors raised after the first chunk can't be returned as an error response,
+    the streamed body is truncated instead, see ``get_streaming_list_response``.
+    """
+
+    stream_list_response = False
+    stream_chunk_size = 1000
+
     def list(self, request: Request, *args, **kwargs) -> Response:
         queryset = self.filter_queryset(self.get_queryset())
 
@@ -100,9 +136,70 @@ class ListModelMixin(mixins.ListModelMixin):
             serializer = self.get_result_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
 
+        if self.stream_list_response and isinstance(
+            getattr(request, "accepted_renderer", None), JSONRenderer
+        ):
+            return self.get_streaming_list_response(queryset)
+
         serializer = self.get_result_serializer(queryset, many=True)
         return Response(serializer.data)
 
+    def _iter_list_chunks(self, queryset: Iterable[Any]) -> Iterator[List[Any]]:
+        if isinstance(queryset, QuerySet):
+            iterator = queryset.iterator(chunk_size=self.stream_chunk_size)
+        else:
+            iterator = iter(queryset)
+        while True:
+            chunk = list(islice(iterator, self.stream_chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _render_list_chunk(self, chunk: List[Any]) -> Tuple[bool, bytes]:
+        renderer = self.request.accepted_renderer
+        data = self.get_result_serializer(chunk, many=True).data
+        # result serializer may wrap list into `results`
+        wrapped = isinstance(data, dict)
+        items = data["results"] if wrapped else data
+        # strip list brackets, so items of all chunks form a single list
+        content = renderer.render(
+            items, renderer.media_type, self.get_renderer_context()
+        )[1:-1]
+        return wrapped, content
+
+    def _iter_streaming_list_content(
+        self, wrapped: bool, first_content: bytes, chunks: Iterator[List[Any]]
+    ) -> Iterator[bytes]:
+        yield b'{"results":[' if wrapped else b"["
+        yield first_content
+        for chunk in chunks:
+            yield b"," + self._render_list_chunk(chunk)[1]
+        yield b"]}" if wrapped else b"]"
+
+    def get_streaming_list_response(
+        self, queryset: Iterable[Any]
+    ) -> StreamingHttpResponse:
+        """
+        Returns response, which content is a JSON list, rendered incrementally.
+
+        The first chunk is fetched and rendered before the response is returned,
+        so errors of the query and serialization are handled by the view as any other error.
+        Errors raised by the following chunks can't change the already sent status,
+        those are logged by the server and the response body is truncated.
+        """
+        renderer = self.request.accepted_renderer
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+
+        chunks = self._iter_list_chunks(queryset)
+        wrapped, first_content = self._render_list_chunk(next(chunks, []))
+        return StreamingHttpResponse(
+            self._iter_streaming_list_content(wrapped, first_content, chunks),
+            status=status.HTTP_200_OK,
+            content_type=content_type,
+        )
+
     def get_paginated_response(self, data: List[Dict]) -> Response:
         ret = super().get_paginated_response(data)
         if hasattr(self, "get_list_message"):
@@ -147,7 +244,221 @@ class DestroyModelMixin(mixins.DestroyModelMixin):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class BulkCreateModelMixin(CreateModelMixin):
+class BulkChunkMixin:
+    """
+    Processes bulk payloads in chunks of ``bulk_chunk_size`` items.
+
+    Each chunk is validated and written in its own transaction, or in a savepoint
+    if the request already runs in a transaction, so memory usage and lock duration
+    are bounded by the chunk size. Instead of failing the whole request,
+    invalid items and items of chunks which could not be written are reported
+    in the response, which holds status of each item in the payload order.
+    Chunks written before a failing chunk stay saved.
+    If only some of the items have been saved the response status is ``207``,
+    if none of those it's ``400``.
+    """
+
+    bulk_chunk_size = None
+
+    BULK_STATUS_SUCCESS = "success"
+    BULK_STATUS_ERROR = "error"
+
+    def get_bulk_chunk_db(self) -> str:
+        return router.db_for_write(self.get_queryset().model)
+
+    def _get_bulk_error_status(self, errors: Any) -> Dict[str, Any]:
+        if not isinstance(errors, dict):
+            # errors are always an object, as declared in the schema
+            errors = {api_settings.NON_FIELD_ERRORS_KEY: errors}
+        return {"status": self.BULK_STATUS_ERROR, "errors": errors}
+
+    def _collect_bulk_errors(
+        self, errors: Any, positions: List[int], statuses: Dict[int, Dict[str, Any]]
+    ) -> List[int]:
+        """
+        Stores errors of the list serializer under the chunk positions of the validated items.
+
+        Args:
+            * errors - errors of the list serializer
+            * positions - chunk positions of the validated items
+            * statuses - statuses of the chunk items, updated in place
+
+        Returns: chunk positions of the valid items
+        """
+        if not isinstance(errors, list):
+            errors = [errors] * len(positions)
+        valid_positions = []
+        for position, error in zip(positions, errors):
+            if error:
+                statuses[position] = self._get_bulk_error_status(error)
+            else:
+                valid_positions.append(position)
+        return valid_positions
+
+    def _process_bulk_chunk(
+        self,
+        chunk: List[Any],
+        get_serializer: Callable[[List[Any]], BaseSerializer],
+        save: Callable[[BaseSerializer], Iterable[Tuple[int, Any]]],
+    ) -> Dict[int, Dict[str, Any]]:
+        statuses = {}
+        positions = list(range(len(chunk)))
+        serializer = get_serializer(chunk)
+        if not serializer.is_valid():
+            positions = self._collect_bulk_errors(
+                serializer.errors, positions, statuses
+            )
+            if not positions:
+                return statuses
+            serializer = get_serializer([chunk[position] for position in positions])
+            if not serializer.is_valid():
+                # items valid again are reported as not saved
+                self._collect_bulk_errors(serializer.errors, positions, statuses)
+                return statuses
+
+        for position, result in save(serializer):
+            statuses[positions[position]] = {
+                "status": self.BULK_STATUS_SUCCESS,
+                "result": result,
+            }
+        return statuses
+
+    def process_bulk_chunks(
+        self,
+        data: List[Any],
+        get_serializer: Callable[[List[Any]], BaseSerializer],
+        save: Callable[[BaseSerializer], Iterable[Tuple[int, Any]]],
+        success_status: int,
+    ) -> Response:
+        """
+        Validates and saves the payload chunk by chunk.
+
+        Args:
+            * data - list of items passed in the request
+            * get_serializer - creates not validated list serializer for the chunk items
+            * save - saves the validated serializer and returns pairs of
+                the item position in the serializer data and its representation
+            * success_status - status code of the response
+
+        Returns: response with status of each item
+        """
+        statuses = []
+        db = self.get_bulk_chunk_db()
+        for offset in range(0, len(data), self.bulk_chunk_size):
+            end = offset + self.bulk_chunk_size
+            chunk = data[offset:end]
+            error = self._get_bulk_error_status(
+                {api_settings.NON_FIELD_ERRORS_KEY: ["Item has not been saved."]}
+            )
+            try:
+                with transaction.atomic(using=db):
+                    chunk_statuses = self._process_bulk_chunk(
+                        chunk, get_serializer, save
+                    )
+            except serializers.ValidationError as e:
+                chunk_statuses = {}
+                error = self._get_bulk_error_status(e.detail)
+            except DatabaseError:
+                # database errors may disclose the schema, so those are only logged
+                logger.exception(
+                    "Bulk chunk of items %s-%s could not be saved.", offset, end - 1
+                )
+                chunk_statuses = {}
+            statuses.extend(
+                chunk_statuses.get(position, error) for position in range(len(chunk))
+            )
+        return Response(
+            {"results": statuses},
+            status=self.get_bulk_chunks_status(statuses, success_status),
+        )
+
+    def get_bulk_chunks_status(
+        self, statuses: List[Dict[str, Any]], success_status: int
+    ) -> int:
+        """
+        Returns status code of the chunked bulk response.
+        It's ``success_status`` if all of the items have been saved,
+        ``207 Multi-Status`` if only some of those and ``400`` if none of those.
+        """
+        saved = sum(
+            1 for item in statuses if item["status"] == self.BULK_STATUS_SUCCESS
+        )
+        if saved == len(statuses):
+            return success_status
+        if saved:
+            return status.HTTP_207_MULTI_STATUS
+        return status.HTTP_400_BAD_REQUEST
+
+
+class BulkJobMixin:
+    """
+    Processes large bulk payloads asynchronously.
+
+    Bulk payloads with more than ``bulk_job_threshold`` items are stored as a job
+    and processed by the bulk job backend, ``bulk_job_backend`` or ``AUDOMA_BULK_JOB_BACKEND``.
+    Such requests are answered with ``202 Accepted``, which ``Location`` header
+    points to the job status endpoint registered by audoma's ``SimpleRouter``
+    for viewsets with ``bulk_job_threshold`` set.
+    """
+
+    bulk_job_threshold = None
+    bulk_job_backend = None
+    running_bulk_job = False
+
+    def should_run_bulk_job(self, data: Any) -> bool:
+        return (
+            self.bulk_job_threshold is not None
+            and not self.running_bulk_job
+            and isinstance(data, list)
+            and len(data) > self.bulk_job_threshold
+        )
+
+    def get_bulk_job_url(self, job_id: str) -> str:
+        url_name = f"{self.basename}-bulk-job"
+        namespace = getattr(
+            getattr(self.request, "resolver_match", None), "namespace", ""
+        )
+        if namespace:
+            url_name = f"{namespace}:{url_name}"
+        return reverse(url_name, kwargs={"job_id": job_id}, request=self.request)
+
+    def start_bulk_job(self, request: Request) -> Response:
+        """
+        Stores the request as a bulk job and submits it to the bulk job backend.
+        The job is submitted after the current transaction has been committed.
+        """
+        job = jobs.create_bulk_job(self, request, self.get_bulk_job_url)
+        backend = jobs.get_bulk_job_backend(self.bulk_job_backend)
+        transaction.on_commit(lambda: backend.submit(job["id"]))
+
+        serializer = jobs.BulkJobSerializer(job, context=self.get_serializer_context())
+        if hasattr(self, "_retrieve_response_headers"):
+            headers = self._retrieve_response_headers(
+                status.HTTP_202_ACCEPTED, serializer
+            )
+        else:
+            headers = {}
+        headers.setdefault("Location", job["url"])
+        return Response(
+            serializer.data, status=status.HTTP_202_ACCEPTED, headers=headers
+        )
+
+    def bulk_job_status(
+        self, request: Request, job_id: str, *args, **kwargs
+    ) -> Response:
+        job = jobs.get_bulk_job_store().get(job_id)
+        user_id = request.user.pk if request.user.is_authenticated else None
+        if (
+            job is None
+            or job["view"] != f"{type(self).__module__}.{type(self).__qualname__}"
+            or job["user_id"] != user_id
+        ):
+            raise NotFound()
+        serializer = jobs.BulkJobSerializer(job, context=self.get_serializer_context())
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class BulkCreateModelMixin(BulkJobMixin, BulkChunkMixin, CreateModelMixin):
     """
     Either create a single or many model instances in bulk by using the
     Serializers ``many=True`` ability from Django REST >= 2.2.5.
@@ -155,12 +466,35 @@ class BulkCreateModelMixin(CreateModelMixin):
         This mixin uses the same method to create model instances
         as ``CreateModelMixin`` because both non-bulk and bulk
         requests will use ``POST`` request method.
+
+    Setting ``use_bulk_write`` makes ``BulkListSerializer`` create
+    instances with ``bulk_create`` in batches of ``bulk_batch_size``.
     """
 
+    use_bulk_write = False
+    bulk_batch_size = None
+
+    def save_bulk_create_chunk(
+        self, serializer: BaseSerializer
+    ) -> List[Tuple[int, Any]]:
+        self.perform_bulk_create(serializer)
+        return list(
+            enumerate(self.get_result_serializer(serializer.instance, many=True).data)
+        )
+
     def create(self, request: Request, *args, **kwargs) -> Response:
         bulk = isinstance(request.data, list)
         if not bulk:
             return super(BulkCreateModelMixin, self).create(request, *args, **kwargs)
+        elif self.should_run_bulk_job(request.data):
+            return self.start_bulk_job(request)
+        elif self.bulk_chunk_size:
+            return self.process_bulk_chunks(
+                request.data,
+                lambda chunk: self.get_serializer(data=chunk, many=True),
+                self.save_bulk_create_chunk,
+                status.HTTP_201_CREATED,
+            )
         else:
             serializer = self.get_serializer(data=request.data, many=True)
             serializer.is_valid(raise_exception=True)
@@ -172,12 +506,24 @@ class BulkCreateModelMixin(CreateModelMixin):
         self.perform_create(serializer)
 
 
-class BulkUpdateModelMixin(object):
+class BulkUpdateModelMixin(BulkJobMixin, BulkChunkMixin):
     """
     Update model instances in bulk by using the Serializers
     ``many=True`` ability from Django REST >= 2.2.5.
+
+    Setting ``use_bulk_write`` makes ``BulkListSerializer`` update
+    instances with ``bulk_update`` in batches of ``bulk_batch_size``.
+
+    Instances referenced by the payload are fetched with a single query
+    and shared with the serializer for validation and update.
+    Setting ``bulk_update_select_for_update`` locks those rows,
+    in primary key order, for the duration of the update.
     """
 
+    use_bulk_write = False
+    bulk_batch_size = None
+    bulk_update_select_for_update = False
+
     def get_object(self) -> Any:
         lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
         if lookup_url_kwarg in self.kwargs:
@@ -192,17 +538,80 @@ class BulkUpdateModelMixin(object):
         # before any of the API actions (e.g. create, update, etc)
         return
 
+    def plan_bulk_update(self, serializer: BaseSerializer, queryset: Any) -> None:
+        """
+        Fetches all instances referenced by the payload with a single query
+        and hands those to the serializer, so validation and update don't query them again.
+
+        Args:
+            * serializer - bulk list serializer
+            * queryset - filtered queryset to which the update is restricted
+        """
+        if not isinstance(queryset, QuerySet) or not isinstance(
+            serializer, BulkListSerializer
+        ):
+            return
+        serializer.instances_by_id = serializer.load_instances_by_id(
+            queryset,
+            serializer.get_data_ids(serializer.initial_data),
+            select_for_update=self.bulk_update_select_for_update,
+        )
+
+    def save_bulk_update_chunk(
+        self, serializer: BaseSerializer
+    ) -> List[Tuple[int, Any]]:
+        self.perform_bulk_update(serializer)
+        # updated instances are not returned in the payload order,
+        # payload keys are cleaned, so those match keys of the instances
+        id_attr = serializer.id_attr
+        positions = {
+            serializer.get_instance_key(item.get(id_attr)): position
+            for position, item in enumerate(serializer.initial_data)
+        }
+        results = []
+        for obj, result in zip(serializer.instance, serializer.data):
+            obj_id = serializer.get_instance_key(getattr(obj, id_attr))
+            if obj_id in positions:
+                results.append((positions[obj_id], result))
+        return results
+
     def bulk_update(self, request: Request, *args, **kwargs) -> Response:
+        if self.should_run_bulk_job(request.data):
+            return self.start_bulk_job(request)
+
         partial = kwargs.pop("partial", False)
         # restrict the update to the filtered queryset
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.bulk_chunk_size and isinstance(request.data, list):
+
+            def get_chunk_serializer(chunk: List[Any]) -> BaseSerializer:
+                serializer = self.get_serializer(
+                    queryset, data=chunk, many=True, partial=partial
+                )
+                self.plan_bulk_update(serializer, queryset)
+                return serializer
+
+            return self.process_bulk_chunks(
+                request.data,
+                get_chunk_serializer,
+                self.save_bulk_update_chunk,
+                status.HTTP_200_OK,
+            )
+
         serializer = self.get_serializer(
-            self.filter_queryset(self.get_queryset()),
+            queryset,
             data=request.data,
             many=True,
             partial=partial,
         )
-        serializer.is_valid(raise_exception=True)
-        self.perform_bulk_update(serializer)
+        if self.bulk_update_select_for_update and isinstance(queryset, QuerySet):
+            atomic = transaction.atomic(using=queryset.db)
+        else:
+            atomic = nullcontext()
+        with atomic:
+            self.plan_bulk_update(serializer, queryset)
+            serializer.is_valid(raise_exception=True)
+            self.perform_bulk_update(serializer)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def partial_bulk_update(self, request: Request, *args, **kwargs) -> Response:
@@ -1,6 +1,8 @@
 from rest_framework import routers
 from rest_framework.routers import *  # noqa: F403, F401
 
+from audoma import jobs
+
 
 class SimpleRouter(routers.SimpleRouter):
     routes = [
@@ -26,6 +28,15 @@ class SimpleRouter(routers.SimpleRouter):
             detail=False,
             initkwargs={},
         ),
+        # Bulk job status route.
+        # Registered only for viewsets with `bulk_job_threshold` set, see `BulkJobMixin`.
+        routers.Route(
+            url=r"^{prefix}/bulk-jobs/(?P<job_id>[0-9a-f]+){trailing_slash}$",
+            mapping={"get": "bulk_job_status"},
+            name="{basename}-bulk-job",
+            detail=False,
+            initkwargs={"suffix": "Bulk Job"},
+        ),
         # Detail route.
         routers.Route(
             url=r"^{prefix}/{lookup}{trailing_slash}$",
@@ -49,6 +60,19 @@ class SimpleRouter(routers.SimpleRouter):
         ),
     ]
 
+    def get_routes(self, viewset):
+        routes = super().get_routes(viewset)
+        if getattr(viewset, "bulk_job_threshold", None) is None:
+            # bulk jobs are disabled, so is their status endpoint
+            return [
+                route
+                for route in routes
+                if "bulk_job_status" not in route.mapping.values()
+            ]
+        # bulk jobs cache is validated on startup, instead of the first bulk job
+        jobs.get_bulk_job_store()
+        return routes
+
 
 class DefaultRouter(SimpleRouter, routers.DefaultRouter):
     ...
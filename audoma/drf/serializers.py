@@ -1,6 +1,13 @@
+import copy
+from collections import OrderedDict
 from typing import (
     Any,
+    Dict,
+    Hashable,
+    Iterable,
     List,
+    Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -9,8 +16,14 @@ from uuid import UUID
 
 from rest_framework import serializers
 from rest_framework.serializers import *  # noqa: F403, F401
+from rest_framework.settings import api_settings
+from rest_framework.utils import model_meta
 
 from django.contrib.postgres import fields as psql_fields
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ValidationError as DjangoValidationError,
+)
 from django.db import models
 from django.db.models import QuerySet
 
@@ -30,6 +43,7 @@ except ImportError:
 
 
 from audoma.drf.fields import (  # NOQA # isort:skip
+    BatchSerializerMethodField,
     BooleanField,
     CharField,
     ChoiceField,
@@ -145,13 +159,88 @@ class ResultSerializerClassMixin:
         return cls
 
 
-class ModelSerializer(ResultSerializerClassMixin, serializers.ModelSerializer):
+class MethodFieldMemoMixin:
+    """
+    Keeps memo of the cached `SerializerMethodField` results while the root serializer
+    is rendered, so results are never reused by the next rendering.
+    """
+
+    def to_representation(self, instance: Any) -> Any:
+        if self.root is not self or "_method_field_memo" in self.__dict__:
+            return super().to_representation(instance)
+        self._method_field_memo = {}
+        try:
+            return super().to_representation(instance)
+        finally:
+            del self._method_field_memo
+
+
+class BatchFieldsSerializerMixin(MethodFieldMemoMixin):
+    """
+    Makes serializers with `BatchSerializerMethodField` or cached `SerializerMethodField`
+    use audoma's `ListSerializer` when `many=True`, so batch fields are loaded once
+    for the whole list and method results are cached for the whole list.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs) -> serializers.ListSerializer:
+        meta = getattr(cls, "Meta", None)
+        if hasattr(meta, "list_serializer_class") or not any(
+            isinstance(field, BatchSerializerMethodField)
+            or (isinstance(field, SerializerMethodField) and field.cache)
+            for field in cls._declared_fields.values()
+        ):
+            return super().many_init(*args, **kwargs)
+
+        list_kwargs = {}
+        for key in ("allow_empty", "max_length", "min_length"):
+            value = kwargs.pop(key, None)
+            if value is not None:
+                list_kwargs[key] = value
+        list_kwargs["child"] = cls(*args, **kwargs)
+        list_kwargs.update(
+            {
+                key: value
+                for key, value in kwargs.items()
+                if key in serializers.LIST_SERIALIZER_KWARGS
+            }
+        )
+        return ListSerializer(*args, **list_kwargs)
+
+
+class ModelSerializer(
+    BatchFieldsSerializerMixin, ResultSerializerClassMixin, serializers.ModelSerializer
+):
     """
     Extends default ModelSerializer,
     modifies serializer_field_mapping (replaces some fields with audoma fields).
     Adds support for generating audoma example for field.
+
+    Field classes and their kwargs are built once per serializer class and `Meta` state,
+    fields are then instantiated from this plan.
+    The plan is not used by serializers overriding any of the `field_plan_hooks`,
+    as those may build fields depending on the context, instance or request.
+    Set `cache_field_plan` to False for other serializers which build fields dynamically.
     """
 
+    cache_field_plan = True
+    field_plan_hooks = (
+        "get_field_names",
+        "get_default_field_names",
+        "get_extra_kwargs",
+        "get_uniqueness_extra_kwargs",
+        "include_extra_kwargs",
+        "build_field",
+        "build_standard_field",
+        "build_relational_field",
+        "build_nested_field",
+        "build_property_field",
+        "build_url_field",
+        "build_unknown_field",
+    )
+    # kwargs holding objects which may keep state, those are copied for each field
+    field_plan_copied_kwargs = ("validators", "default")
+
     serializer_field_mapping = {
         models.AutoField: IntegerField,
         models.BigIntegerField: IntegerField,
@@ -195,6 +284,143 @@ class ModelSerializer(ResultSerializerClassMixin, serializers.ModelSerializer):
     }
     serializer_choice_field = ChoiceField
 
+    @classmethod
+    def _get_field_plan_cache(cls) -> dict:
+        # cache is stored in the class __dict__, so subclasses never share it
+        cache = cls.__dict__.get("_field_plan_cache")
+        if cache is None:
+            cache = {}
+            cls._field_plan_cache = cache
+        return cache
+
+    @classmethod
+    def _get_hashable(cls, value: Any) -> Hashable:
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._get_hashable(item) for item in value)
+        if isinstance(value, dict):
+            return tuple((key, cls._get_hashable(item)) for key, item in value.items())
+        try:
+            hash(value)
+        except TypeError:
+            return id(value)
+        return value
+
+    @classmethod
+    def can_cache_field_plan(cls) -> bool:
+        """
+        Returns if fields may be instantiated from the cached plan.
+        """
+        if not cls.cache_field_plan or not hasattr(cls, "Meta"):
+            return False
+        return all(
+            getattr(cls, hook) is getattr(ModelSerializer, hook)
+            for hook in cls.field_plan_hooks
+        )
+
+    def get_field_plan_key(self) -> Hashable:
+        """
+        Returns key identifying current `Meta` state, changing any `Meta` attribute changes the key.
+        """
+        meta = self.Meta
+        return (meta, id(self._declared_fields)) + tuple(
+            (name, self._get_hashable(getattr(meta, name)))
+            for name in dir(meta)
+            if not name.startswith("__")
+        )
+
+    def get_field_plan(self) -> List[Tuple[str, Optional[Type[Field]], dict]]:
+        """
+        Returns list of (field_name, field_class, field_kwargs) used to instantiate fields.
+        Declared fields have `field_class` set to None.
+        """
+        cache = self._get_field_plan_cache()
+        key = self.get_field_plan_key()
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        plan = self.build_field_plan()
+        # Meta may only be changed in place, old plans are never used again
+        cache.clear()
+        cache[key] = plan
+        return plan
+
+    def build_field_plan(self) -> List[Tuple[str, Optional[Type[Field]], dict]]:
+        """
+        Follows the `get_fields` of drf's ModelSerializer, but returns
+        field classes and kwargs instead of field instances.
+        """
+        assert hasattr(
+            self, "Meta"
+        ), 'Class {serializer_class} missing "Meta" attribute'.format(
+            serializer_class=self.__class__.__name__
+        )
+        assert hasattr(
+            self.Meta, "model"
+        ), 'Class {serializer_class} missing "Meta.model" attribute'.format(
+            serializer_class=self.__class__.__name__
+        )
+        if model_meta.is_abstract_model(self.Meta.model):
+            raise ValueError("Cannot use ModelSerializer with Abstract Models.")
+
+        declared_fields = self._declared_fields
+        model = getattr(self.Meta, "model")
+        depth = getattr(self.Meta, "depth", 0)
+
+        if depth is not None:
+            assert depth >= 0, "'depth' may not be negative."
+            assert depth <= 10, "'depth' may not be greater than 10."
+
+        info = model_meta.get_field_info(model)
+        field_names = self.get_field_names(declared_fields, info)
+
+        extra_kwargs = self.get_extra_kwargs()
+        extra_kwargs, hidden_fields = self.get_uniqueness_extra_kwargs(
+            field_names, declared_fields, extra_kwargs
+        )
+
+        plan = []
+        for field_name in field_names:
+            if field_name in declared_fields:
+                plan.append((field_name, None, {}))
+                continue
+
+            extra_field_kwargs = extra_kwargs.get(field_name, {})
+            source = extra_field_kwargs.get("source", "*")
+            if source == "*":
+                source = field_name
+
+            field_class, field_kwargs = self.build_field(source, info, model, depth)
+            field_kwargs = self.include_extra_kwargs(field_kwargs, extra_field_kwargs)
+            plan.append((field_name, field_class, field_kwargs))
+
+        for field_name, hidden_field in hidden_fields.items():
+            plan.append((field_name, HiddenField, {"default": hidden_field.default}))
+        return plan
+
+    def get_fields(self) -> Dict[str, Field]:
+        if not self.can_cache_field_plan():
+            return super().get_fields()
+
+        if self.url_field_name is None:
+            self.url_field_name = api_settings.URL_FIELD_NAME
+
+        declared_fields = copy.deepcopy(self._declared_fields)
+        fields = OrderedDict()
+        for field_name, field_class, field_kwargs in self.get_field_plan():
+            if field_class is None:
+                fields[field_name] = declared_fields[field_name]
+            else:
+                # plan is shared between instances, so is anything kept in its kwargs
+                field_kwargs = {
+                    key: copy.deepcopy(value)
+                    if key in self.field_plan_copied_kwargs or isinstance(value, Field)
+                    else value
+                    for key, value in field_kwargs.items()
+                }
+                fields[field_name] = field_class(**field_kwargs)
+        return fields
+
     def build_standard_field(
         self, field_name, model_field
     ) -> Tuple[Union[Type[Field], dict]]:
@@ -209,7 +435,9 @@ class ModelSerializer(ResultSerializerClassMixin, serializers.ModelSerializer):
         return field_class, field_kwargs
 
 
-class Serializer(ResultSerializerClassMixin, serializers.Serializer):
+class Serializer(
+    BatchFieldsSerializerMixin, ResultSerializerClassMixin, serializers.Serializer
+):
     pass
 
 
@@ -231,8 +459,23 @@ class DisplayNameWritableField(serializers.ChoiceField):
             raise serializers.ValidationError('"%s" is not valid choice.' % data)
 
 
-class ListSerializer(ResultSerializerClassMixin, serializers.ListSerializer):
-    pass
+class ListSerializer(
+    MethodFieldMemoMixin, ResultSerializerClassMixin, serializers.ListSerializer
+):
+    def to_representation(self, data: Any) -> List[Any]:
+        """
+        Loads values of child's `BatchSerializerMethodField` fields for all objects at once.
+        """
+        batch_fields = [
+            field
+            for field in getattr(self.child, "_readable_fields", [])
+            if isinstance(field, BatchSerializerMethodField)
+        ]
+        if batch_fields:
+            data = list(data.all() if isinstance(data, models.Manager) else data)
+            for field in batch_fields:
+                field.load_batch(data)
+        return super().to_representation(data)
 
 
 class BulkSerializerMixin:
@@ -244,19 +487,41 @@ class BulkSerializerMixin:
     def id_lookup_field(self):
         return self.fields.get(self.id_attr).source or self.id_attr
 
-    def validate(self, data):
+    def load_existing_pks(self) -> Set[Any]:
+        """
+        Loads primary keys of all instances which may be updated, with a single query.
+        UUID keys are converted to strings, so those can be compared with the incoming data.
+        """
         pk_field_name = getattr(self.Meta, "id_field_db_field_name", "id")
+        return {
+            str(x) if isinstance(x, UUID) else x
+            for x in self.instance.values_list(pk_field_name, flat=True)
+        }
+
+    def get_existing_pks(self) -> Set[Any]:
+        # BulkListSerializer loads keys once for the whole validation pass
+        existing_pks = getattr(self.parent, "_existing_pks", None)
+        if existing_pks is None:
+            existing_pks = self.load_existing_pks()
+        return existing_pks
 
+    def validate(self, data):
         if self.instance is not None and isinstance(self.instance, QuerySet):
             data_pk = data.get(self.id_attr)
-            existing_pks = [
-                str(x) if isinstance(x, UUID) else x
-                for x in self.instance.values_list(pk_field_name, flat=True)
-            ]
-            if data_pk not in existing_pks:
+            if isinstance(self.parent, BulkListSerializer):
+                data_pk = self.parent.get_instance_key(data_pk)
+            if data_pk not in self.get_existing_pks():
                 raise serializers.ValidationError(
                     {self.id_attr: "Record with given key does not exist."}
                 )
+            # BulkListSerializer collects keys validated in the current pass
+            validated_pks = getattr(self.parent, "_validated_pks", None)
+            if validated_pks is not None:
+                if data_pk in validated_pks:
+                    raise serializers.ValidationError(
+                        {self.id_attr: "Record with given key is duplicated."}
+                    )
+                validated_pks.add(data_pk)
         return super().validate(data)
 
     def to_internal_value(self, data: dict) -> dict:
@@ -286,7 +551,21 @@ class BulkSerializerMixin:
 
 
 class BulkListSerializer(ListSerializer):
+    """
+    List serializer used for bulk operations.
+
+    Saving may be done with `QuerySet.bulk_create` / `QuerySet.bulk_update`
+    instead of saving each instance separately. This can be enabled by setting
+    `use_bulk_write` and optionally `bulk_batch_size` on the child serializer's `Meta`
+    or on the view. Bulk writes do not call `Model.save` and do not send model signals.
+    Per instance `create`/`update` is still used if the child serializer overrides those,
+    or if many-to-many, reverse relation or other non concrete attrs are written.
+    """
+
     id_field = "id"
+    _existing_pks = None
+    _validated_pks = None
+    instances_by_id = None
 
     @property
     def id_attr(self):
@@ -296,22 +575,257 @@ class BulkListSerializer(ListSerializer):
     def id_lookup_field(self):
         return self.child.fields.get(self.id_attr).source or self.id_attr
 
+    def _get_bulk_write_option(self, name: str, default: Any) -> Any:
+        # serializer Meta takes precedence over the view configuration
+        value = getattr(getattr(self.child, "Meta", None), name, None)
+        if value is None:
+            value = getattr(self.context.get("view"), name, None)
+        return default if value is None else value
+
+    @property
+    def use_bulk_write(self) -> bool:
+        return self._get_bulk_write_option("use_bulk_write", False)
+
+    @property
+    def bulk_batch_size(self) -> Optional[int]:
+        return self._get_bulk_write_option("bulk_batch_size", None)
+
+    def _can_bulk_write(
+        self, method_name: str, all_validated_data: Iterable[dict]
+    ) -> bool:
+        """
+        Checks if instances may be written with a single bulk query.
+
+        Args:
+            * method_name - `create` or `update`
+            * all_validated_data - validated data of all instances
+
+        Returns: True if bulk write may be used.
+        """
+        if not self.use_bulk_write:
+            return False
+
+        # child serializer write method is overwritten, so it has to be used
+        child_method = getattr(type(self.child), method_name, None)
+        if child_method is not getattr(serializers.ModelSerializer, method_name):
+            return False
+
+        model = self.child.Meta.model
+        if model._meta.parents:
+            # multi-table inherited models can't be bulk written
+            return False
+
+        # many-to-many, reverse relations and other non concrete attrs
+        # have to be written by the child serializer
+        concrete_fields = self._get_concrete_field_names(model)
+        for validated_data in all_validated_data:
+            serializers.raise_errors_on_nested_writes(
+                method_name, self.child, validated_data
+            )
+            if not concrete_fields.issuperset(validated_data):
+                return False
+        return True
+
+    @staticmethod
+    def _get_concrete_field_names(model: Type[models.Model]) -> Set[str]:
+        names = set()
+        for field in model._meta.concrete_fields:
+            names.update((field.name, field.attname))
+        return names
+
     def data_by_id(self, data):
-        return {i.pop(self.id_attr): i for i in data}
+        return {self.get_instance_key(i.pop(self.id_attr)): i for i in data}
+
+    def get_data_ids(self, data: Any) -> List[Any]:
+        """
+        Extracts keys of the instances to update from the incoming payload.
+
+        Args:
+            * data - raw list of items passed to the serializer
+
+        Returns: list of unique keys in the payload order
+        """
+        if not isinstance(data, list):
+            return []
+        return list(
+            dict.fromkeys(
+                item[self.id_attr]
+                for item in data
+                if isinstance(item, dict) and item.get(self.id_attr) is not None
+            )
+        )
+
+    def _get_lookup_model_field(self, model: Type[models.Model]) -> Optional[Any]:
+        opts = model._meta
+        try:
+            return (
+                opts.pk
+                if self.id_lookup_field == "pk"
+                else opts.get_field(self.id_lookup_field)
+            )
+        except FieldDoesNotExist:
+            return None
+
+    def _clean_lookup_values(self, queryset: QuerySet, ids: List[Any]) -> List[Any]:
+        # invalid keys are skipped, those are reported by validation as missing records
+        model_field = self._get_lookup_model_field(queryset.model)
+        if model_field is None:
+            return ids
+
+        values = []
+        for value in ids:
+            try:
+                values.append(model_field.to_python(value))
+            except (DjangoValidationError, TypeError, ValueError):
+                continue
+        return values
+
+    def get_instance_key(self, value: Any) -> Any:
+        """
+        Returns key under which the instance with given lookup value is stored,
+        raw payload values are converted with the lookup model field first.
+        UUID keys are converted to strings, so those can be compared with the incoming data.
+
+        Args:
+            * value - key of the instance, either raw or taken from the instance
+
+        Returns: key of the instance, or None if the value is not a valid key
+        """
+        model_field = self._get_lookup_model_field(self.child.Meta.model)
+        if model_field is not None:
+            try:
+                value = model_field.to_python(value)
+            except (DjangoValidationError, TypeError, ValueError):
+                return None
+        return str(value) if isinstance(value, UUID) else value
+
+    def load_instances_by_id(
+        self, queryset: QuerySet, ids: List[Any], select_for_update: bool = False
+    ) -> Dict[Any, Any]:
+        """
+        Fetches instances with given keys with a single query.
+        Rows are ordered by primary key, so concurrent locking updates
+        always acquire row locks in the same order.
+
+        Args:
+            * queryset - queryset to which the update is restricted
+            * ids - keys of the instances to update
+            * select_for_update - if rows should be locked until the end of the transaction
+
+        Returns: dictionary mapping keys to instances
+        """
+        queryset = queryset.filter(
+            **{
+                "{}__in".format(self.id_lookup_field): self._clean_lookup_values(
+                    queryset, ids
+                ),
+            }
+        ).order_by("pk")
+        if select_for_update:
+            queryset = queryset.select_for_update()
+
+        instances_by_id = {}
+        for obj in queryset:
+            obj_id = getattr(obj, self.id_attr)
+            if isinstance(obj_id, UUID):
+                obj_id = str(obj_id)
+            instances_by_id[obj_id] = obj
+        return instances_by_id
+
+    def to_internal_value(self, data: List[dict]) -> List[dict]:
+        """
+        Loads existing primary keys once and shares them with the child
+        serializer, instead of querying them for each validated item.
+        If instances have been already loaded with `load_instances_by_id`, their keys are used.
+        Items referencing a record already referenced by a previous item are rejected.
+        """
+        if self.instances_by_id is not None:
+            self._existing_pks = self.instances_by_id.keys()
+        elif isinstance(self.instance, QuerySet) and isinstance(
+            self.child, BulkSerializerMixin
+        ):
+            self._existing_pks = self.child.load_existing_pks()
+        # each record may be updated only once
+        self._validated_pks = set()
+        try:
+            return super().to_internal_value(data)
+        finally:
+            self._existing_pks = None
+            self._validated_pks = None
 
     def objects_to_update(self, queryset, data):
+        if self.instances_by_id is not None:
+            return [
+                obj for obj_id, obj in self.instances_by_id.items() if obj_id in data
+            ]
         return queryset.filter(
             **{
                 "{}__in".format(self.id_lookup_field): data.keys(),
             }
         )
 
+    def create(self, validated_data: List[dict]) -> List[Any]:
+        if not self._can_bulk_write("create", validated_data):
+            return super().create(validated_data)
+
+        model = self.child.Meta.model
+        return model._default_manager.bulk_create(
+            [model(**attrs) for attrs in validated_data],
+            batch_size=self.bulk_batch_size,
+        )
+
+    def _bulk_update(
+        self, objects_to_update: QuerySet, all_validated_data_by_id: dict
+    ) -> List[Any]:
+        """
+        Updates instances with `bulk_update`.
+        Instances are grouped by the attrs passed for them, so each row is written
+        only with its own fields, which matters for partial updates.
+        """
+        model = self.child.Meta.model
+        updated_objects = []
+        groups = {}
+
+        for obj in objects_to_update:
+            obj_id = getattr(obj, self.id_attr)
+            if isinstance(obj_id, UUID):
+                obj_id = str(obj_id)
+            attrs = all_validated_data_by_id.get(obj_id)
+            for attr, value in attrs.items():
+                setattr(obj, attr, value)
+            updated_objects.append(obj)
+            groups.setdefault(frozenset(attrs), []).append(obj)
+
+        # bulk_update does not call save, so auto_now fields have to be handled here
+        auto_now_fields = [
+            field
+            for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+        for attrs, objects in groups.items():
+            update_fields = set(attrs)
+            update_fields.discard(model._meta.pk.name)
+            update_fields.discard(model._meta.pk.attname)
+            if not update_fields:
+                continue
+            for field in auto_now_fields:
+                for obj in objects:
+                    field.pre_save(obj, add=False)
+                update_fields.add(field.name)
+            model._default_manager.bulk_update(
+                objects, sorted(update_fields), batch_size=self.bulk_batch_size
+            )
+        return updated_objects
+
     def update(self, queryset: QuerySet, all_validated_data: List[dict]) -> List[Any]:
         updated_objects = []
         all_validated_data_by_id = self.data_by_id(all_validated_data)
 
         objects_to_update = self.objects_to_update(queryset, all_validated_data_by_id)
 
+        if self._can_bulk_write("update", all_validated_data_by_id.values()):
+            return self._bulk_update(objects_to_update, all_validated_data_by_id)
+
         for obj in objects_to_update:
             obj_id = getattr(obj, self.id_attr)
             if isinstance(obj_id, UUID):
@@ -1,21 +1,88 @@
+import binascii
+import hashlib
+import json
 import random
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+)
+from collections import OrderedDict
+from functools import (
+    partial,
+    update_wrapper,
+)
+from inspect import (
+    iscoroutine,
+    iscoroutinefunction,
+)
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
+    Optional,
+    Tuple,
+    Type,
     Union,
 )
 
 from rest_framework import viewsets
-from rest_framework.exceptions import ErrorDetail
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import (
+    ErrorDetail,
+    NotFound,
+)
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import (
+    EmptyResultSet,
+    FieldDoesNotExist,
+    ValidationError as DjangoValidationError,
+)
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import (
+    Field,
+    Model,
+    Q,
+    QuerySet,
+)
+from django.http import HttpRequest
+from django.utils.functional import cached_property
+from django.utils.http import urlencode
 
+from audoma.concurrency import get_sync_to_async
 from audoma.drf.generics import GenericAPIView
 
 
+class CountStrategyPaginator(DjangoPaginator):
+    """
+    Django paginator which delegates counting objects to the given function.
+
+    Args:
+        count_function (Callable) - function called with the paginated object list
+    """
+
+    def __init__(self, *args, count_function: Callable = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_function = count_function
+
+    @cached_property
+    def count(self) -> int:
+        if self.count_function is None:
+            return super().count
+        return self.count_function(self.object_list)
+
+
 class AudomaPagination(PageNumberPagination):
     """
     A simple page number based style that supports page numbers as
@@ -23,15 +90,136 @@ class AudomaPagination(PageNumberPagination):
 
     Note:
         If this won't be used it'll cause less explicit pagination documentation.
-        This class does not provide any additional functionality.
+        Counting strategy may be changed with `count_strategy`:
+            * exact - every request runs `COUNT(*)`
+            * cached - count is cached in django's cache for `count_cache_timeout` seconds,
+                keyed by the request path, its normalized filter query parameters
+                and the counted queryset, see `get_count_cache_scope`
+            * estimated - count is taken from the database planner (PostgreSQL only),
+                if the estimate is below `count_estimate_threshold` exact count is used
+        Non exact strategies return `count_type` in the response.
+        With estimated counts the number of pages is approximate as well.
 
     Args:
         page_size (int) - number of items per page - by default this is set to 25
         max_page_size (int) - maximum number of items per page - by default this is set to 2000
+        count_strategy (str) - strategy used to count the objects - by default this is set to "exact"
+        count_cache_timeout (int) - cache timeout of counts in seconds - by default this is set to 60
+        count_estimate_threshold (int) - minimal estimate used instead of the exact count
     """
 
+    COUNT_EXACT = "exact"
+    COUNT_CACHED = "cached"
+    COUNT_ESTIMATED = "estimated"
+    COUNT_TYPES = (COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED)
+
     page_size = 25
     max_page_size = 2000
+    count_strategy = COUNT_EXACT
+    count_cache_timeout = 60
+    count_cache_prefix = "audoma_pagination_count"
+    count_estimate_threshold = 100000
+
+    @property
+    def django_paginator_class(self) -> Callable:
+        return partial(CountStrategyPaginator, count_function=self.get_count)
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view=None
+    ) -> Optional[List[Any]]:
+        assert (
+            self.count_strategy in self.COUNT_TYPES
+        ), f"count_strategy has to be one of {self.COUNT_TYPES}"
+        self.request = request
+        self.count_type = self.COUNT_EXACT
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_count(self, queryset: QuerySet) -> int:
+        if self.count_strategy == self.COUNT_CACHED:
+            return self.get_cached_count(queryset)
+        if self.count_strategy == self.COUNT_ESTIMATED:
+            estimate = self.get_estimated_count(queryset)
+            if estimate is not None and estimate >= self.count_estimate_threshold:
+                self.count_type = self.COUNT_ESTIMATED
+                return estimate
+        return self.get_exact_count(queryset)
+
+    def get_exact_count(self, queryset: QuerySet) -> int:
+        if hasattr(queryset, "count"):
+            return queryset.count()
+        return len(queryset)
+
+    def get_count_cache_key(self, queryset: QuerySet) -> str:
+        ignored_params = {self.page_query_param, self.page_size_query_param}
+        params = sorted(
+            (key, sorted(values))
+            for key, values in self.request.query_params.lists()
+            if key not in ignored_params
+        )
+        querystring = urlencode(params, doseq=True)
+        digest = hashlib.md5(
+            "\n".join(
+                [
+                    f"{self.request.path}?{querystring}",
+                    self.get_count_cache_scope(queryset),
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        return f"{self.count_cache_prefix}:{digest}"
+
+    def get_count_cache_scope(self, queryset: QuerySet) -> str:
+        """
+        Distinguishes cached counts of the same url.
+        By default this is the SQL of the counted queryset with its database,
+        so querysets filtered by the user or tenant never share the count.
+
+        Args:
+            queryset (QuerySet) - counted queryset
+
+        Returns:
+            String added to the count cache key
+        """
+        if not isinstance(queryset, QuerySet):
+            user = getattr(self.request, "user", None)
+            return f"user:{getattr(user, 'pk', None)}"
+        try:
+            query = str(queryset.query)
+        except EmptyResultSet:
+            query = "<empty>"
+        return f"{queryset.db}:{query}"
+
+    def get_cached_count(self, queryset: QuerySet) -> int:
+        key = self.get_count_cache_key(queryset)
+        count = cache.get(key)
+        if count is not None:
+            self.count_type = self.COUNT_CACHED
+            return count
+        count = self.get_exact_count(queryset)
+        cache.set(key, count, self.count_cache_timeout)
+        return count
+
+    def get_estimated_count(self, queryset: QuerySet) -> Optional[int]:
+        if not isinstance(queryset, QuerySet):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def get_paginated_response(self, data: List[dict]) -> Response:
+        response = super().get_paginated_response(data)
+        if self.count_strategy != self.COUNT_EXACT:
+            response.data["count_type"] = self.count_type
+        return response
 
     def get_paginated_response_schema(self, schema: List[dict]) -> dict:
         """
@@ -42,7 +230,7 @@ class AudomaPagination(PageNumberPagination):
         Returns:
             Dictionary with pagination information including examples
         """
-        return {
+        paginated_schema = {
             "type": "object",
             "properties": {
                 "count": {"type": "integer", "example": random.randint(1, 100)},
@@ -65,6 +253,264 @@ class AudomaPagination(PageNumberPagination):
                 "results": schema,
             },
         }
+        if self.count_strategy != self.COUNT_EXACT:
+            count_types = [self.COUNT_EXACT, self.count_strategy]
+            paginated_schema["properties"]["count"][
+                "description"
+            ] = f"Count of objects, may be {self.count_strategy}."
+            paginated_schema["properties"]["count_type"] = {
+                "type": "string",
+                "enum": count_types,
+                "example": self.count_strategy,
+            }
+        return paginated_schema
+
+
+class AudomaKeysetPagination(BasePagination):
+    """
+    Keyset (cursor) based pagination.
+    Instead of counting rows and using OFFSET, each page is filtered
+    by the ordering key values of the last row of the previous page.
+    This keeps deep pages as fast as the first one.
+
+    Note:
+        Ordering may consist of multiple fields, but the combination
+        of those has to be unique and the fields should not be nullable.
+        Last ordering field should usually be the primary key.
+        Ordering may be also defined on the view with `keyset_ordering`.
+
+    Args:
+        page_size (int) - number of items per page - by default this is set to 25
+        max_page_size (int) - maximum number of items per page - by default this is set to 2000
+        ordering (Tuple[str]) - fields used as the keyset - by default this is set to ("-pk",)
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = "The pagination cursor value."
+    page_size = 25
+    max_page_size = 2000
+    page_size_query_param = "page_size"
+    page_size_query_description = "Number of results to return per page."
+    ordering = ("-pk",)
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_ordering(self, request: Request, queryset: QuerySet, view) -> Tuple[str]:
+        ordering = getattr(view, "keyset_ordering", None) or self.ordering
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        return tuple(ordering)
+
+    def get_page_size(self, request: Request) -> int:
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def decode_cursor(self, request: Request) -> Optional[Tuple[bool, List[Any]]]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            data = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            reverse, values = bool(data["r"]), data["v"]
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.keyset_ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return reverse, values
+
+    def encode_cursor(self, values: List[Any], reverse: bool) -> str:
+        data = json.dumps({"v": values, "r": int(reverse)}, cls=DjangoJSONEncoder)
+        return urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+    def _get_position(self, instance: Any) -> List[Any]:
+        position = []
+        for field in self.keyset_ordering:
+            value = instance
+            for attr in field.lstrip("-").split("__"):
+                value = value[attr] if isinstance(value, dict) else getattr(value, attr)
+            position.append(value.pk if isinstance(value, Model) else value)
+        return position
+
+    def _get_ordering_field(self, model: Type[Model], field: str) -> Optional[Field]:
+        model_field = None
+        for name in field.lstrip("-").split("__"):
+            if model is None:
+                return None
+            try:
+                model_field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                # annotations are filtered with the raw cursor value
+                return None
+            model = model_field.related_model
+        if model_field.is_relation:
+            model_field = model_field.target_field
+        return model_field
+
+    def clean_cursor_values(self, queryset: QuerySet, values: List[Any]) -> List[Any]:
+        """
+        Converts cursor values with the ordering fields, so tampered cursors are rejected
+        before those reach the database.
+
+        Args:
+            queryset (QuerySet) - paginated queryset
+            values (List[Any]) - decoded cursor values
+
+        Returns:
+            List of values converted to python types of the ordering fields
+        """
+        cleaned = []
+        for field, value in zip(self.keyset_ordering, values):
+            model_field = self._get_ordering_field(queryset.model, field)
+            try:
+                if model_field is not None:
+                    value = model_field.to_python(value)
+            except (TypeError, ValueError, DjangoValidationError):
+                raise NotFound(self.invalid_cursor_message)
+            if value is None:
+                raise NotFound(self.invalid_cursor_message)
+            cleaned.append(value)
+        return cleaned
+
+    def _get_keyset_filter(self, values: List[Any], reverse: bool) -> Q:
+        # (a > x) | (a = x & b > y) | (a = x & b = y & c > z) ...
+        keyset_filter = Q()
+        equal = {}
+        for field, value in zip(self.keyset_ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") != reverse else "gt"
+            keyset_filter |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return keyset_filter
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view=None
+    ) -> Optional[List[Any]]:
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.keyset_ordering = self.get_ordering(request, queryset, view)
+        cursor = self.decode_cursor(request)
+        reverse = cursor[0] if cursor else False
+
+        order_by = self.keyset_ordering
+        if reverse:
+            order_by = [
+                field[1:] if field.startswith("-") else f"-{field}"
+                for field in order_by
+            ]
+        queryset = queryset.order_by(*order_by)
+        if cursor:
+            values = self.clean_cursor_values(queryset, cursor[1])
+            try:
+                queryset = queryset.filter(self._get_keyset_filter(values, reverse))
+            except (TypeError, ValueError, DjangoValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        self.has_next = bool(cursor) if reverse else has_more
+        self.has_previous = has_more if reverse else bool(cursor)
+        self.cursor_values = cursor[1] if cursor else None
+        self.page = results
+        return results
+
+    def _get_link(self, values: List[Any], reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values, reverse)
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        if self.page:
+            return self._get_link(self._get_position(self.page[-1]), False)
+        return self._get_link(self.cursor_values, False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if self.page:
+            return self._get_link(self._get_position(self.page[0]), True)
+        return self._get_link(self.cursor_values, True)
+
+    def get_paginated_response(self, data: List[dict]) -> Response:
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema: List[dict]) -> dict:
+        """
+        Simple method to add pagination information to the schema.
+
+        Args:
+            schema (List[dict]) - list of schema items
+        Returns:
+            Dictionary with pagination information including examples
+        """
+        return {
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "nullable": True,
+                },
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "example": "http://api.example.org/accounts/?cursor=eyJ2IjogWzI1XSwgInIiOiAwfQ==",
+                },
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "example": "http://api.example.org/accounts/?cursor=eyJ2IjogWzI2XSwgInIiOiAxfQ==",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> List[dict]:
+        parameters = [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            }
+        ]
+        if self.page_size_query_param:
+            parameters.append(
+                {
+                    "name": self.page_size_query_param,
+                    "required": False,
+                    "in": "query",
+                    "description": self.page_size_query_description,
+                    "schema": {"type": "integer"},
+                }
+            )
+        return parameters
 
 
 class UnknownExceptionContentTypeError(Exception):
@@ -72,8 +518,73 @@ class UnknownExceptionContentTypeError(Exception):
 
 
 class GenericViewSet(viewsets.ViewSetMixin, GenericAPIView):
+    """
+    Generic viewset, which also supports `async def` actions.
+
+    If any of the routed actions is a coroutine function, the view returned by `as_view`
+    is async, so it runs under Django's async view stack.
+    Requests handled by sync actions are then processed in a thread.
+    For async actions authentication, permissions and throttling checks run in a thread,
+    while the action is awaited in the event loop.
+    """
+
     pagination_class = AudomaPagination
 
+    @classmethod
+    def as_view(cls, actions: dict = None, **initkwargs) -> Callable:
+        view = super().as_view(actions, **initkwargs)
+        if not any(
+            iscoroutinefunction(getattr(cls, action, None))
+            for action in (actions or {}).values()
+        ):
+            return view
+
+        sync_to_async = get_sync_to_async()
+
+        async def async_view(request: HttpRequest, *args, **kwargs) -> Response:
+            # `dispatch` returns coroutine for async actions
+            response = await sync_to_async(view)(request, *args, **kwargs)
+            if iscoroutine(response):
+                response = await response
+            return response
+
+        # keeps cls, initkwargs, actions and csrf_exempt set on the view
+        update_wrapper(async_view, view)
+        return async_view
+
+    def _get_async_handler(self, request: HttpRequest) -> Optional[Callable]:
+        method = request.method.lower()
+        if method not in self.http_method_names:
+            return None
+        handler = getattr(self, method, None)
+        return handler if iscoroutinefunction(handler) else None
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs) -> Any:
+        if self._get_async_handler(request) is not None:
+            return self.async_dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def async_dispatch(self, request: HttpRequest, *args, **kwargs) -> Response:
+        """
+        Async counterpart of `dispatch`, used if the handler is a coroutine function.
+        """
+        sync_to_async = get_sync_to_async()
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            handler = self._get_async_handler(request)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = await sync_to_async(self.handle_exception)(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
     def _parse_single_response_data_item(self, item):
         if isinstance(item, ErrorDetail):
             return str(item)
@@ -3,14 +3,20 @@ import random
 from decimal import Decimal
 from typing import (
     Any,
+    Dict,
+    Hashable,
     Type,
 )
 
 import exrex
+import phonenumbers
+from phonenumber_field.phonenumber import to_python
 
 from django.core import validators
 from django.utils import timezone
 
+from audoma.example_generators import generate_lorem_ipsum
+
 
 class DEFAULT:
     pass
@@ -20,8 +26,15 @@ class Example:
     """
     Class that represents an example for a field.
     It allows to add example to the field during initialization.
+
+    Note:
+        Example values are evaluated lazily, only when the documentation is generated.
+        Generated values are cached per example class, field class and
+        generation config returned by `get_generation_config`.
     """
 
+    _generated_values: Dict[Hashable, Any] = {}
+
     def __init__(self, field, example=DEFAULT) -> None:
         self.field = field
         self.example = example
@@ -29,18 +42,41 @@ class Example:
     def generate_value(self) -> Type[DEFAULT]:
         return DEFAULT
 
+    def get_generation_config(self) -> Hashable:
+        """
+        Returns field configuration which affects generated value.
+        """
+        return ()
+
+    def get_generated_value(self) -> Any:
+        key = (type(self), type(self.field), self.get_generation_config())
+        try:
+            return self._generated_values[key]
+        except KeyError:
+            value = self._generated_values[key] = self.generate_value()
+            return value
+        except TypeError:
+            # unhashable config, value can't be cached
+            return self.generate_value()
+
     def get_value(self) -> Any:
         if self.example is not DEFAULT:
             if callable(self.example):
                 return self.example()
             return self.example
-        return self.generate_value()
+        return self.get_generated_value()
 
     def to_representation(self, value) -> Any:
         return self.field.to_representation(value)
 
 
 class NumericExample(Example):
+    def get_generation_config(self) -> Hashable:
+        return tuple(
+            getattr(self.field, name, None)
+            for name in ("min_value", "max_value", "decimal_places", "max_digits")
+        )
+
     def generate_value(self) -> float:
         """
         Extracts information from the field and generates a random value
@@ -65,6 +101,13 @@ class NumericExample(Example):
 
 
 class RegexExample(Example):
+    def get_generation_config(self) -> Hashable:
+        return tuple(
+            validator.regex.pattern
+            for validator in self.field.validators
+            if isinstance(validator, validators.RegexValidator)
+        )
+
     def generate_value(self) -> str:
         """
         Extracts information from the field and generates a random value
@@ -108,6 +151,9 @@ class DateTimeExample(_DateRelatedExampleMixin, Example):
 
 
 class Base64Example(Example):
+    def get_generation_config(self) -> Hashable:
+        return getattr(self.field, "max_length", None)
+
     def generate_value(self) -> float:
         """
         Extracts information from the field and generates a random value
@@ -122,6 +168,13 @@ class Base64Example(Example):
 
 
 class RangeExample(Example):
+    def get_generation_config(self) -> Hashable:
+        child_field = getattr(self.field, "child", None)
+        if child_field is None:
+            return None
+        example = child_field.audoma_example_class(field=child_field)
+        return type(child_field), example.get_generation_config()
+
     def generate_value(self) -> float:
         """
         Extracts information from the field and generates a random value
@@ -142,3 +195,28 @@ class RangeExample(Example):
         )
         lower, upper = (upper, lower) if lower > upper else (lower, upper)
         return {"lower": lower, "upper": upper}
+
+
+class LoremIpsumExample(Example):
+    def get_generation_config(self) -> Hashable:
+        return getattr(self.field, "min_length", None), getattr(
+            self.field, "max_length", None
+        )
+
+    def generate_value(self) -> str:
+        """
+        Generates lorem ipsum text, fitting field's length limits.
+
+        Returns:
+            Random lorem ipsum string
+        """
+        min_length, max_length = self.get_generation_config()
+        return generate_lorem_ipsum(
+            min_length=20 if min_length is None else min_length,
+            max_length=80 if max_length is None else max_length,
+        )
+
+
+class PhoneNumberExample(Example):
+    def generate_value(self) -> str:
+        return str(to_python(phonenumbers.example_number(None)))
@@ -0,0 +1,270 @@
+import hashlib
+import multiprocessing
+import os
+import re
+from copy import deepcopy
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from drf_spectacular.drainage import (
+    GENERATOR_STATS,
+    warn,
+)
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.plumbing import (
+    ComponentRegistry,
+    ResolvedComponent,
+)
+from drf_spectacular.settings import spectacular_settings
+from rest_framework.request import Request
+
+from django.db import connections
+
+from audoma import settings as audoma_settings
+from audoma.plumbing import (
+    get_component_refs,
+    get_operation_fingerprint,
+    get_settings_fingerprint,
+    iter_component_closure,
+)
+
+
+class AudomaComponentRegistry(ComponentRegistry):
+    """
+    Component registry which allows `AudomaAutoSchema` to reuse operations
+    generated before, if the operation fingerprint has not changed.
+    Reused operations register the components those reference.
+    """
+
+    def __init__(
+        self, operation_cache: Dict[Tuple[str, str], Tuple[dict, list]]
+    ) -> None:
+        super().__init__()
+        self.operation_cache = operation_cache
+        self.used_operations = {}
+        self.settings_fingerprint = get_settings_fingerprint()
+
+    def get_cached_operation(self, fingerprint: str) -> Optional[dict]:
+        key = (self.settings_fingerprint, fingerprint)
+        cached = self.operation_cache.get(key)
+        if cached is None:
+            return None
+
+        self.used_operations[key] = cached
+        operation, components = cached
+        for component in components:
+            self.register_on_missing(self._copy_component(component))
+        return deepcopy(operation)
+
+    def store_operation(self, fingerprint: str, operation: dict) -> None:
+        components = [
+            self._copy_component(component)
+            for component in iter_component_closure(self, get_component_refs(operation))
+        ]
+        self.used_operations[(self.settings_fingerprint, fingerprint)] = (
+            deepcopy(operation),
+            components,
+        )
+
+    def _copy_component(self, component: ResolvedComponent) -> ResolvedComponent:
+        return ResolvedComponent(
+            name=component.name,
+            type=component.type,
+            schema=deepcopy(component.schema),
+            object=component.object,
+        )
+
+
+# state of the generator running parallel parse, inherited by forked worker processes
+_parallel_parse_state = None
+# database connections inherited by the worker process from the parent
+_inherited_connections = []
+
+
+def _init_parse_worker() -> None:
+    """
+    Detaches database connections inherited from the parent, so the worker opens its own ones.
+    Inherited connections are not closed, as it would end sessions of the parent,
+    those are kept referenced until the worker exits without finalizing them.
+    Warnings are collected silently, those are emitted by the parent.
+    """
+    for connection in connections.all():
+        if connection.connection is not None:
+            _inherited_connections.append(connection.connection)
+            connection.connection = None
+    GENERATOR_STATS.reset()
+    GENERATOR_STATS.silent = True
+
+
+def _parse_shard(shard: int) -> Tuple[list, list, list]:
+    generator, input_request, public, path_prefix, shards_count = _parallel_parse_state
+    operations, components = generator._parse_shard(
+        input_request, public, path_prefix, shard, shards_count
+    )
+    messages = [
+        (message, severity, count)
+        for severity, cache in [
+            ("warning", GENERATOR_STATS._warn_cache),
+            ("error", GENERATOR_STATS._error_cache),
+        ]
+        for message, count in cache.items()
+    ]
+    return operations, components, messages
+
+
+class SchemaComponentsConflict(Exception):
+    pass
+
+
+class AudomaSchemaGenerator(SchemaGenerator):
+    """
+    Schema generator which caches generated operations between schema generations.
+    Operation is generated again only if its fingerprint has changed, see `get_operation_fingerprint`.
+
+    If `workers` is greater than 1, operations are generated in a pool of forked processes.
+    Operations are merged in the endpoints order and components registries are merged,
+    so the result is the same as the serial one. If workers generate different schemas
+    for the same component, the schema is generated serially.
+    Schema is always generated serially inside of a database transaction.
+
+    Note:
+        Cache is kept in the process memory, it is not shared between processes.
+        Operations generated in parallel are not cached.
+    """
+
+    _operation_cache: Dict[Tuple[str, str], Tuple[dict, list]] = {}
+    workers = audoma_settings.SCHEMA_GENERATION_WORKERS
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.registry = AudomaComponentRegistry(self._operation_cache)
+
+    def parse(self, input_request: Request, public: bool) -> dict:
+        if self._can_parse_parallel():
+            try:
+                return self._parse_parallel(input_request, public)
+            except SchemaComponentsConflict as exc:
+                warn(f"{exc} Schema will be generated serially.")
+                self.registry = AudomaComponentRegistry(self._operation_cache)
+
+        result = super().parse(input_request, public)
+        # keep only operations which are still in use
+        type(self)._operation_cache = self.registry.used_operations
+        return result
+
+    def _can_parse_parallel(self) -> bool:
+        if self.workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return False
+        # workers can't see data of the pending transaction
+        return not any(connection.in_atomic_block for connection in connections.all())
+
+    def _get_path_prefix(self, endpoints: List[tuple]) -> str:
+        # follows path prefix estimation of the spectacular's SchemaGenerator.parse
+        if spectacular_settings.SCHEMA_PATH_PREFIX is not None:
+            return spectacular_settings.SCHEMA_PATH_PREFIX
+        if len(set([view.__class__ for _, _, _, view in endpoints])) > 1:
+            return re.escape(os.path.commonpath([path for path, _, _, _ in endpoints]))
+        return "/"
+
+    def _parse_shard(
+        self,
+        input_request: Request,
+        public: bool,
+        path_prefix: str,
+        shard: int,
+        shards_count: int,
+    ) -> Tuple[list, list]:
+        """
+        Generates operations of every `shards_count` endpoint, starting from `shard`.
+        Each endpoint is parsed separately, so operations can be merged in the endpoints order.
+
+        Returns: list of (index, path, method, operation) and list of (name, type, schema) components
+        """
+        # worker process is discarded after parsing, settings don't have to be restored
+        spectacular_settings.SCHEMA_PATH_PREFIX = path_prefix
+        endpoints = self.endpoints
+        operations = []
+        for index in range(shard, len(endpoints), shards_count):
+            self.endpoints = [endpoints[index]]
+            result = super().parse(input_request, public)
+            for path, path_operations in result.items():
+                for method, operation in path_operations.items():
+                    operations.append((index, path, method, operation))
+        components = [
+            (component.name, component.type, component.schema)
+            for component in self.registry._components.values()
+        ]
+        return operations, components
+
+    def _parse_parallel(self, input_request: Request, public: bool) -> dict:
+        global _parallel_parse_state
+
+        self._initialise_endpoints()
+        path_prefix = self._get_path_prefix(self._get_paths_and_endpoints())
+        shards_count = min(self.workers, len(self.endpoints)) or 1
+
+        _parallel_parse_state = (self, input_request, public, path_prefix, shards_count)
+        try:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(
+                shards_count, initializer=_init_parse_worker, maxtasksperchild=1
+            ) as pool:
+                shards = pool.map(_parse_shard, range(shards_count))
+        finally:
+            _parallel_parse_state = None
+
+        components = {}
+        operations = []
+        messages = []
+        for shard_operations, shard_components, shard_messages in shards:
+            operations.extend(shard_operations)
+            messages.extend(shard_messages)
+            for name, component_type, schema in shard_components:
+                key = (name, component_type)
+                if key in components and components[key] != schema:
+                    raise SchemaComponentsConflict(
+                        f"Component {component_type} {name} has been generated differently by workers."
+                    )
+                components[key] = schema
+
+        for message, severity, count in messages:
+            for _ in range(count):
+                GENERATOR_STATS.emit(message, severity)
+
+        for (name, component_type), schema in components.items():
+            self.registry.register_on_missing(
+                ResolvedComponent(
+                    name=name, type=component_type, schema=schema, object=name
+                )
+            )
+
+        result = {}
+        for _, path, method, operation in sorted(operations, key=lambda item: item[0]):
+            result.setdefault(path, {})
+            result[path][method] = operation
+        return result
+
+    def get_schema_fingerprint(
+        self, request: Request = None, public: bool = False
+    ) -> str:
+        """
+        Creates fingerprint of the whole schema, based on settings and fingerprints of all operations.
+
+        Returns: hex digest of the fingerprint
+        """
+        self._initialise_endpoints()
+        parts = [
+            get_settings_fingerprint(),
+            repr(public),
+            repr(self.api_version or getattr(request, "version", None)),
+        ]
+        for path, path_regex, method, view in self._get_paths_and_endpoints():
+            view.request = spectacular_settings.GET_MOCK_REQUEST(
+                method, path, view, request
+            )
+            parts.append(get_operation_fingerprint(view, path, path_regex, "", method))
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
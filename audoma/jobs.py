@@ -0,0 +1,319 @@
+"""
+This module is responsible for asynchronous bulk jobs.
+
+Bulk payloads which are too large to be processed within the request
+are stored as a job and processed by the bulk job backend.
+Job state is kept in the Django cache, so any backend which can run
+`run_bulk_job` with the job id may be plugged in with `AUDOMA_BULK_JOB_BACKEND`.
+The cache has to be shared between processes, process local caches are rejected
+unless `AUDOMA_BULK_JOB_ALLOW_LOCAL_CACHE` is set.
+"""
+
+import logging
+import threading
+import uuid
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+)
+
+from rest_framework import (
+    exceptions,
+    serializers,
+)
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.http import (
+    HttpRequest,
+    QueryDict,
+)
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from audoma import settings as audoma_settings
+
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUS_PENDING = "pending"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_FINISHED = "finished"
+JOB_STATUS_FAILED = "failed"
+
+JOB_STATUSES = [
+    JOB_STATUS_PENDING,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_FINISHED,
+    JOB_STATUS_FAILED,
+]
+
+# request meta copied to the job, so urls built by the worker point to the same host
+JOB_REQUEST_META = ["HTTP_HOST", "SERVER_NAME", "SERVER_PORT", "wsgi.url_scheme"]
+
+
+class BulkJobSerializer(serializers.Serializer):
+    id = serializers.CharField(read_only=True)
+    url = serializers.CharField(read_only=True)
+    status = serializers.ChoiceField(choices=JOB_STATUSES, read_only=True)
+    status_code = serializers.IntegerField(read_only=True, allow_null=True)
+    result = serializers.JSONField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    finished_at = serializers.DateTimeField(read_only=True, allow_null=True)
+
+
+class BulkJobStoreError(exceptions.APIException):
+    status_code = 503
+    default_detail = "Bulk job could not be stored."
+    default_code = "bulk_job_not_stored"
+
+
+class BulkJobStore:
+    """
+    Keeps bulk jobs in the Django cache.
+    The cache has to be shared by all of the server processes and the workers,
+    otherwise job status may be requested from a process which does not know the job.
+    `LocMemCache` is allowed only with `AUDOMA_BULK_JOB_ALLOW_LOCAL_CACHE`,
+    for single process deployments.
+    """
+
+    key_prefix = "audoma-bulk-job"
+
+    def __init__(self, cache_alias: str = None, timeout: int = None):
+        self.cache_alias = cache_alias or audoma_settings.BULK_JOB_CACHE
+        self.timeout = timeout or audoma_settings.BULK_JOB_TIMEOUT
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:{job_id}"
+
+    def validate(self) -> None:
+        """
+        Checks if the cache may be used to share jobs between processes.
+        """
+        cache = self.cache
+        if isinstance(cache, DummyCache):
+            raise ImproperlyConfigured(
+                f"Bulk jobs can't be stored in the dummy cache '{self.cache_alias}'."
+            )
+        if (
+            isinstance(cache, LocMemCache)
+            and not audoma_settings.BULK_JOB_ALLOW_LOCAL_CACHE
+        ):
+            raise ImproperlyConfigured(
+                f"Bulk jobs cache '{self.cache_alias}' is local to the process, "
+                "set AUDOMA_BULK_JOB_CACHE to a cache shared between processes or "
+                "AUDOMA_BULK_JOB_ALLOW_LOCAL_CACHE for single process deployments."
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.cache.get(self.get_key(job_id))
+
+    def save(self, job: Dict[str, Any]) -> None:
+        self.cache.set(self.get_key(job["id"]), job, self.timeout)
+
+    def create(self, job: Dict[str, Any]) -> None:
+        """
+        Stores the new job and checks if it has been stored.
+        Cache backends silently drop values exceeding their size limit,
+        so the payload could be lost without this check.
+        """
+        self.save(job)
+        if not self.cache.touch(self.get_key(job["id"]), self.timeout):
+            logger.error("Bulk job %s could not be stored in the cache.", job["id"])
+            raise BulkJobStoreError()
+
+
+class BaseBulkJobBackend:
+    """
+    Base class of bulk job backends.
+    Backends have to run `run_bulk_job` with the given job id, outside of the request.
+    """
+
+    def submit(self, job_id: str) -> Any:
+        raise NotImplementedError
+
+
+def _run_bulk_job_in_thread(job_id: str) -> None:
+    try:
+        run_bulk_job(job_id)
+    finally:
+        # connections are opened per thread, so those have to be closed by the worker
+        connections.close_all()
+
+
+class ThreadPoolBulkJobBackend(BaseBulkJobBackend):
+    """
+    Runs bulk jobs in a local thread pool of `AUDOMA_BULK_JOB_WORKERS` threads.
+    """
+
+    def __init__(self, max_workers: int = None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or audoma_settings.BULK_JOB_WORKERS,
+            thread_name_prefix="audoma-bulk-job",
+        )
+
+    def submit(self, job_id: str) -> Future:
+        return self.executor.submit(_run_bulk_job_in_thread, job_id)
+
+
+_backends: Dict[str, BaseBulkJobBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_bulk_job_backend(backend_path: str = None) -> BaseBulkJobBackend:
+    """
+    Returns instance of the bulk job backend, backends are created once per process.
+
+    Args:
+        * backend_path - import path of the backend class, defaults to `AUDOMA_BULK_JOB_BACKEND`
+
+    Returns: bulk job backend
+    """
+    backend_path = backend_path or audoma_settings.BULK_JOB_BACKEND
+    with _backends_lock:
+        backend = _backends.get(backend_path)
+        if backend is None:
+            backend = _backends[backend_path] = import_string(backend_path)()
+    return backend
+
+
+def get_bulk_job_store() -> BulkJobStore:
+    store = BulkJobStore()
+    store.validate()
+    return store
+
+
+def create_bulk_job(
+    view: Any, request: Request, get_url: Callable[[str], str]
+) -> Dict[str, Any]:
+    """
+    Creates and stores the job, which processes the request with the same view action.
+
+    Args:
+        * view - view instance handling the request
+        * request - request with the bulk payload
+        * get_url - returns url of the job status endpoint for the job id
+
+    Returns: stored job
+    """
+    job_id = uuid.uuid4().hex
+    user = getattr(request, "user", None)
+    job = {
+        "id": job_id,
+        "url": get_url(job_id),
+        "status": JOB_STATUS_PENDING,
+        "status_code": None,
+        "result": None,
+        "created_at": timezone.now(),
+        "finished_at": None,
+        "view": f"{type(view).__module__}.{type(view).__qualname__}",
+        "initkwargs": {
+            "basename": getattr(view, "basename", None),
+            "detail": getattr(view, "detail", None),
+        },
+        "action": view.action,
+        "kwargs": view.kwargs,
+        "method": request.method,
+        "path": request.path,
+        "query_string": request.META.get("QUERY_STRING", ""),
+        "meta": {
+            key: request.META[key] for key in JOB_REQUEST_META if key in request.META
+        },
+        "user_id": user.pk if getattr(user, "is_authenticated", False) else None,
+        "payload": request.data,
+    }
+    get_bulk_job_store().create(job)
+    return job
+
+
+def _get_job_user(job: Dict[str, Any]) -> Any:
+    from django.contrib.auth.models import AnonymousUser
+
+    if job["user_id"] is None:
+        return AnonymousUser()
+    user_model = get_user_model()
+    return user_model._default_manager.filter(pk=job["user_id"]).first() or (
+        AnonymousUser()
+    )
+
+
+def _build_job_view(job: Dict[str, Any]) -> Any:
+    view = import_string(job["view"])(**job["initkwargs"])
+    view.action_map = {job["method"].lower(): job["action"]}
+    view.args = ()
+    view.kwargs = job["kwargs"]
+    view.format_kwarg = None
+    view.headers = {}
+    view.running_bulk_job = True
+
+    http_request = HttpRequest()
+    http_request.method = job["method"]
+    http_request.path = http_request.path_info = job["path"]
+    http_request.META.update(job["meta"])
+    http_request.META["QUERY_STRING"] = job["query_string"]
+    http_request.GET = QueryDict(job["query_string"])
+
+    request = view.initialize_request(http_request)
+    # the payload has been already parsed and the user authenticated by the original request
+    request._full_data = job["payload"]
+    request.user = _get_job_user(job)
+    request.auth = None
+    view.request = request
+    view.action = job["action"]
+    return view
+
+
+def run_bulk_job(job_id: str) -> None:
+    """
+    Processes the stored job with the view action which has created it.
+    The job result is the response data and status code of the action.
+
+    Args:
+        * job_id - id of the job
+    """
+    store = get_bulk_job_store()
+    job = store.get(job_id)
+    if job is None:
+        logger.warning("Bulk job %s does not exist or has expired.", job_id)
+        return
+
+    job["status"] = JOB_STATUS_RUNNING
+    store.save(job)
+    try:
+        view = _build_job_view(job)
+        handler = getattr(view, job["action"])
+        try:
+            response = handler(view.request, **job["kwargs"])
+        except Exception as exc:
+            response = view.handle_exception(exc)
+        job["status_code"] = response.status_code
+        job["result"] = response.data
+        job["status"] = (
+            JOB_STATUS_FINISHED if response.status_code < 400 else JOB_STATUS_FAILED
+        )
+    except Exception:
+        logger.exception("Bulk job %s has failed.", job_id)
+        job["status_code"] = 500
+        job["result"] = {
+            "errors": {api_settings.NON_FIELD_ERRORS_KEY: ["Bulk job has failed."]}
+        }
+        job["status"] = JOB_STATUS_FAILED
+    finally:
+        job["finished_at"] = timezone.now()
+        store.save(job)
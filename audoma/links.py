@@ -13,9 +13,11 @@ from dataclasses import dataclass
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     Type,
     Union,
 )
+from weakref import WeakKeyDictionary
 
 from drf_spectacular.plumbing import force_instance
 from rest_framework.serializers import BaseSerializer
@@ -27,17 +29,16 @@ from django.urls import (
 from django.urls.resolvers import get_resolver
 
 
-def get_endpoint_pattern(endpoint_name: str, urlconf=None) -> str:
+def _build_endpoint_patterns_index(resolver: URLResolver) -> Dict[str, str]:
     """
-    This methods retrieves url pattern of the endpoint by given endpoint_name.
+    Flattens all patterns reachable from the given resolver and maps
+    each pattern name to the first pattern which is not a format suffix pattern.
 
     Args:
-        * endpoint_name: name of the endpoint
-        * urlconf: urlconf to use
+        * resolver: root resolver of the urlconf
 
-    Returns: url pattern of the endpoint
+    Returns: dictionary mapping endpoint names to url patterns
     """
-    resolver = get_resolver(urlconf)
     patterns = resolver.url_patterns
     new_patterns = []
     resolvers = []
@@ -57,13 +58,53 @@ def get_endpoint_pattern(endpoint_name: str, urlconf=None) -> str:
                 continue
             new_patterns.append(pattern)
 
-    possibilities = list(filter(lambda p: p.name == endpoint_name, new_patterns))
-
-    for p in possibilities:
+    index = {}
+    for p in new_patterns:
+        if not p.name or p.name in index:
+            continue
         if "format" not in p.pattern.regex.pattern:
-            return str(p.pattern)
+            index[p.name] = str(p.pattern)
+
+    return index
+
+
+# get_resolver returns a new resolver each time the urlconf changes,
+# so keying on the resolver invalidates stale indexes automatically.
+_endpoint_patterns_indexes = WeakKeyDictionary()
+
+
+def get_endpoint_patterns_index(urlconf=None) -> Dict[str, str]:
+    """
+    Returns the endpoint name to url pattern index for the given urlconf.
+    The index is built once per urlconf and reused by subsequent lookups.
+
+    Args:
+        * urlconf: urlconf to use
+
+    Returns: dictionary mapping endpoint names to url patterns
+    """
+    resolver = get_resolver(urlconf)
+    index = _endpoint_patterns_indexes.get(resolver)
+    if index is None:
+        index = _build_endpoint_patterns_index(resolver)
+        _endpoint_patterns_indexes[resolver] = index
+    return index
 
-    raise NoReverseMatch(f"There is no pattern with name {endpoint_name}")
+
+def get_endpoint_pattern(endpoint_name: str, urlconf=None) -> str:
+    """
+    This methods retrieves url pattern of the endpoint by given endpoint_name.
+
+    Args:
+        * endpoint_name: name of the endpoint
+        * urlconf: urlconf to use
+
+    Returns: url pattern of the endpoint
+    """
+    try:
+        return get_endpoint_patterns_index(urlconf)[endpoint_name]
+    except KeyError:
+        raise NoReverseMatch(f"There is no pattern with name {endpoint_name}")
 
 
 @dataclass
@@ -106,12 +147,17 @@ class ChoicesOptionsLink:
     def formatted_display_field(self) -> str:
         return self._format_param_field(self.display_field)
 
-    def get_url_pattern(self) -> str:
+    def get_url_pattern(self, urlconf=None) -> str:
         """
         Returns formatted url pattern of the linked view.
+
+        Args:
+            * urlconf: urlconf to use
+
+        Returns: formatted url pattern
         """
         pattern = (
-            get_endpoint_pattern(self.viewname)
+            get_endpoint_pattern(self.viewname, urlconf=urlconf)
             .replace("$", "")
             .replace("^", "/")
             .replace("/", "~1")
@@ -132,6 +178,26 @@ class ChoicesOptionsLink:
 
 
 class ChoicesOptionsLinkSchemaGenerator:
+    """
+    Generates x-choices link schemas.
+    Serializer fields are validated once per serializer class and generated schemas
+    are memoized per link data, separately for each urlconf.
+    """
+
+    def __init__(self):
+        self._serializer_field_names: Dict[Type[BaseSerializer], FrozenSet[str]] = {}
+        self._schemas = WeakKeyDictionary()
+
+    def _get_serializer_field_names(
+        self, serializer_class: Type[BaseSerializer]
+    ) -> FrozenSet[str]:
+        field_names = self._serializer_field_names.get(serializer_class)
+        if field_names is None:
+            serializer = force_instance(serializer_class)
+            field_names = frozenset(serializer.fields.keys())
+            self._serializer_field_names[serializer_class] = field_names
+        return field_names
+
     def _process_link(
         self, link: Union[ChoicesOptionsLink, Dict[str, Any]]
     ) -> ChoicesOptionsLink:
@@ -144,9 +210,10 @@ class ChoicesOptionsLinkSchemaGenerator:
                     from object of type {type(link)}"
             )
 
-        serializer = force_instance(link.serializer_class)
         # serializer must own defined field
-        if not serializer.fields.get(link.field_name, None):
+        if link.field_name not in self._get_serializer_field_names(
+            link.serializer_class
+        ):
             raise AttributeError(
                 f"Serializer class: {link.serializer_class} does not have field: {link.field_name}"
             )
@@ -171,10 +238,20 @@ class ChoicesOptionsLinkSchemaGenerator:
 
         link = self._process_link(link)
 
-        schema = {
-            "operationRef": link.get_url_pattern(),
-            # "parameters": "",
-            "value": link.formatted_value_field,
-            "display": link.formatted_display_field,
-        }
-        return schema
+        schemas = self._schemas.setdefault(get_resolver(), {})
+        key = (
+            link.serializer_class,
+            link.field_name,
+            link.viewname,
+            link.value_field,
+            link.display_field,
+        )
+        schema = schemas.get(key)
+        if schema is None:
+            schema = schemas[key] = {
+                "operationRef": link.get_url_pattern(),
+                # "parameters": "",
+                "value": link.formatted_value_field,
+                "display": link.formatted_display_field,
+            }
+        return dict(schema)
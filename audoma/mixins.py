@@ -7,7 +7,9 @@ from audoma.examples import (
     DateExample,
     DateTimeExample,
     Example,
+    LoremIpsumExample,
     NumericExample,
+    PhoneNumberExample,
     RangeExample,
     RegexExample,
     TimeExample,
@@ -30,6 +32,17 @@ class ExampleMixin:
     def __init__(self, *args, example=DEFAULT, **kwargs) -> None:
         self.audoma_example = self.audoma_example_class(self, example)
         super().__init__(*args, **kwargs)
+
+    def set_example_override(self) -> None:
+        """
+        Evaluates the example and sets it as the field documentation override.
+        This is called by the schema generator, so examples are not generated
+        for serializers used at runtime.
+        """
+        annotation = self.__dict__.get("_spectacular_annotation", {})
+        if "field" in annotation and not isinstance(annotation["field"], dict):
+            # field documentation has been overridden with a field or a type
+            return
         example = self.audoma_example.get_value()
         if example is not DEFAULT:
             has_annotation = (
@@ -66,6 +79,18 @@ class RegexExampleMixin(ExampleMixin):
     audoma_example_class = RegexExample
 
 
+class LoremIpsumExampleMixin(ExampleMixin):
+    """
+    A mixin class that adds lorem ipsum example to the field in documentation for text fields
+    """
+
+    audoma_example_class = LoremIpsumExample
+
+
+class PhoneNumberExampleMixin(ExampleMixin):
+    audoma_example_class = PhoneNumberExample
+
+
 class Base64ExampleMixin(ExampleMixin):
     audoma_example_class = Base64Example
 
@@ -34,15 +34,21 @@ from audoma.decorators import SerializersConfig
 from audoma.drf.generics import GenericAPIView as AudomaGenericAPIView
 from audoma.drf.serializers import BulkSerializerMixin
 from audoma.drf.validators import ExclusiveFieldsValidator
+from audoma.jobs import BulkJobSerializer
 from audoma.links import (
     ChoicesOptionsLink,
     ChoicesOptionsLinkSchemaGenerator,
 )
-from audoma.plumbing import create_choices_enum_description
+from audoma.mixins import ExampleMixin
+from audoma.plumbing import (
+    create_choices_enum_description,
+    get_operation_fingerprint,
+)
 
 
 class AudomaAutoSchema(AutoSchema):
     choice_link_schema_generator = ChoicesOptionsLinkSchemaGenerator()
+    _permissions_descriptions: typing.Dict[typing.Hashable, str] = {}
 
     def _handle_permission(
         self,
@@ -104,11 +110,62 @@ class AudomaAutoSchema(AutoSchema):
 
         return permissions
 
+    def _get_permission_key(
+        self,
+        permission_class: typing.Union[
+            OperandHolder, SingleOperandHolder, BasePermission
+        ],
+    ) -> typing.Optional[typing.Hashable]:
+        """
+        Builds structural key of the permission expression.
+        Keys are equal for equally composed AND/OR/NOT trees of the same permission classes.
+
+        Args:
+            * permission_class - permission class or composed permission operand holder
+
+        Returns: hashable key or None if the description depends on the view,
+            which is the case if any permission class defines `get_description`.
+        """
+        if isinstance(permission_class, OperandHolder):
+            op1_key = self._get_permission_key(permission_class.op1_class)
+            op2_key = self._get_permission_key(permission_class.op2_class)
+            if op1_key is None or op2_key is None:
+                return None
+            return (permission_class.operator_class, op1_key, op2_key)
+        elif isinstance(permission_class, SingleOperandHolder):
+            op1_key = self._get_permission_key(permission_class.op1_class)
+            if op1_key is None:
+                return None
+            return (permission_class.operator_class, op1_key)
+        elif hasattr(permission_class, "get_description"):
+            return None
+        return permission_class
+
     def _get_permissions_description(self) -> str:
+        """
+        Returns rendered permissions description of the view.
+        Descriptions are cached per permission classes expression,
+        unless any of the permission classes describes itself with `get_description`.
+        """
+        permission_classes = getattr(self.view, "permission_classes", [])
+        keys = tuple(
+            self._get_permission_key(permission_class)
+            for permission_class in permission_classes
+        )
+        if None in keys:
+            return self._render_permissions_description(permission_classes)
+
+        description = self._permissions_descriptions.get(keys)
+        if description is None:
+            description = self._render_permissions_description(permission_classes)
+            self._permissions_descriptions[keys] = description
+        return description
+
+    def _render_permissions_description(self, permission_classes: list) -> str:
         permissions = {}
         operations = []
 
-        for permission_class in getattr(self.view, "permission_classes", []):
+        for permission_class in permission_classes:
             if operations:
                 operations.append("&")
             permissions.update(self._handle_permission(permission_class, operations))
@@ -247,6 +304,9 @@ class AudomaAutoSchema(AutoSchema):
         self, serializer_type: str = "collect"
     ) -> typing.Union[BaseSerializer, typing.Type[BaseSerializer]]:
         view = self.view
+        if getattr(view, "action", None) == "bulk_job_status":
+            # bulk job status endpoint is added to the viewset by `BulkJobMixin`
+            return BulkJobSerializer()
         try:
             if isinstance(view, AudomaGenericAPIView):
                 action_serializers = self._extract_audoma_action_operations(
@@ -322,6 +382,26 @@ class AudomaAutoSchema(AutoSchema):
                 return choices
         return
 
+    def _get_operation_serializer(
+        self, serializer_type: str
+    ) -> typing.Union[BaseSerializer, typing.Dict]:
+        """
+        Returns serializer instance for the current operation.
+        During `get_operation` resolved serializers are cached per view, method and serializer type,
+        so those are not resolved again for each mapped field.
+        """
+        cache = getattr(self, "_operation_serializers", None)
+        key = (id(self.view), getattr(self, "method", None), serializer_type)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        serializer = force_instance(
+            self._get_serializer(serializer_type=serializer_type)
+        )
+        if cache is not None:
+            cache[key] = serializer
+        return serializer
+
     def _map_serializer_field(
         self, field: Field, direction: str, bypass_extensions=False
     ) -> dict:
@@ -330,8 +410,7 @@ class AudomaAutoSchema(AutoSchema):
         it gets updated instead of being overriden
         """
         serializer_type = "collect" if direction == "request" else "result"
-        serializer = self._get_serializer(serializer_type=serializer_type)
-        serializer = force_instance(serializer)
+        serializer = self._get_operation_serializer(serializer_type)
 
         if (
             hasattr(serializer, "Meta")
@@ -341,6 +420,9 @@ class AudomaAutoSchema(AutoSchema):
             field.read_only = False
             field.required = True
 
+        if isinstance(field, ExampleMixin):
+            field.set_example_override()
+
         has_annotation = (
             hasattr(field, "_spectacular_annotation")
             and "field" in field._spectacular_annotation
@@ -378,6 +460,77 @@ class AudomaAutoSchema(AutoSchema):
             schema = {"oneOf": [build_array_type(schema), schema]}
         return schema, request_body_required
 
+    def _build_bulk_response_schema(self, schema: dict) -> dict:
+        """
+        Builds schema of the bulk response.
+        If the view processes bulk payloads in chunks, the response holds status of each item.
+
+        Args:
+            * schema - schema of the single item
+
+        Returns: bulk response schema
+        """
+        if not getattr(self.view, "bulk_chunk_size", None):
+            return build_array_type(schema)
+
+        return {
+            "type": "object",
+            "properties": {
+                "results": build_array_type(
+                    {
+                        "type": "object",
+                        "properties": {
+                            "status": {
+                                "type": "string",
+                                "enum": [
+                                    self.view.BULK_STATUS_SUCCESS,
+                                    self.view.BULK_STATUS_ERROR,
+                                ],
+                            },
+                            "result": schema,
+                            "errors": {"type": "object", "additionalProperties": {}},
+                        },
+                        "required": ["status"],
+                    }
+                )
+            },
+            "required": ["results"],
+        }
+
+    def _get_response_bodies(self) -> dict:
+        responses = super()._get_response_bodies()
+        bulk_actions = ["create", "bulk_update", "partial_bulk_update"]
+        if (
+            getattr(self.view, "bulk_chunk_size", None)
+            and getattr(self.view, "action", None) in bulk_actions
+            and self.method in ["POST", "PUT", "PATCH"]
+        ):
+            success_code = next(
+                (code for code in ["200", "201"] if code in responses), None
+            )
+            if success_code:
+                responses["207"] = dict(
+                    responses[success_code],
+                    description="Only some of the items have been saved.",
+                )
+        if (
+            getattr(self.view, "bulk_job_threshold", None) is not None
+            and getattr(self.view, "action", None) in bulk_actions
+            and self.method in ["POST", "PUT", "PATCH"]
+        ):
+            component = self.resolve_serializer(BulkJobSerializer, "response")
+            responses["202"] = {
+                "content": {"application/json": {"schema": component.ref}},
+                "headers": {
+                    "Location": {
+                        "schema": {"type": "string"},
+                        "description": "Url of the bulk job status.",
+                    }
+                },
+                "description": "Bulk job has been accepted for processing.",
+            }
+        return responses
+
     def _get_response_for_code(self, serializer, status_code, media_types=None):
         schema_resp = super()._get_response_for_code(
             serializer, status_code, media_types
@@ -386,13 +539,15 @@ class AudomaAutoSchema(AutoSchema):
         if self.is_bulk:
             for media_type in schema_resp["content"]:
                 schema = schema_resp["content"][media_type]["schema"]
-                schema_resp["content"][media_type]["schema"] = build_array_type(schema)
+                schema_resp["content"][media_type][
+                    "schema"
+                ] = self._build_bulk_response_schema(schema)
 
         if isinstance(serializer, BulkSerializerMixin) and self.view.action == "create":
             for media_type in schema_resp["content"]:
                 schema = schema_resp["content"][media_type]["schema"]
                 schema_resp["content"][media_type]["schema"] = {
-                    "oneOf": [build_array_type(schema), schema]
+                    "oneOf": [self._build_bulk_response_schema(schema), schema]
                 }
         return schema_resp
 
@@ -474,4 +629,23 @@ class AudomaAutoSchema(AutoSchema):
         ]:
             self.is_bulk = True
 
-        return super().get_operation(path, path_regex, path_prefix, method, registry)
+        fingerprint = None
+        if callable(getattr(registry, "get_cached_operation", None)):
+            fingerprint = get_operation_fingerprint(
+                self.view, path, path_regex, path_prefix, method
+            )
+            operation = registry.get_cached_operation(fingerprint)
+            if operation is not None:
+                return operation
+
+        self._operation_serializers = {}
+        try:
+            operation = super().get_operation(
+                path, path_regex, path_prefix, method, registry
+            )
+        finally:
+            self._operation_serializers = None
+
+        if fingerprint is not None and operation:
+            registry.store_operation(fingerprint, operation)
+        return operation
@@ -1,11 +1,17 @@
+import hashlib
+from inspect import isclass
 from typing import (
+    Any,
+    Iterable,
     List,
+    Set,
     Tuple,
     Type,
     Union,
 )
 
 from drf_spectacular.drainage import cache
+from drf_spectacular.settings import spectacular_settings
 from rest_framework import (
     generics,
     mixins,
@@ -14,6 +20,12 @@ from rest_framework import (
     viewsets,
 )
 
+from django.conf import settings as project_settings
+from django.core.exceptions import EmptyResultSet
+from django.db.models import QuerySet
+from django.utils import translation
+
+from audoma import settings as audoma_settings
 from audoma.drf import (
     generics as audoma_generics,
     mixins as audoma_mixins,
@@ -62,3 +74,203 @@ def create_choices_enum_description(choices: Union[dict, List[Tuple]], field_nam
     for key, val in choices.items():
         description += f" * `{key}` - {val}\n"
     return description
+
+
+def _describe(obj: Any) -> str:
+    if isclass(obj):
+        # id distinguishes classes redefined with the same name
+        return f"{obj.__module__}.{obj.__qualname__}:{id(obj)}"
+    return repr(obj)
+
+
+def _describe_queryset(queryset: QuerySet) -> str:
+    try:
+        query = str(queryset.query)
+    except EmptyResultSet:
+        query = "<empty>"
+    return f"QuerySet({queryset.model._meta.label}, {query})"
+
+
+def _describe_collection(value: Union[list, tuple, set, frozenset, dict]) -> str:
+    if isinstance(value, dict):
+        items = [
+            f"{_describe_value(key)}: {_describe_value(item)}"
+            for key, item in value.items()
+        ]
+        return f"{{{', '.join(items)}}}"
+    items = [_describe_value(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        items.sort()
+    return f"{type(value).__name__}({', '.join(items)})"
+
+
+def _describe_value(value: Any) -> str:
+    """
+    Describes declared field kwargs and Meta attributes by their structure.
+    Values are never evaluated, so querysets are not run and the description
+    does not depend on the database content.
+    """
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return repr(value)
+    if isclass(value):
+        return _describe(value)
+    if isinstance(value, QuerySet):
+        return _describe_queryset(value)
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        return _describe_collection(value)
+    if callable(getattr(value, "deconstruct", None)):
+        # validators and other deconstructible objects are described by their arguments
+        try:
+            path, args, kwargs = value.deconstruct()
+        except ValueError:
+            pass
+        else:
+            return f"{path}({_describe_value(args)}, {_describe_value(kwargs)})"
+    value_type = type(value)
+    return f"{value_type.__module__}.{value_type.__qualname__}"
+
+
+def _describe_serializer(serializer_class: Any) -> List[str]:
+    if not (
+        isclass(serializer_class)
+        and issubclass(serializer_class, serializers.BaseSerializer)
+    ):
+        return [repr(serializer_class)]
+
+    description = [_describe(serializer_class)]
+    for name, field in getattr(serializer_class, "_declared_fields", {}).items():
+        description.append(
+            f"{name}={_describe(type(field))}"
+            f"{_describe_value(field._args)}{_describe_value(field._kwargs)}"
+        )
+    meta = getattr(serializer_class, "Meta", None)
+    if meta is not None:
+        description.append(
+            _describe_value(
+                {
+                    key: value
+                    for key, value in vars(meta).items()
+                    if not key.startswith("__")
+                }
+            )
+        )
+    return description
+
+
+def get_view_serializers(view: views.APIView) -> List[Any]:
+    """
+    Returns serializer classes which may be used by the view, without instantiating those.
+    """
+    try:
+        if isinstance(view, audoma_generics.GenericAPIView):
+            return [
+                view.get_serializer_class(serializer_type="collect"),
+                view.get_serializer_class(serializer_type="result"),
+            ]
+        if callable(getattr(view, "get_serializer_class", None)):
+            return [view.get_serializer_class()]
+    except Exception:
+        pass
+    return [getattr(view, "serializer_class", None)]
+
+
+def get_operation_fingerprint(
+    view: views.APIView, path: str, path_regex: str, path_prefix: str, method: str
+) -> str:
+    """
+    Creates fingerprint of the inputs used to generate the operation schema.
+    It covers the view class, its action with audoma_action config,
+    serializer classes with declared fields and Meta, filters, pagination and permissions.
+
+    Returns: hex digest of the fingerprint
+    """
+    action = getattr(view, "action", None)
+    action_function = getattr(view, action, None) if action else None
+    parts = [
+        path,
+        path_regex,
+        path_prefix,
+        method,
+        _describe(type(view)),
+        repr(action),
+        repr(getattr(action_function, "_audoma", None)),
+        repr(getattr(action_function, "kwargs", None)),
+        repr(getattr(action_function, "_spectacular_annotation", None)),
+        repr(getattr(view, "_spectacular_annotation", None)),
+        repr([_describe(c) for c in getattr(view, "permission_classes", [])]),
+        repr([_describe(c) for c in getattr(view, "filter_backends", [])]),
+        _describe(getattr(view, "filterset_class", None)),
+        _describe(getattr(view, "pagination_class", None)),
+        repr(getattr(view, "bulk_chunk_size", None)),
+        repr(getattr(view, "bulk_job_threshold", None)),
+    ]
+    for serializer_class in get_view_serializers(view):
+        parts.extend(_describe_serializer(serializer_class))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_settings_fingerprint() -> str:
+    """
+    Creates fingerprint of the settings which affect the whole schema.
+
+    Returns: hex digest of the fingerprint
+    """
+    parts = [
+        repr(getattr(project_settings, "SPECTACULAR_SETTINGS", {})),
+        repr(getattr(project_settings, "REST_FRAMEWORK", {})),
+        repr(audoma_settings.COMMON_API_ERRORS),
+        repr(getattr(project_settings, "COMMON_API_ERRORS", [])),
+        repr(audoma_settings.WRAP_RESULT_SERIALIZER),
+        repr(spectacular_settings.SCHEMA_PATH_PREFIX),
+        repr(translation.get_language()),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_component_refs(operation: Any) -> Set[Tuple[str, str]]:
+    """
+    Collects (name, type) keys of the components referenced in the given schema part.
+    Security schemes used by the operation are included as well.
+    """
+    refs = set()
+    stack = [operation]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            ref = item.get("$ref")
+            if (
+                isinstance(ref, str)
+                and ref.startswith("#/components/")
+                and ref.count("/") >= 3
+            ):
+                _, _, component_type, name = ref.split("/", 3)
+                refs.add((name, component_type))
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+
+    if isinstance(operation, dict):
+        for requirement in operation.get("security", []):
+            refs.update((name, "securitySchemes") for name in requirement)
+    return refs
+
+
+def iter_component_closure(
+    registry: Any, refs: Iterable[Tuple[str, str]]
+) -> Iterable[Any]:
+    """
+    Yields components for given keys, along with all components those reference.
+    """
+    seen = set()
+    stack = list(refs)
+    while stack:
+        key = stack.pop()
+        if key in seen:
+            continue
+        seen.add(key)
+        try:
+            component = registry[key]
+        except KeyError:
+            continue
+        yield component
+        stack.extend(get_component_refs(component.schema) - seen)
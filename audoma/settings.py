@@ -6,6 +6,16 @@ from django.http import Http404
 
 
 WRAP_RESULT_SERIALIZER = getattr(settings, "AUDOMA_WRAP_RESULT_SERIALIZER", False)
+SCHEMA_GENERATION_WORKERS = getattr(settings, "AUDOMA_SCHEMA_GENERATION_WORKERS", 1)
+BULK_JOB_BACKEND = getattr(
+    settings, "AUDOMA_BULK_JOB_BACKEND", "audoma.jobs.ThreadPoolBulkJobBackend"
+)
+BULK_JOB_WORKERS = getattr(settings, "AUDOMA_BULK_JOB_WORKERS", 4)
+BULK_JOB_CACHE = getattr(settings, "AUDOMA_BULK_JOB_CACHE", "default")
+BULK_JOB_TIMEOUT = getattr(settings, "AUDOMA_BULK_JOB_TIMEOUT", 60 * 60 * 24)
+BULK_JOB_ALLOW_LOCAL_CACHE = getattr(
+    settings, "AUDOMA_BULK_JOB_ALLOW_LOCAL_CACHE", False
+)
 settings.SPECTACULAR_SETTINGS[
     "GET_LIB_DOC_EXCLUDES"
 ] = "audoma.plumbing.get_lib_doc_excludes_audoma"
@@ -0,0 +1,44 @@
+from unittest import mock
+
+from rest_framework.fields import IntegerField
+from rest_framework.test import APITestCase
+
+from audoma.drf import serializers
+from audoma.drf.decorators import document_and_format
+
+
+class DocumentAndFormatTestCase(APITestCase):
+    def setUp(self):
+        class ExampleSerializer(serializers.Serializer):
+            total = serializers.SerializerMethodField()
+
+            @document_and_format(IntegerField)
+            def get_total(self, obj):
+                return obj or None
+
+        self.serializer_class = ExampleSerializer
+
+    def test_formatter_created_once_per_serializer(self):
+        with mock.patch.object(
+            IntegerField, "__init__", autospec=True, side_effect=IntegerField.__init__
+        ) as field_init:
+            data = self.serializer_class(["1", "2", "3"], many=True).data
+        self.assertEqual(data, [{"total": 1}, {"total": 2}, {"total": 3}])
+        self.assertEqual(field_init.call_count, 1)
+
+    def test_formatter_bound_to_parent(self):
+        serializer = self.serializer_class(["1"], many=True)
+        serializer.data
+        formatters = serializer.child._document_and_format_fields
+        (formatter,) = formatters.values()
+        self.assertIs(formatter.parent, serializer.child)
+
+        other_serializer = self.serializer_class("2")
+        self.assertEqual(other_serializer.data, {"total": 2})
+        self.assertIsNot(
+            next(iter(other_serializer._document_and_format_fields.values())),
+            formatter,
+        )
+
+    def test_none_not_formatted(self):
+        self.assertEqual(self.serializer_class("").data, {"total": None})
@@ -1,8 +1,17 @@
+from copy import deepcopy
+from types import SimpleNamespace
+from unittest import mock
+
+from drf_spectacular.drainage import get_override
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.fields import CharField
 from rest_framework.serializers import ValidationError
 from rest_framework.test import APITestCase
 
+from audoma.drf import (
+    fields as audoma_fields,
+    serializers as audoma_serializers,
+)
 from audoma.drf.fields import SerializerMethodField as AudomaSerializerMethodField
 
 
@@ -87,3 +96,130 @@ class SerializerMethodFieldTestCase(APITestCase):
             field.to_internal_value(object())
         except ValidationError as e:
             self.assertEqual(e.detail[0], ErrorDetail("Not a valid string.", "invalid"))
+
+    def test_validation_delegated_to_field(self):
+        child = CharField(max_length=5)
+        field = AudomaSerializerMethodField(field=child, writable=True)
+        self.assertIs(
+            AudomaSerializerMethodField.__getattribute__, object.__getattribute__
+        )
+        self.assertIs(field.validators, child.validators)
+        for name in ["get_validators", "run_validators", "validate_empty_values"]:
+            self.assertEqual(getattr(field, name), getattr(child, name))
+
+        copied_field = deepcopy(field)
+        self.assertIsNot(copied_field.field, child)
+        self.assertEqual(copied_field.run_validators, copied_field.field.run_validators)
+
+    def test_validation_not_delegated_without_field(self):
+        field = AudomaSerializerMethodField()
+        self.assertEqual(field.validators, [])
+        self.assertNotIn("run_validators", field.__dict__)
+
+    def _get_cached_serializer_class(self, cache):
+        class PricingSerializer(audoma_serializers.Serializer):
+            price = AudomaSerializerMethodField(method_name="get_pricing", cache=cache)
+            currency = AudomaSerializerMethodField(
+                method_name="get_pricing", field=CharField(), cache=cache
+            )
+            calls = []
+
+            def get_pricing(self, obj):
+                self.calls.append(obj)
+                return obj["price"]
+
+        return PricingSerializer
+
+    def test_cached_method_called_once_per_object(self):
+        serializer_class = self._get_cached_serializer_class(cache=True)
+        rows = [{"price": 1}, {"price": 2}]
+        data = serializer_class(rows, many=True).data
+        self.assertEqual(
+            data, [{"price": 1, "currency": "1"}, {"price": 2, "currency": "2"}]
+        )
+        self.assertEqual(serializer_class.calls, rows)
+
+        serializer_class(rows, many=True).data
+        self.assertEqual(len(serializer_class.calls), 4)
+
+    def test_cached_method_memo_cleared_after_rendering(self):
+        serializer_class = self._get_cached_serializer_class(cache=True)
+        row = {"price": 1}
+        serializer = serializer_class(many=True)
+        self.assertEqual(
+            serializer.to_representation([row]), [{"price": 1, "currency": "1"}]
+        )
+        self.assertNotIn("_method_field_memo", serializer.__dict__)
+
+        row["price"] = 2
+        self.assertEqual(
+            serializer.to_representation([row]), [{"price": 2, "currency": "2"}]
+        )
+        self.assertEqual(len(serializer_class.calls), 2)
+
+    def test_not_cached_method_called_per_field(self):
+        serializer_class = self._get_cached_serializer_class(cache=False)
+        serializer_class([{"price": 1}], many=True).data
+        self.assertEqual(len(serializer_class.calls), 2)
+
+
+class BatchSerializerMethodFieldTestCase(APITestCase):
+    def setUp(self):
+        class PriceSerializer(audoma_serializers.Serializer):
+            price = audoma_fields.BatchSerializerMethodField(field=CharField())
+            calls = []
+
+            def get_price(self, objs):
+                self.calls.append(objs)
+                return {obj.pk: obj.pk * 10 for obj in objs}
+
+        self.serializer_class = PriceSerializer
+        self.objs = [SimpleNamespace(pk=pk) for pk in range(1, 4)]
+
+    def test_method_called_once_for_list(self):
+        data = self.serializer_class(self.objs, many=True).data
+        self.assertEqual(data, [{"price": "10"}, {"price": "20"}, {"price": "30"}])
+        self.assertEqual(self.serializer_class.calls, [self.objs])
+
+    def test_method_called_with_single_object(self):
+        data = self.serializer_class(self.objs[0]).data
+        self.assertEqual(data, {"price": "10"})
+        self.assertEqual(self.serializer_class.calls, [[self.objs[0]]])
+
+    def test_sequence_result(self):
+        self.serializer_class.get_price = lambda serializer, objs: [
+            obj.pk for obj in objs
+        ]
+        data = self.serializer_class(self.objs, many=True).data
+        self.assertEqual(data, [{"price": "1"}, {"price": "2"}, {"price": "3"}])
+
+    def test_sequence_result_length_mismatch(self):
+        self.serializer_class.get_price = lambda serializer, objs: []
+        with self.assertRaises(ValueError):
+            self.serializer_class(self.objs, many=True).data
+
+
+class LazyExampleTestCase(APITestCase):
+    def test_example_not_generated_on_init(self):
+        with mock.patch("audoma.examples.generate_lorem_ipsum") as generate:
+            field = audoma_fields.CharField(max_length=40)
+        generate.assert_not_called()
+        self.assertIsNone(get_override(field, "field"))
+
+    def test_example_generated_once_per_config(self):
+        with mock.patch(
+            "audoma.examples.generate_lorem_ipsum", return_value="Lorem"
+        ) as generate:
+            for _ in range(3):
+                field = audoma_fields.CharField(min_length=1, max_length=7)
+                field.set_example_override()
+        generate.assert_called_once_with(min_length=1, max_length=7)
+        self.assertEqual(get_override(field, "field"), {"example": "Lorem"})
+
+    def test_explicit_example_override(self):
+        field = audoma_fields.PhoneNumberField(example="+48 123 456 789")
+        field.set_example_override()
+        self.assertEqual(
+            get_override(field, "field"),
+            {"format": "tel", "example": "+48 123 456 789"},
+        )
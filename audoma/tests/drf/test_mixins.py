@@ -1,13 +1,21 @@
+import json
 from typing import OrderedDict
+from unittest import mock
 
 from rest_framework.exceptions import (
     NotFound,
     ValidationError,
 )
+from rest_framework.renderers import (
+    BrowsableAPIRenderer,
+    JSONRenderer,
+)
+from rest_framework.response import Response
 from rest_framework.test import DjangoRequestFactory
 
 from django.core import exceptions as django_exceptions
 from django.db.models import fields
+from django.http import StreamingHttpResponse
 from django.test import TestCase
 
 from audoma.drf.mixins import (  # BulkUpdateModelMixin,
@@ -212,6 +220,77 @@ class ListModelTestCase(CommonMixinTestCase):
             self.assertEqual(e.detail, "Invalid page.")
 
 
+class StreamingListModelTestCase(CommonMixinTestCase):
+    view_baseclasses = (ListModelMixin, GenericViewSet)
+
+    def setUp(self):
+        super().setUp()
+        self.data = [{"name": f"Person {x}", "age": x} for x in range(5)]
+
+        def get_queryset():
+            return [self.model(**item) for item in self.data]
+
+        self.view.get_queryset = get_queryset
+        self.view.pagination_class = None
+        self.view.stream_list_response = True
+        self.view.stream_chunk_size = 2
+
+    def _get_request(self, renderer):
+        request = self.factory.get("/example")
+        request.accepted_renderer = renderer
+        self.view.request = request
+        return request
+
+    def test_list_streaming_success(self):
+        request = self._get_request(JSONRenderer())
+        self.view.action = "list"
+        response = self.view.list(request)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), self.data)
+
+    def test_list_streaming_empty_success(self):
+        request = self._get_request(JSONRenderer())
+        self.view.action = "list"
+        self.data = []
+        response = self.view.list(request)
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), [])
+
+    def test_list_streaming_wrapped_result_success(self):
+        request = self._get_request(JSONRenderer())
+        self.view.action = "export"
+        serializer_class = create_model_serializer_class(
+            meta_model=self.model,
+            meta_fields=["name", "age"],
+            serializer_base_classes=(ModelSerializer,),
+        )
+        serializer_class._wrap_result_serializer = True
+        self.view.serializer_class = serializer_class
+        response = self.view.list(request)
+        self.assertEqual(
+            json.loads(b"".join(response.streaming_content)), {"results": self.data}
+        )
+
+    def test_list_streaming_first_chunk_error_raised_by_view(self):
+        request = self._get_request(JSONRenderer())
+        self.view.action = "list"
+        # raised before the response is returned, so it's handled by the view
+        with mock.patch.object(
+            self.view,
+            "get_result_serializer",
+            side_effect=ValidationError("Invalid item"),
+        ):
+            with self.assertRaises(ValidationError):
+                self.view.list(request)
+
+    def test_list_streaming_not_json_renderer(self):
+        request = self._get_request(BrowsableAPIRenderer())
+        self.view.action = "list"
+        response = self.view.list(request)
+        self.assertIsInstance(response, Response)
+        self.assertEqual(response.data, self.data)
+
+
 class RetrieveModelMixinTestCase(CommonMixinTestCase):
 
     view_baseclasses = (RetrieveModelMixin, GenericViewSet)
@@ -1,3 +1,6 @@
+from unittest import mock
+
+from django.core.validators import MinValueValidator
 from django.test import TestCase
 
 from audoma.choices import make_choices
@@ -144,6 +147,70 @@ class ModelSerializerTestCase(TestCase):
         )
 
 
+class ModelSerializerFieldPlanTestCase(TestCase):
+    databases = "__all__"
+
+    def setUp(self):
+        model_fields_config = {
+            "name": db_fields.CharField(max_length=255, example="Thomas"),
+            "age": db_fields.IntegerField(example=33),
+        }
+
+        class ExampleModelSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = testtools.create_model_class(fields_config=model_fields_config)
+                fields = ["name", "age"]
+
+        self.serializer_class = ExampleModelSerializer
+
+    def test_field_plan_built_once(self):
+        with mock.patch.object(
+            serializers.serializers.ModelSerializer,
+            "build_field",
+            autospec=True,
+            side_effect=serializers.ModelSerializer.build_field,
+        ) as build_field:
+            first_fields = self.serializer_class().fields
+            second_fields = self.serializer_class().fields
+        self.assertEqual(build_field.call_count, 2)
+        self.assertEqual(list(first_fields), ["name", "age"])
+        self.assertIsNot(first_fields["name"], second_fields["name"])
+        self.assertEqual(second_fields["name"].max_length, 255)
+
+    def test_field_plan_invalidated_on_meta_change(self):
+        self.assertEqual(list(self.serializer_class().fields), ["name", "age"])
+        self.serializer_class.Meta.fields = ["age"]
+        self.assertEqual(list(self.serializer_class().fields), ["age"])
+        self.serializer_class.Meta.extra_kwargs = {"age": {"read_only": True}}
+        self.assertTrue(self.serializer_class().fields["age"].read_only)
+
+    def test_field_plan_disabled(self):
+        self.serializer_class.cache_field_plan = False
+        self.assertEqual(list(self.serializer_class().fields), ["name", "age"])
+        self.assertNotIn("_field_plan_cache", self.serializer_class.__dict__)
+
+    def test_field_plan_disabled_for_overridden_hooks(self):
+        class ContextFieldsSerializer(self.serializer_class):
+            def get_field_names(self, declared_fields, info):
+                return self.context.get("fields", self.Meta.fields)
+
+        self.assertFalse(ContextFieldsSerializer.can_cache_field_plan())
+        self.assertEqual(list(ContextFieldsSerializer().fields), ["name", "age"])
+        serializer = ContextFieldsSerializer(context={"fields": ["age"]})
+        self.assertEqual(list(serializer.fields), ["age"])
+
+    def test_field_plan_kwargs_not_shared(self):
+        self.serializer_class.Meta.extra_kwargs = {
+            "age": {"validators": [MinValueValidator(0)], "default": [0]}
+        }
+        first_field = self.serializer_class().fields["age"]
+        second_field = self.serializer_class().fields["age"]
+        self.assertIsNot(first_field.validators, second_field.validators)
+        self.assertIsNot(first_field.validators[0], second_field.validators[0])
+        self.assertIsNot(first_field.default, second_field.default)
+        self.assertEqual(second_field.default, [0])
+
+
 class DisplayNamedWritableFieldTestCase(TestCase):
     databases = "__all__"
 
@@ -0,0 +1,120 @@
+import asyncio
+import time
+from functools import partial
+from unittest import skipIf
+
+from asgiref.sync import async_to_sync
+from rest_framework.exceptions import APIException
+
+import django
+from django.contrib.auth import get_user_model
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+)
+
+from audoma.concurrency import (
+    FanOutCancelled,
+    FanOutTimeout,
+    fan_out,
+)
+
+
+class ServiceUnavailable(APIException):
+    status_code = 503
+
+
+async def get_value(value, delay=0):
+    await asyncio.sleep(delay)
+    return value
+
+
+@skipIf(django.VERSION < (3, 1), "Async actions require Django 3.1")
+class FanOutTestCase(SimpleTestCase):
+    def test_fan_out_results_by_call_name(self):
+        results = async_to_sync(fan_out)(
+            {
+                "awaitable": get_value(1),
+                "coroutine_function": partial(get_value, 2),
+                "sync_callable": lambda: 3,
+            }
+        )
+        self.assertEqual(
+            results, {"awaitable": 1, "coroutine_function": 2, "sync_callable": 3}
+        )
+        self.assertEqual(async_to_sync(fan_out)({}), {})
+
+    def test_fan_out_runs_calls_concurrently(self):
+        start = time.monotonic()
+        results = async_to_sync(fan_out)(
+            {
+                "first": get_value(1, delay=0.2),
+                "second": get_value(2, delay=0.2),
+                "sync": lambda: time.sleep(0.2) or 3,
+            }
+        )
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(results, {"first": 1, "second": 2, "sync": 3})
+
+    def test_fan_out_timeout(self):
+        calls = {"fast": get_value(1), "slow": get_value(2, delay=1)}
+        with self.assertRaises(FanOutTimeout):
+            async_to_sync(fan_out)(calls, timeout=0.05)
+
+    def test_fan_out_call_own_timeout_not_mapped(self):
+        async def client_timeout():
+            raise asyncio.TimeoutError()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            async_to_sync(fan_out)({"client": client_timeout()}, timeout=1)
+
+    def test_fan_out_per_call_timeout(self):
+        results = async_to_sync(fan_out)(
+            {"fast": get_value(1, delay=0.1), "slow": get_value(2, delay=0.1)},
+            timeout=0.01,
+            timeouts={"fast": 1, "slow": 1},
+        )
+        self.assertEqual(results, {"fast": 1, "slow": 2})
+
+    def test_fan_out_custom_timeout_error(self):
+        timeout_error = ServiceUnavailable("Backend is unavailable")
+        with self.assertRaises(ServiceUnavailable) as context:
+            async_to_sync(fan_out)(
+                {"slow": get_value(1, delay=1)},
+                timeout=0.01,
+                timeout_error=timeout_error,
+            )
+        self.assertIsNot(context.exception, timeout_error)
+        self.assertEqual(context.exception.detail, "Backend is unavailable")
+
+    def test_fan_out_failure_cancels_remaining_calls(self):
+        finished = []
+
+        async def slow():
+            await asyncio.sleep(1)
+            finished.append("slow")
+
+        async def failing():
+            raise ValueError("Backend error")
+
+        with self.assertRaises(ValueError):
+            async_to_sync(fan_out)({"slow": slow(), "failing": failing()})
+        self.assertEqual(finished, [])
+
+    def test_fan_out_cancelled_call(self):
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        with self.assertRaises(FanOutCancelled):
+            async_to_sync(fan_out)({"value": get_value(1), "cancelled": cancelled()})
+
+
+@skipIf(django.VERSION < (3, 1), "Async actions require Django 3.1")
+class FanOutQuerySetTestCase(TestCase):
+    def test_fan_out_evaluates_querysets(self):
+        user = get_user_model().objects.create(username="john")
+        results = async_to_sync(fan_out)(
+            {"users": get_user_model().objects.all(), "value": get_value(1)},
+            thread_sensitive=True,
+        )
+        self.assertEqual(results, {"users": [user], "value": 1})
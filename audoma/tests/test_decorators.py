@@ -1,22 +1,39 @@
+import asyncio
+from inspect import iscoroutinefunction
+from unittest import (
+    mock,
+    skipIf,
+)
+
+from asgiref.sync import async_to_sync
 from rest_framework.exceptions import (
     APIException,
     MethodNotAllowed,
+    NotFound,
     PermissionDenied,
+    ValidationError,
 )
 from rest_framework.serializers import Serializer
 from rest_framework.test import APIRequestFactory
 
+import django
 from django.core.exceptions import ImproperlyConfigured
+from django.http import Http404
 from django.test import (
     TestCase,
     override_settings,
 )
 
+from audoma.concurrency import (
+    FanOutTimeout,
+    fan_out,
+)
 from audoma.decorators import (
     AudomaActionException,
     audoma_action,
 )
 from audoma.drf import fields as audoma_fields
+from audoma.drf.viewsets import GenericViewSet
 from audoma.tests.testtools import (
     create_serializer_class,
     create_view_with_custom_audoma_action,
@@ -326,3 +343,236 @@ class AudomaActionTestCase(TestCase):
         response = view.custom_action(request)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, self.request_data)
+
+    def test_audoma_action_plan_compiled_once(self):
+        request = self.factory.post("/custom_action/")
+        request.data = self.request_data
+        view = create_view_with_custom_audoma_action(
+            request=request,
+            action_kwargs={
+                "collectors": {"post": self.example_collect_serializer},
+                "results": {"post": {201: self.example_result_serializer}},
+                "methods": ["POST"],
+                "detail": False,
+                "errors": [PermissionDenied("You are not allowed")],
+            },
+            returnables=(self.request_data, 201),
+        )
+        view.method = "post"
+        view.format_kwarg = "json"
+        view.request = request
+        view.action = "custom_action"
+        plan = view.custom_action._audoma.plan
+
+        self.assertIs(
+            plan.get_collect_operation("POST"), self.example_collect_serializer
+        )
+        self.assertIsNone(plan.get_collect_operation("GET"))
+        self.assertIs(
+            plan.get_result_operation("POST", 201), self.example_result_serializer
+        )
+        self.assertIsNone(plan.get_result_operation("POST", 200))
+        self.assertIsInstance(plan.errors[0], PermissionDenied)
+        self.assertIn(NotFound, plan.errors)
+        with self.assertRaises(TypeError):
+            plan.results[("post", 200)] = self.example_result_serializer
+
+        for _ in range(2):
+            response = view.custom_action(request)
+            self.assertEqual(response.status_code, 201)
+        self.assertIs(view.custom_action._audoma.plan, plan)
+
+    def test_audoma_action_process_defined_exception_builds_single_response(self):
+        request = self.factory.post("/custom_action/")
+        request.data = self.request_data
+        view = create_view_with_custom_audoma_action(
+            request=request,
+            action_kwargs={
+                "results": {201: self.example_result_serializer},
+                "methods": ["POST"],
+                "detail": False,
+                "errors": [
+                    PermissionDenied("Something else"),
+                    PermissionDenied("You are not allowed"),
+                ],
+            },
+            returnables=(self.request_data, 201),
+            view_properties={"serializer_class": self.example_collect_serializer},
+            raiseable=PermissionDenied("You are not allowed"),
+            raise_exception=True,
+        )
+        view.method = "post"
+        view.request = request
+        view.format_kwarg = "json"
+        view.action = "custom_action"
+        with mock.patch.object(
+            view, "handle_exception", wraps=view.handle_exception
+        ) as handle_exception:
+            response = view.custom_action(request)
+        self.assertEqual(handle_exception.call_count, 1)
+        self.assertEqual(response.status_code, 403)
+
+    def test_audoma_action_error_fingerprint(self):
+        class CustomException(APIException):
+            status_code = 409
+
+        plan = audoma_action(
+            methods=["GET"],
+            detail=False,
+            errors=[CustomException("You are not allowed"), Http404("Missing")],
+        )(lambda view, request: ({}, 200))._audoma.plan
+
+        self.assertTrue(plan.is_error_allowed(CustomException("You are not allowed")))
+        self.assertFalse(plan.is_error_allowed(CustomException("Something else")))
+        self.assertFalse(
+            plan.is_error_allowed(CustomException("You are not allowed", code="other"))
+        )
+        # Http404 message is not a part of the response
+        self.assertEqual(
+            plan.get_error_fingerprint(Http404("Missing")),
+            plan.get_error_fingerprint(Http404("Other message")),
+        )
+        # common errors are allowed as classes
+        self.assertTrue(plan.is_error_allowed(ValidationError({"name": ["Invalid"]})))
+
+
+async def get_value(value, delay=0):
+    await asyncio.sleep(delay)
+    return value
+
+
+@skipIf(django.VERSION < (3, 1), "Async actions require Django 3.1")
+class AsyncAudomaActionTestCase(TestCase):
+    databases = "__all__"
+
+    def setUp(self):
+        super().setUp()
+        self.factory = APIRequestFactory()
+        serializer_class = create_serializer_class(
+            fields_config={
+                "firstname": audoma_fields.CharField(max_length=255),
+                "age": audoma_fields.IntegerField(),
+            },
+            serializer_base_classes=[Serializer],
+        )
+        self.serializer_class = serializer_class
+
+        class ExampleView(GenericViewSet):
+            @audoma_action(
+                detail=False,
+                methods=["post"],
+                collectors=serializer_class,
+                results={201: serializer_class},
+                errors=[PermissionDenied("You are not allowed")],
+            )
+            async def create_person(self, request, collect_serializer):
+                await asyncio.sleep(0)
+                if collect_serializer.validated_data["age"] < 0:
+                    raise PermissionDenied("You are not allowed")
+                return collect_serializer.validated_data, 201
+
+            @audoma_action(detail=False, methods=["get"], results=serializer_class)
+            def get_person(self, request):
+                return {"firstname": "John", "age": 45}, 200
+
+            @audoma_action(
+                detail=False,
+                methods=["get"],
+                results=serializer_class,
+                errors=[FanOutTimeout],
+            )
+            async def get_dashboard(self, request):
+                timeout = float(request.query_params.get("timeout", 1))
+                return (
+                    await fan_out(
+                        {
+                            "firstname": get_value("John", delay=0.05),
+                            "age": lambda: 45,
+                        },
+                        timeout=timeout,
+                    ),
+                    200,
+                )
+
+            @audoma_action(detail=False, methods=["get"], results=serializer_class)
+            async def get_slow_person(self, request):
+                await asyncio.wait_for(get_value(None, delay=1), 0.01)
+
+        self.view_class = ExampleView
+
+    def test_async_action_requires_django_31(self):
+        with mock.patch("django.VERSION", (3, 0, 14, "final", 0)):
+            with self.assertRaises(ImproperlyConfigured):
+
+                @audoma_action(detail=False, methods=["get"])
+                async def get_person(view, request):
+                    return {}, 200
+
+    def test_async_action_is_coroutine_function(self):
+        self.assertTrue(iscoroutinefunction(self.view_class.create_person))
+        self.assertFalse(iscoroutinefunction(self.view_class.get_person))
+        self.assertTrue(
+            iscoroutinefunction(self.view_class.as_view({"post": "create_person"}))
+        )
+        self.assertFalse(
+            iscoroutinefunction(self.view_class.as_view({"get": "get_person"}))
+        )
+
+    def test_async_action_return_defined_response(self):
+        view = self.view_class.as_view({"post": "create_person"})
+        request = self.factory.post(
+            "/create_person/", {"firstname": "John", "age": 45}, format="json"
+        )
+        response = async_to_sync(view)(request)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data, {"firstname": "John", "age": 45})
+
+    def test_async_action_collector_validation(self):
+        view = self.view_class.as_view({"post": "create_person"})
+        request = self.factory.post(
+            "/create_person/", {"firstname": "John"}, format="json"
+        )
+        response = async_to_sync(view)(request)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("age", response.data["errors"])
+
+    def test_async_action_process_defined_exception(self):
+        view = self.view_class.as_view({"post": "create_person"})
+        request = self.factory.post(
+            "/create_person/", {"firstname": "John", "age": -1}, format="json"
+        )
+        response = async_to_sync(view)(request)
+        self.assertEqual(response.status_code, 403)
+        self.assertDictEqual(
+            response.data, {"errors": {"detail": "You are not allowed"}}
+        )
+
+    def test_sync_action_routed_with_async_action(self):
+        view = self.view_class.as_view({"get": "get_person", "post": "create_person"})
+        response = async_to_sync(view)(self.factory.get("/person/"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"firstname": "John", "age": 45})
+
+    def test_async_action_method_not_allowed(self):
+        view = self.view_class.as_view({"post": "create_person"})
+        response = async_to_sync(view)(self.factory.get("/create_person/"))
+        self.assertEqual(response.status_code, 405)
+
+    def test_async_action_fan_out_results(self):
+        view = self.view_class.as_view({"get": "get_dashboard"})
+        response = async_to_sync(view)(self.factory.get("/dashboard/"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"firstname": "John", "age": 45})
+
+    def test_async_action_fan_out_allowed_timeout(self):
+        view = self.view_class.as_view({"get": "get_dashboard"})
+        response = async_to_sync(view)(self.factory.get("/dashboard/?timeout=0.01"))
+        self.assertEqual(response.status_code, 504)
+        self.assertDictEqual(
+            response.data, {"errors": {"detail": "Backend call has timed out."}}
+        )
+
+    def test_async_action_other_timeout_not_processed_as_fan_out_timeout(self):
+        view = self.view_class.as_view({"get": "get_slow_person"})
+        with self.assertRaises(asyncio.TimeoutError):
+            async_to_sync(view)(self.factory.get("/slow_person/"))
@@ -266,3 +266,66 @@ class GenericAPIViewTestCase(TestCase):
             201, self.result_serializer_class()
         )
         self.assertDictEqual(headers, {})
+
+    def test_get_serializer_class_resolution_cached_per_view_class(self):
+        view_class = testtools.create_basic_view_class(
+            view_properties={
+                "common_result_serializer_class": self.result_serializer_class,
+                "create_collect_serializer_class": self.collect_serializer_class,
+            },
+        )
+        viewset = view_class()
+        viewset.action = "create"
+        viewset.format_kwarg = "json"
+        viewset.request = self.factory.post("/example/")
+        self.assertEqual(
+            viewset.get_serializer_class(serializer_type="result"),
+            self.result_serializer_class,
+        )
+        self.assertEqual(
+            viewset.get_serializer_class(serializer_type="collect"),
+            self.collect_serializer_class,
+        )
+
+        # resolution is shared between instances of the same view class
+        view_class.common_result_serializer_class = self.collect_serializer_class
+        other_viewset = view_class()
+        other_viewset.action = "create"
+        other_viewset.format_kwarg = "json"
+        other_viewset.request = self.factory.post("/example/")
+        self.assertEqual(
+            other_viewset.get_serializer_class(serializer_type="result"),
+            self.result_serializer_class,
+        )
+
+    def test_get_serializer_class_resolution_cache_disabled(self):
+        view_class = testtools.create_basic_view_class(
+            view_properties={
+                "common_result_serializer_class": self.result_serializer_class,
+                "cache_serializer_class_resolution": False,
+            },
+        )
+        viewset = view_class()
+        viewset.action = "create"
+        viewset.format_kwarg = "json"
+        viewset.request = self.factory.post("/example/")
+        self.assertEqual(
+            viewset.get_serializer_class(serializer_type="result"),
+            self.result_serializer_class,
+        )
+        view_class.common_result_serializer_class = self.collect_serializer_class
+        self.assertEqual(
+            viewset.get_serializer_class(serializer_type="result"),
+            self.collect_serializer_class,
+        )
+
+    def test_get_serializer_class_initkwargs_not_cached(self):
+        view_class = testtools.create_basic_view_class(
+            view_properties={"serializer_class": self.result_serializer_class},
+        )
+        viewset = view_class(serializer_class=self.collect_serializer_class)
+        viewset.action = "create"
+        viewset.format_kwarg = "json"
+        viewset.request = self.factory.post("/example/")
+        self.assertEqual(viewset.get_serializer_class(), self.collect_serializer_class)
+        self.assertNotIn("_serializer_class_cache", view_class.__dict__)
@@ -0,0 +1,123 @@
+from unittest import mock
+
+from rest_framework import serializers
+
+from django.test import (
+    SimpleTestCase,
+    override_settings,
+)
+from django.urls import (
+    NoReverseMatch,
+    include,
+    path,
+    re_path,
+)
+from django.views import View
+
+from audoma import links
+from audoma.links import (
+    ChoicesOptionsLink,
+    ChoicesOptionsLinkSchemaGenerator,
+    get_endpoint_pattern,
+    get_endpoint_patterns_index,
+)
+
+
+nested_urlpatterns = [
+    re_path(
+        r"^items/(?P<pk>[^/.]+)\.(?P<format>[a-z0-9]+)/?$", View.as_view(), name="item"
+    ),
+    re_path(r"^items/(?P<pk>[^/.]+)/$", View.as_view(), name="item"),
+]
+
+urlpatterns = [
+    path("nested/", include(nested_urlpatterns)),
+    path("other/", View.as_view(), name="other"),
+    path("unnamed/", View.as_view()),
+]
+
+
+@override_settings(ROOT_URLCONF="audoma.tests.test_links")
+class EndpointPatternsIndexTestCase(SimpleTestCase):
+    def test_get_endpoint_pattern_skips_format_patterns(self):
+        self.assertEqual(get_endpoint_pattern("item"), r"^items/(?P<pk>[^/.]+)/$")
+        self.assertEqual(get_endpoint_pattern("other"), "other/")
+
+    def test_get_endpoint_pattern_unknown_name(self):
+        with self.assertRaises(NoReverseMatch):
+            get_endpoint_pattern("missing")
+
+    def test_index_is_built_once_per_urlconf(self):
+        get_endpoint_patterns_index()
+        with mock.patch.object(
+            links,
+            "_build_endpoint_patterns_index",
+            wraps=links._build_endpoint_patterns_index,
+        ) as build:
+            for _ in range(10):
+                get_endpoint_pattern("item")
+                ChoicesOptionsLink(
+                    field_name="field",
+                    viewname="other",
+                    value_field="id",
+                    display_field="name",
+                    serializer_class=None,
+                ).get_url_pattern()
+        build.assert_not_called()
+
+    def test_index_is_invalidated_on_urlconf_change(self):
+        self.assertIn("other", get_endpoint_patterns_index())
+        with override_settings(ROOT_URLCONF="drf_example.urls"):
+            index = get_endpoint_patterns_index()
+            self.assertNotIn("other", index)
+            self.assertIn("schema", index)
+        self.assertIn("other", get_endpoint_patterns_index())
+
+
+class LinkedSerializer(serializers.Serializer):
+    other = serializers.IntegerField()
+
+
+@override_settings(ROOT_URLCONF="audoma.tests.test_links")
+class ChoicesOptionsLinkSchemaGeneratorTestCase(SimpleTestCase):
+    def setUp(self):
+        self.generator = ChoicesOptionsLinkSchemaGenerator()
+        self.link = {
+            "field_name": "other",
+            "viewname": "other",
+            "value_field": "id",
+            "display_field": "name",
+            "serializer_class": LinkedSerializer,
+        }
+
+    def test_generate_schema(self):
+        self.assertEqual(
+            self.generator.generate_schema(self.link),
+            {
+                "operationRef": "#/paths/other~1",
+                "value": "$response.body#results/*/id",
+                "display": "$response.body#results/*/name",
+            },
+        )
+
+    def test_generate_schema_is_memoized(self):
+        with mock.patch.object(
+            links, "force_instance", wraps=links.force_instance
+        ) as force_instance, mock.patch.object(
+            ChoicesOptionsLink,
+            "get_url_pattern",
+            autospec=True,
+            side_effect=ChoicesOptionsLink.get_url_pattern,
+        ) as get_url_pattern:
+            schemas = [self.generator.generate_schema(self.link) for _ in range(10)]
+            self.generator.generate_schema(dict(self.link, display_field="label"))
+
+        self.assertEqual(force_instance.call_count, 1)
+        self.assertEqual(get_url_pattern.call_count, 2)
+        self.assertTrue(all(schema == schemas[0] for schema in schemas))
+        schemas[0]["value"] = "changed"
+        self.assertNotEqual(self.generator.generate_schema(self.link), schemas[0])
+
+    def test_generate_schema_unknown_field(self):
+        with self.assertRaises(AttributeError):
+            self.generator.generate_schema(dict(self.link, field_name="missing"))
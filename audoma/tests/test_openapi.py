@@ -1,4 +1,7 @@
-from unittest import TestCase
+from unittest import (
+    TestCase,
+    mock,
+)
 
 from drf_spectacular.plumbing import ComponentRegistry
 from rest_framework import fields
@@ -79,6 +82,63 @@ class AudomaAutoSchemaTestCase(TestCase):
         desc = view.schema.get_description()
         self.assertIn("(No description for this permission)", desc)
 
+    def _get_permissions_description(self, permission_classes):
+        view = create_basic_view(
+            view_properties={"permission_classes": permission_classes}
+        )
+        view.schema = AudomaAutoSchema()
+        view.schema.method = "get"
+        return view.schema._get_permissions_description()
+
+    def test_get_permissions_description_cached_per_expression(self):
+        class FirstPermission(BasePermission):
+            """First"""
+
+        class SecondPermission(BasePermission):
+            """Second"""
+
+        with mock.patch.object(
+            AudomaAutoSchema,
+            "_render_permissions_description",
+            autospec=True,
+            side_effect=AudomaAutoSchema._render_permissions_description,
+        ) as render:
+            and_descriptions = [
+                self._get_permissions_description(
+                    [FirstPermission & ~SecondPermission, IsAuthenticated]
+                )
+                for _ in range(5)
+            ]
+            or_description = self._get_permissions_description(
+                [FirstPermission | ~SecondPermission, IsAuthenticated]
+            )
+
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(len(set(and_descriptions)), 1)
+        self.assertIn("`FirstPermission`  &  `SecondPermission`", and_descriptions[0])
+        self.assertIn("`FirstPermission` | `SecondPermission`", or_description)
+
+    def test_get_permissions_description_view_dependent_not_cached(self):
+        class ViewPermission(BasePermission):
+            @classmethod
+            def get_description(cls, view):
+                return view.description
+
+        view_descriptions = []
+        for description in ("first", "second"):
+            view = create_basic_view(
+                view_properties={
+                    "permission_classes": [ViewPermission & IsAuthenticated],
+                    "description": description,
+                }
+            )
+            view.schema = AudomaAutoSchema()
+            view.schema.method = "get"
+            view_descriptions.append(view.schema._get_permissions_description())
+
+        self.assertIn("first", view_descriptions[0])
+        self.assertIn("second", view_descriptions[1])
+
     def test_get_serializer_default_serializer_usage(self):
         fields_config = {
             "name": fields.CharField(max_length=255),
@@ -579,3 +639,32 @@ class AudomaAutoSchemaTestCase(TestCase):
         view.schema.path_regex = r"\/\w\/"
         operation_id = view.schema.get_operation_id()
         self.assertNotIn("bulk", operation_id)
+
+    def _count_get_serializer_calls_in_operation(self, fields_count):
+        fields_config = {
+            f"field_{i}": audoma_fields.IntegerField() for i in range(fields_count)
+        }
+        serializer_class = create_serializer_class(
+            fields_config=fields_config, serializer_base_classes=[Serializer]
+        )
+        view = create_basic_view(view_properties={"serializer_class": serializer_class})
+        view.request = self.factory.post("/example/")
+        view.action = "create"
+        view.schema = AudomaAutoSchema()
+        with mock.patch.object(
+            AudomaAutoSchema,
+            "_get_serializer",
+            autospec=True,
+            side_effect=AudomaAutoSchema._get_serializer,
+        ) as get_serializer:
+            operation = view.schema.get_operation(
+                "/example/", r"^example/$", "", "POST", ComponentRegistry()
+            )
+        self.assertIsNotNone(operation)
+        return get_serializer.call_count
+
+    def test_get_operation_resolves_serializer_once_per_direction(self):
+        self.assertEqual(
+            self._count_get_serializer_calls_in_operation(1),
+            self._count_get_serializer_calls_in_operation(10),
+        )
@@ -73,7 +73,9 @@ class PlumbingTestCase(TestCase):
             mixins.UpdateModelMixin,
             audoma_viewsets.GenericViewSet,
             audoma_mixins.ActionModelMixin,
+            audoma_mixins.BulkChunkMixin,
             audoma_mixins.BulkCreateModelMixin,
+            audoma_mixins.BulkJobMixin,
             audoma_mixins.BulkUpdateModelMixin,
             audoma_mixins.CreateModelMixin,
             audoma_mixins.DestroyModelMixin,
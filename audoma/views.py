@@ -0,0 +1,110 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Tuple,
+)
+
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.request import Request
+
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified,
+)
+from django.utils.http import parse_etags
+
+from audoma.generators import AudomaSchemaGenerator
+
+
+class AudomaSpectacularAPIView(SpectacularAPIView):
+    """
+    Schema view which serves pre-rendered schema with an ETag.
+
+    Rendered schema is cached per schema fingerprint and format,
+    so the schema is generated and rendered again only if any of its inputs has changed.
+    Requests with matching `If-None-Match` header get `304 Not Modified` response.
+
+    Note:
+        Schema is cached only if it is served public, see `serve_public`.
+    """
+
+    generator_class = AudomaSchemaGenerator
+    max_rendered_schemas = 8
+    _rendered_schemas_lock = threading.Lock()
+
+    @classmethod
+    def _get_rendered_schemas(
+        cls,
+    ) -> Dict[Tuple[str, str, str], Tuple[str, bytes, str]]:
+        # cache is stored in the class __dict__, so subclasses never share it
+        rendered_schemas = cls.__dict__.get("_rendered_schemas")
+        if rendered_schemas is None:
+            rendered_schemas = cls._rendered_schemas = OrderedDict()
+        return rendered_schemas
+
+    def _get_rendered_schema(self, key: Tuple[str, str, str]) -> Tuple[str, bytes, str]:
+        with self._rendered_schemas_lock:
+            rendered_schemas = self._get_rendered_schemas()
+            cached = rendered_schemas.get(key)
+            if cached is not None:
+                rendered_schemas.move_to_end(key)
+            return cached
+
+    def _set_rendered_schema(
+        self, key: Tuple[str, str, str], cached: Tuple[str, bytes, str]
+    ) -> None:
+        with self._rendered_schemas_lock:
+            rendered_schemas = self._get_rendered_schemas()
+            rendered_schemas[key] = cached
+            rendered_schemas.move_to_end(key)
+            while len(rendered_schemas) > self.max_rendered_schemas:
+                rendered_schemas.popitem(last=False)
+
+    @staticmethod
+    def _etag_matches(etag: str, if_none_match: str) -> bool:
+        # weak comparison, as done by django.utils.cache for If-None-Match
+        etags = parse_etags(if_none_match)
+        if "*" in etags:
+            return True
+        etag = etag[2:] if etag.startswith("W/") else etag
+        return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in etags)
+
+    def _get_schema_response(self, request: Request) -> HttpResponse:
+        if not self.serve_public:
+            return super()._get_schema_response(request)
+
+        version = (
+            self.api_version or request.version or self._get_version_parameter(request)
+        )
+        generator = self.generator_class(urlconf=self.urlconf, api_version=version)
+        renderer = request.accepted_renderer
+        key = (
+            generator.get_schema_fingerprint(request=request, public=True),
+            f"{renderer.format}:{request.accepted_media_type}",
+            repr(self.custom_settings),
+        )
+
+        # schema may be rendered by concurrent requests at once, the last one is stored
+        cached = self._get_rendered_schema(key)
+        if cached is None:
+            schema = generator.get_schema(request=request, public=True)
+            content = renderer.render(schema, request.accepted_media_type, {})
+            etag = f'"{hashlib.sha256(content).hexdigest()}"'
+            content_type = request.accepted_media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+            cached = (etag, content, content_type)
+            self._set_rendered_schema(key, cached)
+
+        etag, content, content_type = cached
+        if self._etag_matches(etag, request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=content_type)
+            response[
+                "Content-Disposition"
+            ] = f'inline; filename="{self._get_filename(request, version)}"'
+        response["ETag"] = etag
+        return response
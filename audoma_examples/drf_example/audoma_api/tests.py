@@ -6,6 +6,7 @@ from datetime import (
     timedelta,
 )
 from typing import OrderedDict
+from unittest import mock
 
 import phonenumbers
 from audoma_api.exceptions import CustomBadRequestException
@@ -24,10 +25,18 @@ from audoma_api.views import (
     ExampleViewSet,
 )
 from drf_example.v1_urls import router
+from drf_spectacular.drainage import (
+    GENERATOR_STATS,
+    warn,
+)
 from drf_spectacular.generators import SchemaGenerator
 from phonenumber_field.phonenumber import to_python
-from rest_framework.exceptions import ErrorDetail
+from rest_framework.exceptions import (
+    ErrorDetail,
+    NotFound,
+)
 from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
 from rest_framework.test import (
     APIClient,
     APIRequestFactory,
@@ -35,6 +44,12 @@ from rest_framework.test import (
 )
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import (
+    router as db_router,
+    transaction,
+)
+from django.db.models import Q
 from django.shortcuts import reverse
 from django.test import (
     SimpleTestCase,
@@ -45,8 +60,15 @@ from django.test import (
 from audoma.decorators import AudomaActionException
 from audoma.django.db import models
 from audoma.drf import serializers
-from audoma.drf.viewsets import AudomaPagination
+from audoma.drf.viewsets import (
+    AudomaKeysetPagination,
+    AudomaPagination,
+)
 from audoma.example_generators import generate_lorem_ipsum
+from audoma.generators import AudomaSchemaGenerator
+from audoma.openapi import AudomaAutoSchema
+from audoma.plumbing import get_operation_fingerprint
+from audoma.views import AudomaSpectacularAPIView
 
 
 class AudomaApiTestMixin:
@@ -881,3 +903,315 @@ class AudomaViewsTestCase(AudomaApiTestMixin, TestCase):
                 "tags": [OrderedDict([("name", "Tag")])],
             },
         )
+
+
+class AudomaKeysetPaginationTestCase(AudomaApiTestMixin, TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        Manufacturer.objects.bulk_create(
+            [
+                Manufacturer(name=f"Manufacturer {i % 3}", slug_name=f"m_{i}")
+                for i in range(7)
+            ]
+        )
+        self.view = type("KeysetView", (), {"keyset_ordering": ("name", "-id")})()
+
+    def paginate(self, url):
+        paginator = AudomaKeysetPagination()
+        paginator.page_size = 3
+        request = Request(self.factory.get(url))
+        page = paginator.paginate_queryset(
+            Manufacturer.objects.all(), request, view=self.view
+        )
+        return paginator, [m.slug_name for m in page]
+
+    def test_keyset_pagination_traverses_composite_ordering(self):
+        expected = list(
+            Manufacturer.objects.order_by("name", "-id").values_list(
+                "slug_name", flat=True
+            )
+        )
+        collected = []
+        url = "/manufacturers/"
+        while url:
+            paginator, page = self.paginate(url)
+            collected += page
+            url = paginator.get_next_link()
+        self.assertEqual(collected, expected)
+
+    def test_keyset_pagination_previous_link(self):
+        first_paginator, first_page = self.paginate("/manufacturers/")
+        self.assertIsNone(first_paginator.get_previous_link())
+        paginator, _ = self.paginate(first_paginator.get_next_link())
+        previous_paginator, previous_page = self.paginate(paginator.get_previous_link())
+        self.assertEqual(previous_page, first_page)
+        self.assertIsNone(previous_paginator.get_previous_link())
+
+    def test_keyset_pagination_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.paginate("/manufacturers/?cursor=invalid")
+
+    def test_keyset_pagination_tampered_cursor(self):
+        paginator = AudomaKeysetPagination()
+        for values in (["Manufacturer 1", "abc"], ["Manufacturer 1", [1]]):
+            cursor = paginator.encode_cursor(values, False)
+            with self.assertRaises(NotFound):
+                self.paginate(f"/manufacturers/?cursor={cursor}")
+
+        cursor = paginator.encode_cursor(["Manufacturer 1", "3"], False)
+        _, page = self.paginate(f"/manufacturers/?cursor={cursor}")
+        self.assertEqual(
+            page,
+            list(
+                Manufacturer.objects.filter(
+                    Q(name__gt="Manufacturer 1") | Q(name="Manufacturer 1", id__lt=3)
+                )
+                .order_by("name", "-id")
+                .values_list("slug_name", flat=True)[:3]
+            ),
+        )
+
+    def test_keyset_pagination_response_schema(self):
+        schema = AudomaKeysetPagination().get_paginated_response_schema({})
+        self.assertEqual(
+            list(schema["properties"].keys()),
+            ["message", "next", "previous", "results"],
+        )
+
+
+class AudomaPaginationCountStrategyTestCase(AudomaApiTestMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        Manufacturer.objects.bulk_create(
+            [
+                Manufacturer(name=f"Manufacturer {i}", slug_name=f"m_{i}")
+                for i in range(3)
+            ]
+        )
+
+    def get_response(self, url, queryset=None, **attrs):
+        paginator = AudomaPagination()
+        for name, value in attrs.items():
+            setattr(paginator, name, value)
+        request = Request(self.factory.get(url))
+        if queryset is None:
+            queryset = Manufacturer.objects.all()
+        page = paginator.paginate_queryset(queryset.order_by("id"), request)
+        return paginator.get_paginated_response([m.id for m in page])
+
+    def test_exact_count_response_unchanged(self):
+        response = self.get_response("/manufacturers/")
+        self.assertEqual(response.data["count"], 3)
+        self.assertNotIn("count_type", response.data)
+
+    def test_cached_count(self):
+        response = self.get_response("/manufacturers/?name=a", count_strategy="cached")
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(response.data["count_type"], "exact")
+        Manufacturer.objects.create(name="Manufacturer 4", slug_name="m_4")
+
+        with self.assertNumQueries(1, using="audoma_api"):
+            response = self.get_response(
+                "/manufacturers/?page=1&name=a", count_strategy="cached"
+            )
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(response.data["count_type"], "cached")
+
+        response = self.get_response("/manufacturers/?name=b", count_strategy="cached")
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(response.data["count_type"], "exact")
+
+    def test_cached_count_scoped_by_queryset(self):
+        # e.g. get_queryset filtering by request.user
+        first_user_queryset = Manufacturer.objects.filter(slug_name="m_0")
+        second_user_queryset = Manufacturer.objects.exclude(slug_name="m_0")
+        response = self.get_response(
+            "/manufacturers/", first_user_queryset, count_strategy="cached"
+        )
+        self.assertEqual(response.data["count"], 1)
+
+        response = self.get_response(
+            "/manufacturers/", second_user_queryset, count_strategy="cached"
+        )
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["count_type"], "exact")
+
+        response = self.get_response(
+            "/manufacturers/", first_user_queryset, count_strategy="cached"
+        )
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["count_type"], "cached")
+
+    def test_estimated_count_falls_back_to_exact(self):
+        response = self.get_response(
+            "/manufacturers/", count_strategy="estimated", count_estimate_threshold=0
+        )
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(response.data["count_type"], "exact")
+
+    def test_count_type_in_response_schema(self):
+        paginator = AudomaPagination()
+        self.assertNotIn(
+            "count_type", paginator.get_paginated_response_schema({})["properties"]
+        )
+        paginator.count_strategy = "estimated"
+        schema = paginator.get_paginated_response_schema({})
+        self.assertEqual(
+            schema["properties"]["count_type"]["enum"], ["exact", "estimated"]
+        )
+
+
+class AudomaSchemaCacheTestCase(AudomaApiTestMixin, TestCase):
+    def setUp(self):
+        AudomaSchemaGenerator._operation_cache = {}
+
+    def test_generator_reuses_unchanged_operations(self):
+        schema = AudomaSchemaGenerator(patterns=router.urls).get_schema(
+            request=None, public=True
+        )
+        with mock.patch.object(
+            AudomaAutoSchema, "_get_response_bodies", side_effect=AssertionError
+        ):
+            cached_schema = AudomaSchemaGenerator(patterns=router.urls).get_schema(
+                request=None, public=True
+            )
+        self.assertEqual(json.dumps(schema), json.dumps(cached_schema))
+
+    def test_generator_regenerates_changed_operation(self):
+        AudomaSchemaGenerator(patterns=router.urls).get_schema(
+            request=None, public=True
+        )
+        with mock.patch.object(
+            ExampleModelSerializer.Meta, "fields", ["id", "char_field", "phone_number"]
+        ):
+            schema = AudomaSchemaGenerator(patterns=router.urls).get_schema(
+                request=None, public=True
+            )
+        self.assertEqual(
+            set(schema["components"]["schemas"]["ExampleModel"]["properties"]),
+            {"id", "char_field", "phone_number"},
+        )
+
+    def test_operation_fingerprint_does_not_run_queries(self):
+        class LinkedSerializer(serializers.Serializer):
+            manufacturer = serializers.PrimaryKeyRelatedField(
+                queryset=Manufacturer.objects.filter(name="Example")
+            )
+
+        view = ExampleModelViewSet(action="list")
+        using = db_router.db_for_read(Manufacturer)
+        with mock.patch.object(
+            ExampleModelViewSet, "serializer_class", LinkedSerializer
+        ):
+            with self.assertNumQueries(0, using=using):
+                fingerprint = get_operation_fingerprint(view, "/", "^$", "", "GET")
+            Manufacturer.objects.create(name="Example")
+            # fingerprint does not depend on the database content
+            self.assertEqual(
+                get_operation_fingerprint(view, "/", "^$", "", "GET"), fingerprint
+            )
+
+        with self.assertNumQueries(0, using=using):
+            AudomaSchemaGenerator(patterns=router.urls).get_schema_fingerprint(
+                request=None, public=True
+            )
+
+    def test_schema_view_etag(self):
+        client = APIClient()
+        response = client.get(
+            reverse("schema"), HTTP_ACCEPT="application/vnd.oai.openapi+json"
+        )
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertEqual(json.loads(response.content)["info"]["title"], "audoma API")
+
+        response = client.get(
+            reverse("schema"),
+            HTTP_ACCEPT="application/vnd.oai.openapi+json",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        for if_none_match, status_code in [
+            (f'"other", W/{etag}', 304),
+            ("*", 304),
+            (f'"other{etag[1:]}', 200),
+        ]:
+            response = client.get(
+                reverse("schema"),
+                HTTP_ACCEPT="application/vnd.oai.openapi+json",
+                HTTP_IF_NONE_MATCH=if_none_match,
+            )
+            self.assertEqual(response.status_code, status_code)
+
+    def test_schema_view_cache_per_class(self):
+        class OtherSchemaView(AudomaSpectacularAPIView):
+            max_rendered_schemas = 1
+
+        view = AudomaSpectacularAPIView()
+        other_view = OtherSchemaView()
+        other_view._set_rendered_schema(("a", "json", ""), ("etag-a", b"", "json"))
+        other_view._set_rendered_schema(("b", "json", ""), ("etag-b", b"", "json"))
+
+        self.assertEqual(
+            list(OtherSchemaView._get_rendered_schemas()), [("b", "json", "")]
+        )
+        self.assertIsNone(view._get_rendered_schema(("b", "json", "")))
+        self.assertIsNot(
+            OtherSchemaView._get_rendered_schemas(),
+            AudomaSpectacularAPIView._get_rendered_schemas(),
+        )
+
+
+class AudomaParallelSchemaGenerationTestCase(AudomaApiTestMixin, SimpleTestCase):
+    def setUp(self):
+        AudomaSchemaGenerator._operation_cache = {}
+
+    def test_parallel_schema_same_as_serial(self):
+        serial_schema = AudomaSchemaGenerator(patterns=router.urls).get_schema(
+            request=None, public=True
+        )
+        generator = AudomaSchemaGenerator(patterns=router.urls)
+        generator.workers = 3
+        with mock.patch.object(
+            AudomaSchemaGenerator,
+            "_parse_parallel",
+            autospec=True,
+            side_effect=AudomaSchemaGenerator._parse_parallel,
+        ) as parse_parallel, mock.patch("audoma.generators.warn") as conflict_warn:
+            parallel_schema = generator.get_schema(request=None, public=True)
+        parse_parallel.assert_called_once()
+        conflict_warn.assert_not_called()
+        self.assertEqual(json.dumps(serial_schema), json.dumps(parallel_schema))
+
+    def test_parallel_schema_worker_warnings_emitted(self):
+        AudomaSchemaGenerator(patterns=router.urls).get_schema(
+            request=None, public=True
+        )
+        generator = AudomaSchemaGenerator(patterns=router.urls)
+        generator.workers = 3
+        original_parse_shard = AudomaSchemaGenerator._parse_shard
+
+        def parse_shard(generator, *args):
+            warn("Worker warning")
+            return original_parse_shard(generator, *args)
+
+        GENERATOR_STATS.reset()
+        with mock.patch.object(
+            AudomaSchemaGenerator, "_parse_shard", parse_shard
+        ), GENERATOR_STATS.silence():
+            generator.get_schema(request=None, public=True)
+        warnings = dict(GENERATOR_STATS._warn_cache)
+        GENERATOR_STATS.reset()
+        self.assertEqual(warnings, {"Worker warning": 3})
+
+    def test_parallel_schema_not_generated_in_transaction(self):
+        generator = AudomaSchemaGenerator(patterns=router.urls)
+        generator.workers = 3
+        with mock.patch.object(
+            AudomaSchemaGenerator, "_parse_parallel", autospec=True
+        ) as parse_parallel, transaction.atomic():
+            generator.get_schema(request=None, public=True)
+        parse_parallel.assert_not_called()
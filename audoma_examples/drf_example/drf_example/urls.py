@@ -1,5 +1,4 @@
 from drf_spectacular.views import (
-    SpectacularAPIView,
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
@@ -10,12 +9,14 @@ from django.urls import (
     re_path,
 )
 
+from audoma.views import AudomaSpectacularAPIView
+
 
 urlpatterns = (
     re_path("v1/", include("drf_example.v1_urls")),
     re_path("v2/", include("drf_example.v2_urls")),
     re_path("admin/", admin.site.urls),
-    re_path(r"^schema/$", SpectacularAPIView.as_view(), name="schema"),
+    re_path(r"^schema/$", AudomaSpectacularAPIView.as_view(), name="schema"),
     re_path(
         r"^swagger-ui/$",
         SpectacularSwaggerView.as_view(url_name="schema"),
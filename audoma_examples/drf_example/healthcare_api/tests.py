@@ -1,14 +1,48 @@
 import datetime
 from collections import OrderedDict
+from types import (
+    ModuleType,
+    SimpleNamespace,
+)
+from unittest import mock
 
 from drf_example.v2_urls import router
 from drf_spectacular.generators import SchemaGenerator
-from healthcare_api import models as health_models
+from healthcare_api import (
+    models as health_models,
+    serializers as health_serializers,
+)
+from healthcare_api.views import PatientViewset
 from psycopg2._range import DateRange
-from rest_framework.test import APITransactionTestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import (
+    APIRequestFactory,
+    APITransactionTestCase,
+)
 
 from django.contrib.auth.models import User
-from django.urls import reverse
+from django.core.exceptions import ImproperlyConfigured
+from django.db import (
+    IntegrityError,
+    connections,
+)
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import (
+    NoReverseMatch,
+    include,
+    re_path,
+    reverse,
+)
+
+from audoma import (
+    jobs,
+    settings as audoma_settings,
+)
+from audoma.drf import serializers as audoma_serializers
+from audoma.drf.routers import SimpleRouter
+from audoma.drf.viewsets import AudomaPagination
 
 
 class HealthcareAPITestMixin:
@@ -544,6 +578,420 @@ class PatientViewsetTestCase(BasicTestCase):
             response.data["errors"][0], {"weight": ["A valid number is required."]}
         )
 
+    def test_bulk_update_existing_pks_loaded_once(self):
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        data = health_models.Patient.objects.all()[:2]
+        contact_data = {
+            "phone_number": "+48 12 390 98 34",
+            "mobile": "+48 12 390 98 34",
+            "country": health_models.COUNTRY_CHOICES.PL,
+            "city": "Lasowice",
+        }
+        request_data = [
+            {
+                "pk": pk,
+                "name": "TestPatient",
+                "surname": "Testowy",
+                "contact_data": contact_data,
+                "weight": 80.0,
+                "height": "179.04",
+            }
+            for pk in [data[0].id, data[1].id, -1]
+        ]
+        with mock.patch.object(
+            health_serializers.PatientWriteSerializer,
+            "load_existing_pks",
+            autospec=True,
+            side_effect=health_serializers.PatientWriteSerializer.load_existing_pks,
+        ) as load_existing_pks, mock.patch.object(
+            audoma_serializers.BulkListSerializer,
+            "load_instances_by_id",
+            autospec=True,
+            side_effect=audoma_serializers.BulkListSerializer.load_instances_by_id,
+        ) as load_instances_by_id:
+            response = self.client.put(url, request_data, format="json")
+        # keys are taken from the instances loaded by the bulk update planner
+        self.assertEqual(load_existing_pks.call_count, 0)
+        self.assertEqual(load_instances_by_id.call_count, 1)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["errors"][0], {})
+        self.assertDictEqual(
+            response.data["errors"][2],
+            {"pk": ["Record with given key does not exist."]},
+        )
+
+    def _get_bulk_patch_queries(self, patients):
+        url = reverse("patient-list")
+        request_data = [
+            {"pk": patient.pk, "name": f"Patched{patient.pk}"} for patient in patients
+        ]
+        with CaptureQueriesContext(connections["healthcare_api"]) as queries:
+            response = self.client.patch(url, request_data, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(item["name"] for item in response.data),
+            sorted(item["name"] for item in request_data),
+        )
+        return [query["sql"] for query in queries.captured_queries]
+
+    def _get_patient_selects(self, queries):
+        return [
+            sql
+            for sql in queries
+            if sql.startswith("SELECT") and 'FROM "healthcare_api_patient"' in sql
+        ]
+
+    def test_partial_bulk_update_loads_instances_once(self):
+        self.client.force_authenticate(user=self.user)
+        patients = list(health_models.Patient.objects.all())
+        for rows in (patients[:1], patients):
+            queries = self._get_bulk_patch_queries(rows)
+            self.assertEqual(len(self._get_patient_selects(queries)), 1)
+
+    def test_partial_bulk_update_select_for_update(self):
+        self.client.force_authenticate(user=self.user)
+        patients = list(health_models.Patient.objects.all())
+        with mock.patch.object(PatientViewset, "bulk_update_select_for_update", True):
+            queries = self._get_bulk_patch_queries(patients)
+
+        patient_selects = self._get_patient_selects(queries)
+        self.assertEqual(len(patient_selects), 1)
+        self.assertIn("FOR UPDATE", patient_selects[0])
+        self.assertIn('ORDER BY "healthcare_api_patient"."id" ASC', patient_selects[0])
+
+    def _get_patient_data(self, name, **kwargs):
+        data = {
+            "name": name,
+            "surname": "Testowy",
+            "contact_data": {
+                "phone_number": "+48 12 390 98 34",
+                "mobile": "+48 12 390 98 34",
+                "country": health_models.COUNTRY_CHOICES.PL,
+                "city": "Lasowice",
+            },
+            "weight": 80.0,
+            "height": "179.04",
+        }
+        data.update(kwargs)
+        return data
+
+    def test_chunked_bulk_create_partial_failure(self):
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        request_data = [
+            self._get_patient_data("Chunk1"),
+            self._get_patient_data("Chunk2", weight="invalid"),
+            self._get_patient_data("Chunk3"),
+            self._get_patient_data("Chunk4"),
+            self._get_patient_data("Chunk5"),
+        ]
+        original_perform_bulk_create = PatientViewset.perform_bulk_create
+        calls = []
+
+        def perform_bulk_create(view, serializer):
+            calls.append(len(serializer.initial_data))
+            if len(calls) == 3:
+                raise IntegrityError("chunk write failed")
+            original_perform_bulk_create(view, serializer)
+
+        with mock.patch.object(PatientViewset, "bulk_chunk_size", 2), mock.patch.object(
+            PatientViewset, "perform_bulk_create", perform_bulk_create
+        ):
+            response = self.client.post(url, request_data, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(calls, [1, 2, 1])
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["success", "error", "success", "success", "error"],
+        )
+        self.assertEqual(results[0]["result"]["name"], "Chunk1")
+        self.assertEqual(
+            results[1]["errors"], {"weight": ["A valid number is required."]}
+        )
+        # database error details are not disclosed
+        self.assertEqual(
+            results[4]["errors"], {"non_field_errors": ["Item has not been saved."]}
+        )
+        self.assertEqual(
+            sorted(
+                health_models.Patient.objects.filter(
+                    name__startswith="Chunk"
+                ).values_list("name", flat=True)
+            ),
+            ["Chunk1", "Chunk3", "Chunk4"],
+        )
+
+    def test_chunked_bulk_update_partial_failure(self):
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        patients = list(health_models.Patient.objects.order_by("-id")[:3])
+        request_data = [
+            {"pk": patients[0].pk, "name": "Patched0"},
+            {"pk": -1, "name": "Missing"},
+            {"pk": patients[1].pk, "name": "Patched1"},
+            {"pk": patients[2].pk, "name": "Patched2"},
+        ]
+        with mock.patch.object(PatientViewset, "bulk_chunk_size", 3), mock.patch.object(
+            audoma_serializers.BulkListSerializer,
+            "load_instances_by_id",
+            autospec=True,
+            side_effect=audoma_serializers.BulkListSerializer.load_instances_by_id,
+        ) as load_instances_by_id:
+            response = self.client.patch(url, request_data, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        # the first chunk is planned again for its valid items
+        self.assertEqual(load_instances_by_id.call_count, 3)
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["success", "error", "success", "success"],
+        )
+        self.assertEqual(
+            [results[i]["result"]["name"] for i in (0, 2, 3)],
+            ["Patched0", "Patched1", "Patched2"],
+        )
+        self.assertEqual(
+            results[1]["errors"], {"pk": ["Record with given key does not exist."]}
+        )
+        for patient, name in zip(patients, ["Patched0", "Patched1", "Patched2"]):
+            patient.refresh_from_db()
+            self.assertEqual(patient.name, name)
+
+    def test_chunked_bulk_update_cleaned_ids(self):
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        patients = list(health_models.Patient.objects.order_by("-id")[:2])
+        request_data = [
+            {"pk": str(patients[0].pk), "name": "Text"},
+            {"pk": patients[1].pk, "name": "First"},
+            {"pk": patients[1].pk, "name": "Duplicate"},
+        ]
+        with mock.patch.object(PatientViewset, "bulk_chunk_size", 3):
+            response = self.client.patch(url, request_data, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results], ["success", "success", "error"]
+        )
+        self.assertEqual(
+            [results[i]["result"]["name"] for i in (0, 1)], ["Text", "First"]
+        )
+        self.assertEqual(
+            results[2]["errors"], {"pk": ["Record with given key is duplicated."]}
+        )
+        for patient, name in zip(patients, ["Text", "First"]):
+            patient.refresh_from_db()
+            self.assertEqual(patient.name, name)
+
+    def test_chunked_bulk_update_revalidation_errors(self):
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        patients = list(health_models.Patient.objects.order_by("-id")[:3])
+        request_data = [
+            {"pk": -1, "name": "Missing"},
+            {"pk": patients[0].pk, "name": "Kept"},
+            {"pk": patients[1].pk, "name": "Flaky"},
+        ]
+        original_validate = health_serializers.PatientWriteSerializer.validate
+        calls = []
+
+        def validate(serializer, data):
+            # item becomes invalid once the chunk is validated again
+            if data.get("name") == "Flaky":
+                calls.append(data)
+                if len(calls) > 1:
+                    raise ValidationError({"name": ["Changed in the meantime."]})
+            return original_validate(serializer, data)
+
+        with mock.patch.object(PatientViewset, "bulk_chunk_size", 3), mock.patch.object(
+            health_serializers.PatientWriteSerializer, "validate", validate
+        ):
+            response = self.client.patch(url, request_data, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        results = response.data["results"]
+        self.assertEqual(
+            results[0]["errors"], {"pk": ["Record with given key does not exist."]}
+        )
+        self.assertEqual(
+            results[1]["errors"], {"non_field_errors": ["Item has not been saved."]}
+        )
+        self.assertEqual(results[2]["errors"], {"name": ["Changed in the meantime."]})
+        patients[0].refresh_from_db()
+        self.assertNotEqual(patients[0].name, "Kept")
+
+    def test_chunked_bulk_create_status(self):
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        with mock.patch.object(PatientViewset, "bulk_chunk_size", 2):
+            response = self.client.post(
+                url,
+                [self._get_patient_data("Saved1"), self._get_patient_data("Saved2")],
+                format="json",
+            )
+            self.assertEqual(response.status_code, 201)
+
+            response = self.client.post(
+                url,
+                [
+                    self._get_patient_data("Invalid1", weight="invalid"),
+                    self._get_patient_data("Invalid2", weight="invalid"),
+                    self._get_patient_data("Invalid3", weight="invalid"),
+                ],
+                format="json",
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            ["error", "error", "error"],
+        )
+
+    def _enable_bulk_jobs(self):
+        # bulk job status route is registered only with the threshold set
+        for patcher in [
+            mock.patch.object(PatientViewset, "bulk_job_threshold", 1),
+            mock.patch.object(audoma_settings, "BULK_JOB_ALLOW_LOCAL_CACHE", True),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        bulk_job_router = SimpleRouter()
+        bulk_job_router.register(r"patient", PatientViewset, basename="patient")
+        urlconf = ModuleType("bulk_job_urls")
+        urlconf.urlpatterns = [re_path("v2/", include(bulk_job_router.urls))]
+        urlconf_override = override_settings(ROOT_URLCONF=urlconf)
+        urlconf_override.enable()
+        self.addCleanup(urlconf_override.disable)
+
+    def _run_bulk_job_request(self, method, request_data):
+        self._enable_bulk_jobs()
+        url = reverse("patient-list")
+        futures = []
+        original_submit = jobs.ThreadPoolBulkJobBackend.submit
+
+        def submit(backend, job_id):
+            future = original_submit(backend, job_id)
+            futures.append(future)
+            return future
+
+        with mock.patch.object(jobs.ThreadPoolBulkJobBackend, "submit", submit):
+            response = getattr(self.client, method)(url, request_data, format="json")
+            for future in futures:
+                future.result(timeout=30)
+        self.assertEqual(len(futures), 1)
+        return response
+
+    def test_bulk_job_create(self):
+        self.client.force_authenticate(user=self.user)
+        request_data = [
+            self._get_patient_data("Job1"),
+            self._get_patient_data("Job2"),
+        ]
+        response = self._run_bulk_job_request("post", request_data)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(response["Location"], response.data["url"])
+        self.assertEqual(
+            response.data["url"],
+            "http://testserver"
+            + reverse("patient-bulk-job", kwargs={"job_id": response.data["id"]}),
+        )
+
+        status_response = self.client.get(response["Location"])
+        self.assertEqual(status_response.status_code, 200)
+        self.assertEqual(status_response.data["status"], "finished")
+        self.assertEqual(status_response.data["status_code"], 201)
+        self.assertEqual(
+            [patient["name"] for patient in status_response.data["result"]],
+            ["Job1", "Job2"],
+        )
+        self.assertEqual(
+            health_models.Patient.objects.filter(name__startswith="Job").count(), 2
+        )
+
+    def test_bulk_job_partial_update_failed(self):
+        self.client.force_authenticate(user=self.user)
+        patients = list(health_models.Patient.objects.all()[:2])
+        request_data = [
+            {"pk": patients[0].pk, "name": "Patched"},
+            {"pk": patients[1].pk, "weight": "invalid"},
+        ]
+        response = self._run_bulk_job_request("patch", request_data)
+        self.assertEqual(response.status_code, 202)
+
+        status_response = self.client.get(response["Location"])
+        self.assertEqual(status_response.data["status"], "failed")
+        self.assertEqual(status_response.data["status_code"], 400)
+        self.assertEqual(
+            status_response.data["result"]["errors"][1],
+            {"weight": ["A valid number is required."]},
+        )
+        patients[0].refresh_from_db()
+        self.assertNotEqual(patients[0].name, "Patched")
+
+    def test_bulk_job_status_other_user(self):
+        self.client.force_authenticate(user=self.user)
+        response = self._run_bulk_job_request(
+            "post", [self._get_patient_data("Job1"), self._get_patient_data("Job2")]
+        )
+        other_admin = User.objects.create(
+            username="other", password="passwd", is_staff=True
+        )
+        self.client.force_authenticate(user=other_admin)
+        self.assertEqual(self.client.get(response["Location"]).status_code, 404)
+        url = reverse("patient-bulk-job", kwargs={"job_id": "0123abcd"})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_bulk_job_not_stored(self):
+        self._enable_bulk_jobs()
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        request_data = [
+            self._get_patient_data("Lost1"),
+            self._get_patient_data("Lost2"),
+        ]
+        with mock.patch.object(
+            jobs.BulkJobStore, "save", lambda store, job: None
+        ), mock.patch.object(jobs.ThreadPoolBulkJobBackend, "submit") as submit:
+            response = self.client.post(url, request_data, format="json")
+
+        self.assertEqual(response.status_code, 503)
+        submit.assert_not_called()
+        self.assertFalse(
+            health_models.Patient.objects.filter(name__startswith="Lost").exists()
+        )
+
+    def test_bulk_job_local_cache_rejected(self):
+        with mock.patch.object(
+            audoma_settings, "BULK_JOB_ALLOW_LOCAL_CACHE", False
+        ), mock.patch.object(PatientViewset, "bulk_job_threshold", 1):
+            with self.assertRaises(ImproperlyConfigured):
+                jobs.get_bulk_job_store()
+
+            router = SimpleRouter()
+            router.register("patient", PatientViewset, basename="patient")
+            with self.assertRaises(ImproperlyConfigured):
+                router.urls
+
+    def test_bulk_job_route_not_registered_without_threshold(self):
+        with self.assertRaises(NoReverseMatch):
+            reverse("patient-bulk-job", kwargs={"job_id": "0123abcd"})
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/v2/patient/bulk-jobs/0123abcd/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_bulk_update_invalid_key(self):
+        url = reverse("patient-list")
+        self.client.force_authenticate(user=self.user)
+        response = self.client.patch(
+            url, [{"pk": "invalid", "name": "Patched"}], format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
     def test_bulk_update_fail_no_auth(self):
         url = reverse("patient-list")
         data = health_models.Patient.objects.all()[:2]
@@ -817,6 +1265,67 @@ class PatientViewsetSchemaTestCase(SchemaTestCaseBase):
             },
         )
 
+    def test_chunked_bulk_update_response_schema(self):
+        with mock.patch.object(PatientViewset, "bulk_chunk_size", 100):
+            schema = SchemaGenerator(patterns=router.urls).get_schema(
+                request=None, public=True
+            )
+        response_schema = schema["paths"]["/patient/"]["put"]["responses"]["200"][
+            "content"
+        ]["application/json"]["schema"]
+        self.assertEqual(response_schema["required"], ["results"])
+        item_schema = response_schema["properties"]["results"]["items"]
+        self.assertEqual(
+            item_schema["properties"]["status"]["enum"], ["success", "error"]
+        )
+        self.assertEqual(
+            item_schema["properties"]["result"],
+            {"$ref": "#/components/schemas/PatientRead"},
+        )
+        self.assertEqual(
+            schema["paths"]["/patient/"]["put"]["responses"]["207"]["content"],
+            schema["paths"]["/patient/"]["put"]["responses"]["200"]["content"],
+        )
+        self.assertNotIn("207", self.schema["paths"]["/patient/"]["put"]["responses"])
+        self.assertEqual(
+            self.schema["paths"]["/patient/"]["put"]["responses"]["200"]["content"][
+                "application/json"
+            ]["schema"]["type"],
+            "array",
+        )
+
+    def test_bulk_job_schema(self):
+        self.assertNotIn("/patient/bulk-jobs/{job_id}/", self.schema["paths"])
+        self.assertNotIn("202", self.schema["paths"]["/patient/"]["put"]["responses"])
+        with mock.patch.object(
+            PatientViewset, "bulk_job_threshold", 100
+        ), mock.patch.object(audoma_settings, "BULK_JOB_ALLOW_LOCAL_CACHE", True):
+            bulk_job_router = SimpleRouter()
+            bulk_job_router.register(r"patient", PatientViewset, basename="patient")
+            schema = SchemaGenerator(patterns=bulk_job_router.urls).get_schema(
+                request=None, public=True
+            )
+        self.assertDictEqual(
+            schema["paths"]["/patient/bulk-jobs/{job_id}/"]["get"]["responses"],
+            {
+                "200": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/BulkJob"}
+                        }
+                    },
+                    "description": "",
+                }
+            },
+        )
+        for method in ["post", "put", "patch"]:
+            response = schema["paths"]["/patient/"][method]["responses"]["202"]
+            self.assertEqual(
+                response["content"]["application/json"]["schema"],
+                {"$ref": "#/components/schemas/BulkJob"},
+            )
+            self.assertIn("Location", response["headers"])
+
     def test_get_list_response_schema(self):
         props = self.redoc_schemas["PatientRead"]["properties"]
         self.assertEqual(props["height"]["pattern"], "^\\d{0,4}(?:\\.\\d{0,2})?$")
@@ -1377,3 +1886,150 @@ class PrescriptionViewsetTestCase(BasicTestCase):
                 "is_valid": False,
             },
         )
+
+
+class SpecializationBulkSerializer(
+    audoma_serializers.BulkSerializerMixin, audoma_serializers.ModelSerializer
+):
+    class Meta:
+        model = health_models.Specialization
+        fields = ["id", "name"]
+        list_serializer_class = audoma_serializers.BulkListSerializer
+        use_bulk_write = True
+        bulk_batch_size = 2
+
+
+class ContactDataBulkSerializer(
+    audoma_serializers.BulkSerializerMixin, audoma_serializers.ModelSerializer
+):
+    class Meta:
+        model = health_models.ContactData
+        fields = ["id", "city", "country"]
+        list_serializer_class = audoma_serializers.BulkListSerializer
+        use_bulk_write = True
+
+
+class BulkWriteTestCase(BasicTestCase):
+    def _get_context(self, method):
+        return {"view": SimpleNamespace(request=SimpleNamespace(method=method))}
+
+    def test_bulk_create_batched(self):
+        serializer = SpecializationBulkSerializer(
+            data=[{"name": "Surgeon"}, {"name": "Dentist"}, {"name": "Nurse"}],
+            many=True,
+            context=self._get_context("POST"),
+        )
+        self.assertTrue(serializer.is_valid())
+        with self.assertNumQueries(2, using="healthcare_api"):
+            serializer.save()
+        self.assertEqual(
+            list(
+                health_models.Specialization.objects.order_by("name").values_list(
+                    "name", flat=True
+                )
+            ),
+            ["Dentist", "Nurse", "Surgeon"],
+        )
+
+    def test_bulk_update_batched(self):
+        specializations = [
+            health_models.Specialization.objects.create(name=name)
+            for name in ["Surgeon", "Dentist", "Nurse"]
+        ]
+        serializer = SpecializationBulkSerializer(
+            health_models.Specialization.objects.all(),
+            data=[{"id": s.id, "name": s.name.upper()} for s in specializations],
+            many=True,
+            context=self._get_context("PUT"),
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        # objects to update query and two update batches
+        with self.assertNumQueries(3, using="healthcare_api"):
+            serializer.save()
+        self.assertEqual(
+            list(
+                health_models.Specialization.objects.order_by("name").values_list(
+                    "name", flat=True
+                )
+            ),
+            ["DENTIST", "NURSE", "SURGEON"],
+        )
+
+    def test_partial_bulk_update_writes_only_passed_fields(self):
+        contacts = [
+            health_models.ContactData.objects.create(
+                phone_number="+48555555555",
+                mobile="+48555555555",
+                country=1,
+                city=city,
+            )
+            for city in ["Warsaw", "Berlin"]
+        ]
+        serializer = ContactDataBulkSerializer(
+            health_models.ContactData.objects.all(),
+            data=[
+                {"id": contacts[0].id, "city": "Cracow"},
+                {"id": contacts[1].id, "country": 2},
+            ],
+            many=True,
+            partial=True,
+            context=self._get_context("PATCH"),
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        # changed concurrently, it must not be overwritten by the stale instance
+        health_models.ContactData.objects.filter(id=contacts[0].id).update(country=2)
+        with CaptureQueriesContext(connections["healthcare_api"]) as queries:
+            serializer.save()
+
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 2)
+        contacts[0].refresh_from_db()
+        contacts[1].refresh_from_db()
+        self.assertEqual((contacts[0].city, contacts[0].country), ("Cracow", "2"))
+        self.assertEqual((contacts[1].city, contacts[1].country), ("Berlin", "2"))
+
+    def test_bulk_write_falls_back_for_non_concrete_attrs(self):
+        serializer = SpecializationBulkSerializer(
+            many=True, context=self._get_context("PUT")
+        )
+        self.assertTrue(serializer._can_bulk_write("update", [{"name": "Surgeon"}]))
+        self.assertFalse(
+            serializer._can_bulk_write("update", [{"name": "Surgeon", "doctor": []}])
+        )
+
+    def test_bulk_update_overwritten_child_update(self):
+        class OverwrittenUpdateSerializer(SpecializationBulkSerializer):
+            def update(self, instance, validated_data):
+                validated_data["name"] += "!"
+                return super().update(instance, validated_data)
+
+        specialization = health_models.Specialization.objects.create(name="Surgeon")
+        serializer = OverwrittenUpdateSerializer(
+            health_models.Specialization.objects.all(),
+            data=[{"id": specialization.id, "name": "Dentist"}],
+            many=True,
+            context=self._get_context("PUT"),
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        specialization.refresh_from_db()
+        self.assertEqual(specialization.name, "Dentist!")
+
+
+class EstimatedCountPaginationTestCase(BasicTestCase):
+    def test_estimated_count_from_planner(self):
+        health_models.Specialization.objects.bulk_create(
+            [health_models.Specialization(name=f"Spec {i}") for i in range(3)]
+        )
+        paginator = AudomaPagination()
+        paginator.count_strategy = "estimated"
+        paginator.count_estimate_threshold = 0
+        request = Request(APIRequestFactory().get("/specializations/"))
+        queryset = health_models.Specialization.objects.order_by("id")
+        with mock.patch.object(
+            paginator, "get_exact_count", side_effect=AssertionError
+        ):
+            page = paginator.paginate_queryset(queryset, request)
+            response = paginator.get_paginated_response([s.id for s in page])
+        self.assertEqual(response.data["count_type"], "estimated")
+        self.assertIsInstance(response.data["count"], int)
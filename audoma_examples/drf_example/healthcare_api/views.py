@@ -35,14 +35,6 @@ class PatientViewset(
     queryset = models.Patient.objects.all()
     lookup_url_kwarg = "pk"
 
-    def filter_queryset(self, queryset):
-        if self.request.method in ["PUT", "PATCH"] and isinstance(
-            self.request.data, list
-        ):
-            ids = [d[self.lookup_url_kwarg] for d in self.request.data]
-            queryset = queryset.filter(id__in=ids)
-        return queryset
-
     @action(methods=["GET"], detail=True)
     def get_files(self, request, pk):
         files = get_object_or_404(models.PatientFiles, patient__id=pk)